@@ -10,6 +10,7 @@ This script:
 """
 
 import argparse
+import csv
 from pathlib import Path
 
 from syndrumnet.data.modules import ModuleBuilder
@@ -58,7 +59,7 @@ def main():
     
     # Step 3: Build network
     logger.info("\n[3/5] Building integrated network...")
-    builder = NetworkBuilder(mapper)
+    builder = NetworkBuilder(mapper, cache_dir=interim_dir)
     
     # Add sources
     for source in config.data.network_sources:
@@ -67,8 +68,14 @@ def main():
     
     # Build and save
     G = builder.build()
-    network_file = processed_dir / 'network.graphml'
-    builder.save(network_file)
+
+    # Parquet is what the pipeline reloads; GraphML is for external tools.
+    try:
+        builder.save(processed_dir / 'network.parquet')
+    except ImportError as e:
+        logger.warning(f"Skipping network.parquet ({e}); loads will use GraphML")
+
+    builder.save(processed_dir / 'network.graphml')
     
     # Log stats
     stats = builder.get_network_stats()
@@ -102,17 +109,15 @@ def main():
             top_pct=config.scoring.top_pct_genes,
         )
         
-        # Save as CSV (flatten nested dict structure)
-        import pandas as pd
-        rows = []
-        for drug, sigs in drug_modules.items():
-            for gene in sigs['up']:
-                rows.append({'drug': drug, 'gene': gene, 'direction': 'up'})
-            for gene in sigs['down']:
-                rows.append({'drug': drug, 'gene': gene, 'direction': 'down'})
-        
-        df = pd.DataFrame(rows)
-        df.to_csv(processed_dir / 'drug_modules.csv', index=False)
+        # Save as CSV, flattening the nested dict row by row straight to disk
+        # rather than through an intermediate list of per-row dicts.
+        with open(processed_dir / 'drug_modules.csv', 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['drug', 'gene', 'direction'])
+            for drug, sigs in drug_modules.items():
+                writer.writerows((drug, gene, 'up') for gene in sigs['up'])
+                writer.writerows((drug, gene, 'down') for gene in sigs['down'])
+
         logger.info(f"Saved {len(drug_modules)} drug modules")
     else:
         logger.warning("LINCS data not found, skipping drug modules")
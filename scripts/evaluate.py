@@ -5,20 +5,96 @@ Computes AUC-ROC, AUC-PR, and other metrics.
 """
 
 import argparse
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import pandas as pd
+import numpy as np
 
-from syndrumnet.eval.benchmarks import load_known_synergies
-from syndrumnet.eval.metrics import (
-    compute_precision_recall_curve,
-    compute_roc_curve,
-    evaluate_predictions,
-)
-from syndrumnet.eval.reporting import generate_evaluation_report
 from syndrumnet.utils.config import load_config
 from syndrumnet.utils.logging import setup_logger
-from syndrumnet.viz.plots import plot_auc_comparison, plot_pr_curve, plot_roc_curve
+from syndrumnet.utils.parallel import fork_context
+
+# pandas, scikit-learn and matplotlib are imported where they are used rather
+# than here. They dominate start-up, which `--help` and a missing synergy file
+# should not pay for, and pyplot must only load after the Agg backend is
+# selected so no GUI backend is ever probed.
+
+#: Rows of a predictions table read at a time.
+PREDICTION_CHUNK_ROWS = 200_000
+
+
+def evaluate_disease(
+    disease: str,
+    pred_file: Path,
+    known_synergies: set,
+    encoded: tuple,
+    figures_dir: Path,
+    dpi: int,
+    fmt: str,
+) -> dict:
+    """
+    Evaluate one disease's predictions and render its curves.
+
+    Module-level so it can be shipped to a worker process. `encoded` is
+    `encode_synergies(known_synergies)`. Returns the metrics dict from
+    `compute_metrics`.
+    """
+    # Workers must never try to open a display.
+    import matplotlib
+    matplotlib.use('Agg')
+
+    from syndrumnet.eval.metrics import (
+        compute_metrics,
+        compute_precision_recall_curve,
+        compute_roc_curve,
+        label_predictions,
+    )
+    from syndrumnet.eval.reporting import iter_predictions
+    from syndrumnet.viz.plots import plot_pr_curve, plot_roc_curve
+
+    logger = logging.getLogger('evaluation')
+    logger.info(f"\nEvaluating {disease}...")
+
+    # Read in chunks so a table of every pair over a large drug library never
+    # has to fit in memory; only the labels and scores are kept.
+    y_true_parts = []
+    y_score_parts = []
+
+    for chunk in iter_predictions(
+        pred_file,
+        ['drug_a', 'drug_b', 'prediction_score'],
+        PREDICTION_CHUNK_ROWS,
+    ):
+        y_true_parts.append(label_predictions(chunk, known_synergies, encoded))
+        y_score_parts.append(chunk['prediction_score'].to_numpy(dtype=float))
+
+    y_true = np.concatenate(y_true_parts) if y_true_parts else np.zeros(0, np.int8)
+    y_score = np.concatenate(y_score_parts) if y_score_parts else np.zeros(0)
+
+    # Evaluate
+    metrics = compute_metrics(y_true, y_score, len(known_synergies))
+
+    # Plot ROC curve
+    if len(np.unique(y_true)) > 1:
+        fpr, tpr, _ = compute_roc_curve(y_true, y_score)
+        plot_roc_curve(
+            fpr, tpr, metrics['auc_roc'],
+            figures_dir / f"roc_{disease.lower().replace(' ', '_')}.{fmt}",
+            title=f"ROC Curve - {disease}",
+            dpi=dpi,
+        )
+
+        precision, recall, _ = compute_precision_recall_curve(y_true, y_score)
+        plot_pr_curve(
+            precision, recall, metrics['auc_pr'],
+            figures_dir / f"pr_{disease.lower().replace(' ', '_')}.{fmt}",
+            title=f"Precision-Recall - {disease}",
+            dpi=dpi,
+        )
+
+    return metrics
 
 
 def main():
@@ -48,7 +124,22 @@ def main():
         logger.info("Please provide known synergies file via --synergy-file")
         return
     
+    import matplotlib
+    matplotlib.use('Agg')
+
+    from syndrumnet.eval.benchmarks import load_known_synergies
+    from syndrumnet.eval.metrics import encode_synergies
+    from syndrumnet.eval.reporting import (
+        find_prediction_files,
+        generate_evaluation_report,
+        prediction_file_name,
+    )
+    from syndrumnet.viz.plots import plot_auc_comparison
+
     known_synergies = load_known_synergies(synergy_file)
+
+    # Integer-coded once here rather than per disease or per chunk
+    encoded = encode_synergies(known_synergies)
     
     # Evaluate each disease
     results = {}
@@ -62,51 +153,33 @@ def main():
 
 
     predictions_dir = Path('reports/tables')
-    
+
+    tasks = find_prediction_files(predictions_dir, config.diseases)
+
     for disease in config.diseases:
-        pred_file = predictions_dir / f"predictions_{disease.lower().replace(' ', '_')}.csv"
-        
-        if not pred_file.exists():
+        if disease not in tasks:
+            pred_file = predictions_dir / prediction_file_name(disease)
             logger.warning(f"Predictions not found for {disease}: {pred_file}")
-            continue
-        
-        logger.info(f"\nEvaluating {disease}...")
-        
-        # Load predictions
-        predictions = pd.read_csv(pred_file)
-        
-        # Evaluate
-        metrics = evaluate_predictions(predictions, known_synergies)
-        results[disease] = metrics
-        
-        # Plot ROC curve
-        y_true = []
-        y_score = []
-        for _, row in predictions.iterrows():
-            pair = tuple(sorted([row['drug_a'], row['drug_b']]))
-            y_true.append(1 if pair in known_synergies else 0)
-            y_score.append(row['prediction_score'])
-        
-        import numpy as np
-        y_true = np.array(y_true)
-        y_score = np.array(y_score)
-        
-        if len(np.unique(y_true)) > 1:
-            fpr, tpr, _ = compute_roc_curve(y_true, y_score)
-            plot_roc_curve(
-                fpr, tpr, metrics['auc_roc'],
-                figures_dir / f"roc_{disease.lower().replace(' ', '_')}.{fmt}",
-                title=f"ROC Curve - {disease}",
-                dpi=dpi,
-            )
-
-            precision, recall, _ = compute_precision_recall_curve(y_true, y_score)
-            plot_pr_curve(
-                precision, recall, metrics['auc_pr'],
-                figures_dir / f"pr_{disease.lower().replace(' ', '_')}.{fmt}",
-                title=f"Precision-Recall - {disease}",
-                dpi=dpi,
-            )
+
+    # Diseases are independent and each is CPU-bound (metrics and rendering),
+    # so they are evaluated in parallel, one process per disease.
+    if tasks:
+        n_workers = min(len(tasks), config.get('n_cores') or os.cpu_count() or 1)
+
+        # Fork, so workers inherit the logger set up above; see fork_context
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=fork_context()
+        ) as pool:
+            futures = {
+                disease: pool.submit(
+                    evaluate_disease,
+                    disease, pred_file, known_synergies, encoded, figures_dir, dpi, fmt,
+                )
+                for disease, pred_file in tasks.items()
+            }
+
+            for disease, future in futures.items():
+                results[disease] = future.result()
     
     # Generate summary report
     if results:
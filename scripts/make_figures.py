@@ -3,23 +3,78 @@ Generate all visualization figures.
 """
 
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import pandas as pd
-
 from syndrumnet.data.network_builder import NetworkBuilder
+from syndrumnet.eval.reporting import find_prediction_files, read_predictions
 from syndrumnet.utils.config import load_config
 from syndrumnet.utils.logging import setup_logger
+from syndrumnet.utils.parallel import fork_context
 from syndrumnet.viz.plots import (
+    figure_is_current,
     plot_degree_distribution,
     plot_score_distributions,
     plot_top_predictions,
 )
 
+#: Prediction columns the per-disease figures read.
+FIGURE_COLUMNS = ('drug_a', 'drug_b', 'prediction_score', 'tqab', 'pqab', 'cqab')
+
+
+def plot_disease(
+    disease: str,
+    pred_file: Path,
+    figures_dir: Path,
+    dpi: int,
+    fmt: str,
+    top_k: int,
+    force: bool = False,
+) -> None:
+    """
+    Render one disease's score figures.
+
+    Module-level so it can be shipped to a worker process. Figures newer than
+    `pred_file` are kept unless `force` is set, and when both are, the
+    predictions are not read at all.
+    """
+    stem = disease.lower().replace(' ', '_')
+    dist_path = figures_dir / f"score_dist_{stem}.{fmt}"
+    top_path = figures_dir / f"top_pairs_{stem}.{fmt}"
+
+    source_path = None if force else pred_file
+    if figure_is_current(dist_path, source_path) and figure_is_current(top_path, source_path):
+        return
+
+    # Workers must never try to open a display.
+    import matplotlib
+    matplotlib.use('Agg')
+
+    # Only the columns the figures draw; absent score columns are tolerated
+    # because plot_score_distributions leaves their panel blank.
+    predictions = read_predictions(pred_file, FIGURE_COLUMNS)
+
+    # Score distributions
+    plot_score_distributions(predictions, dist_path, dpi=dpi, source_path=source_path)
+
+    # Top predictions
+    plot_top_predictions(
+        predictions,
+        k=top_k,
+        output_path=top_path,
+        dpi=dpi,
+        source_path=source_path,
+    )
+
 
 def main():
     parser = argparse.ArgumentParser(description="Generate SyndrumNET figures")
     parser.add_argument('--config', type=str, required=True, help="Config file path")
+    parser.add_argument(
+        '--force', action='store_true',
+        help="Redraw every figure, even those newer than their inputs",
+    )
     args = parser.parse_args()
     
     # Load config
@@ -44,38 +99,44 @@ def main():
     # Network figures
     logger.info("\n[1/3] Generating network figures...")
 
-    network_file = Path('data/processed/network.graphml')
-    if network_file.exists():
+    network_file = Path('data/processed/network.parquet')
+    if not network_file.exists():
+        network_file = Path('data/processed/network.graphml')
+
+    degree_path = figures_dir / f'degree_distribution.{fmt}'
+    if network_file.exists() and not args.force and figure_is_current(degree_path, network_file):
+        # Checked before the load, which is the expensive part
+        logger.info(f"Degree distribution at {degree_path} is up to date")
+    elif network_file.exists():
         G = NetworkBuilder.load(network_file)
-        plot_degree_distribution(G, figures_dir / f'degree_distribution.{fmt}', dpi=dpi)
+        plot_degree_distribution(G, degree_path, dpi=dpi)
 
 
     # Score distribution figures
     logger.info("\n[2/3] Generating score distribution figures...")
     
     predictions_dir = Path('reports/tables')
-    for disease in config.diseases:
-        pred_file = predictions_dir / f"predictions_{disease.lower().replace(' ', '_')}.csv"
-        
-        if pred_file.exists():
-            predictions = pd.read_csv(pred_file)
-            
-            # Score distributions
-            plot_score_distributions(
-                predictions,
-                figures_dir / f"score_dist_{disease.lower().replace(' ', '_')}.{fmt}",
-                dpi=dpi,
-            )
-
-            # Top predictions
-            plot_top_predictions(
-                predictions,
-                k=top_k,
-                output_path=(
-                    figures_dir / f"top_pairs_{disease.lower().replace(' ', '_')}.{fmt}"
-                ),
-                dpi=dpi,
-            )
+
+    tasks = find_prediction_files(predictions_dir, config.diseases)
+
+    # Each disease renders independently, so they run one process apiece.
+    if tasks:
+        n_workers = min(len(tasks), config.get('n_cores') or os.cpu_count() or 1)
+
+        # Fork, so workers inherit the logger set up above; see fork_context
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=fork_context()
+        ) as pool:
+            futures = [
+                pool.submit(
+                    plot_disease, disease, pred_file, figures_dir, dpi, fmt, top_k,
+                    args.force,
+                )
+                for disease, pred_file in tasks.items()
+            ]
+
+            for future in futures:
+                future.result()
     
     logger.info("\n[3/3] Figure generation complete!")
     logger.info(f"Figures saved to: {figures_dir}")
@@ -5,45 +5,85 @@ Computes synergy scores for all drug pairs across specified diseases.
 """
 
 import argparse
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pandas as pd
 
 from syndrumnet.data.network_builder import NetworkBuilder
+from syndrumnet.eval.reporting import prediction_file_name
 from syndrumnet.scoring.predictor import SynergyPredictor
 from syndrumnet.utils.config import load_config
 from syndrumnet.utils.logging import setup_logger
+from syndrumnet.utils.parallel import fork_context
 from syndrumnet.utils.seeds import set_random_seed
 
 
 def load_modules(filepath: Path) -> dict:
     """Load modules from CSV."""
-    df = pd.read_csv(filepath)
-    
-    modules = {}
-    for name in df['module'].unique() if 'module' in df.columns else df['drug'].unique():
-        col = 'module' if 'module' in df.columns else 'drug'
-        genes = set(df[df[col] == name]['gene'])
-        modules[name] = genes
-    
-    return modules
+    header = pd.read_csv(filepath, nrows=0).columns
+    col = 'module' if 'module' in header else 'drug'
+
+    # Module names and genes repeat on every row, so they are read as
+    # categoricals: one copy of each string, with integer codes per row.
+    df = pd.read_csv(
+        filepath, usecols=[col, 'gene'], dtype={col: 'category', 'gene': 'category'}
+    )
+
+    # One hash-based grouping pass rather than a boolean mask per module.
+    return {
+        name: set(genes)
+        for name, genes in df.groupby(col, sort=False, observed=True)['gene']
+    }
 
 
 def load_drug_modules(filepath: Path) -> dict:
     """Load drug modules with up/down directions."""
-    df = pd.read_csv(filepath)
-    
+    df = pd.read_csv(
+        filepath,
+        usecols=['drug', 'gene', 'direction'],
+        dtype={'drug': 'category', 'gene': 'category', 'direction': 'category'},
+    )
+
     modules = {}
-    for drug in df['drug'].unique():
-        drug_df = df[df['drug'] == drug]
-        modules[drug] = {
-            'up': set(drug_df[drug_df['direction'] == 'up']['gene']),
-            'down': set(drug_df[drug_df['direction'] == 'down']['gene']),
-        }
-    
+    grouped = df.groupby(['drug', 'direction'], sort=False, observed=True)['gene']
+    for (drug, direction), genes in grouped:
+        module = modules.setdefault(drug, {'up': set(), 'down': set()})
+        if direction in module:
+            module[direction] = set(genes)
+
     return modules
 
 
+#: The predictor a worker process scores with, set once by `_init_worker`.
+_PREDICTOR = None
+
+
+def _init_worker(predictor: SynergyPredictor) -> None:
+    """Hand the shared predictor to a worker process."""
+    global _PREDICTOR
+    _PREDICTOR = predictor
+
+
+def predict_disease(disease: str, max_pairs, output_dir: Path) -> tuple:
+    """
+    Score and save every drug pair for one disease in a worker process.
+
+    Returns `(output_file, n_predictions)`.
+    """
+    logging.getLogger('pipeline').info(f"\nProcessing: {disease}")
+
+    predictions = _PREDICTOR.predict_all(disease, max_pairs=max_pairs)
+
+    # Save results
+    output_file = output_dir / prediction_file_name(disease)
+    _PREDICTOR.save_predictions(predictions, output_file)
+
+    return output_file, len(predictions)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run SyndrumNET pipeline")
     parser.add_argument('--config', type=str, required=True, help="Config file path")
@@ -73,7 +113,11 @@ def main():
     processed_dir = Path('data/processed')
     
     # Load network
-    G = NetworkBuilder.load(processed_dir / 'network.graphml')
+    network_file = processed_dir / 'network.parquet'
+    if not network_file.exists():
+        network_file = processed_dir / 'network.graphml'
+
+    G = NetworkBuilder.load(network_file)
     logger.info(f"Loaded network: {G.number_of_nodes()} nodes")
     
     # Load modules
@@ -83,12 +127,19 @@ def main():
     drug_modules = load_drug_modules(processed_dir / 'drug_modules.csv')
     logger.info(f"Loaded {len(drug_modules)} drug modules")
     
+    # Diseases run one per process (below); cores they leave idle go to
+    # sharding each disease's drug-pair sweep
+    n_cores = config.get('n_cores') or os.cpu_count() or 1
+    n_workers = min(len(diseases), n_cores)
+
     # Initialize predictor
     logger.info("\n[2/3] Initializing predictor...")
     predictor = SynergyPredictor(
         G,
         n_randomizations=config.scoring.n_randomizations,
         seed=config.random_seed,
+        n_workers=max(1, n_cores // max(1, n_workers)),
+        shared_null=config.scoring.get('shared_null', False),
     )
     
     predictor.set_disease_modules(disease_modules)
@@ -100,20 +151,26 @@ def main():
     output_dir = Path('reports/tables')
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    for disease in diseases:
-        logger.info(f"\nProcessing: {disease}")
-        
-        try:
-            predictions = predictor.predict_all(disease, max_pairs=args.max_pairs)
-            
-            # Save results
-            output_file = output_dir / f"predictions_{disease.lower().replace(' ', '_')}.csv"
-            predictor.save_predictions(predictions, output_file)
-            
-            logger.info(f"Saved {len(predictions)} predictions to {output_file}")
-            
-        except Exception as e:
-            logger.error(f"Failed to process {disease}: {e}", exc_info=True)
+    # Diseases are independent given the shared network and modules, so each
+    # runs in its own process. Under fork the workers inherit the predictor,
+    # and with it the network, copy-on-write instead of each unpickling one.
+    with ProcessPoolExecutor(
+        max_workers=max(1, n_workers),
+        mp_context=fork_context(),
+        initializer=_init_worker,
+        initargs=(predictor,),
+    ) as pool:
+        futures = {
+            disease: pool.submit(predict_disease, disease, args.max_pairs, output_dir)
+            for disease in diseases
+        }
+
+        for disease, future in futures.items():
+            try:
+                output_file, n_predictions = future.result()
+                logger.info(f"Saved {n_predictions} predictions to {output_file}")
+            except Exception as e:
+                logger.error(f"Failed to process {disease}: {e}", exc_info=True)
     
     logger.info("\n" + "="*60)
     logger.info("Pipeline complete!")
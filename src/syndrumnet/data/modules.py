@@ -11,10 +11,12 @@ and nothing else. See `docs/PLACEHOLDERS.md` section 2 for what that changes.
 """
 
 import logging
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set
 
 import networkx as nx
+import numpy as np
 import pandas as pd
 
 from syndrumnet.io.id_mapping import IDMapper
@@ -93,30 +95,34 @@ class ModuleBuilder:
         
         # Parse CREEDS signatures
         signatures = parse_creeds(creeds_file)
+
+        in_network = self._network_symbols(signatures)
         
         disease_modules = {}
         
         for disease, sig in signatures.items():
-            # Combine up and down regulated genes
-            sig_genes = set(sig['up']) | set(sig['down'])
-            
-            # Harmonize IDs
-            sig_genes = set(self.id_mapper.harmonize_gene_list(list(sig_genes)))
-            
-            # Filter to network genes
-            module_genes = sig_genes & self.network_genes
+            # Combine up and down regulated genes, harmonized and filtered
+            # to the network by the lookup
+            module_genes = {
+                in_network[gene]
+                for gene in chain(sig['up'], sig['down'])
+                if gene in in_network
+            }
             
             # Add susceptibility genes if available
             if susceptibility_files:
                 susc_genes = self._load_susceptibility_genes(disease, susceptibility_files)
-                susc_genes = set(self.id_mapper.harmonize_gene_list(list(susc_genes)))
-                module_genes |= (susc_genes & self.network_genes)
+                module_genes |= self.network_genes.intersection(
+                    self.id_mapper.harmonize_gene_list(list(susc_genes))
+                )
             
             if len(module_genes) > 0:
                 disease_modules[disease] = module_genes
-                logger.info(f"{disease}: {len(module_genes)} genes")
+                # Lazy %-formatting: per-module messages cost nothing when
+                # their level is filtered out.
+                logger.info("%s: %d genes", disease, len(module_genes))
             else:
-                logger.warning(f"No genes in network for disease: {disease}")
+                logger.warning("No genes in network for disease: %s", disease)
         
         logger.info(f"Built {len(disease_modules)} disease modules")
         
@@ -149,17 +155,15 @@ class ModuleBuilder:
         
         # Parse LINCS
         signatures = parse_lincs(lincs_sig_file, lincs_meta_file, top_pct)
+
+        in_network = self._network_symbols(signatures)
         
         drug_modules = {}
         
         for drug, sig in signatures.items():
-            # Harmonize IDs
-            up_genes = set(self.id_mapper.harmonize_gene_list(sig['up']))
-            down_genes = set(self.id_mapper.harmonize_gene_list(sig['down']))
-            
-            # Filter to network genes
-            up_in_net = up_genes & self.network_genes
-            down_in_net = down_genes & self.network_genes
+            # Harmonize IDs and filter to network genes in one lookup each
+            up_in_net = {in_network[g] for g in sig['up'] if g in in_network}
+            down_in_net = {in_network[g] for g in sig['down'] if g in in_network}
             
             if len(up_in_net) > 0 or len(down_in_net) > 0:
                 drug_modules[drug] = {
@@ -167,15 +171,55 @@ class ModuleBuilder:
                     'down': down_in_net,
                 }
                 logger.debug(
-                    f"{drug}: {len(up_in_net)} up, {len(down_in_net)} down"
+                    "%s: %d up, %d down", drug, len(up_in_net), len(down_in_net)
                 )
             else:
-                logger.warning(f"No genes in network for drug: {drug}")
+                logger.warning("No genes in network for drug: %s", drug)
         
         logger.info(f"Built {len(drug_modules)} drug modules")
         
         return drug_modules
     
+    def _network_symbols(
+        self, signatures: Dict[str, Dict[str, List[str]]]
+    ) -> Dict[str, str]:
+        """
+        Resolve every identifier in a set of signatures in one batch.
+
+        Returns
+        -------
+        dict
+            {identifier: HGNC symbol}, holding only the identifiers whose
+            symbol is a network gene.
+
+        Notes
+        -----
+        Most genes recur across modules, so the union is resolved with a
+        single `to_hgnc` call rather than one `mygene` request per module
+        that brings a new gene. Filtering to the network here as well means
+        the per-module work is one dictionary lookup per gene: identifiers
+        that do not map, or map off the network, are dropped before any
+        module is harmonized, deduplicated or intersected.
+        """
+        genes = sorted({
+            gene
+            for sig in signatures.values()
+            for direction in ('up', 'down')
+            for gene in sig[direction]
+        })
+
+        symbols = self.id_mapper.to_hgnc(genes) if genes else []
+
+        n_unmapped = sum(1 for symbol in symbols if symbol is None)
+        if n_unmapped:
+            logger.warning("Could not map %d/%d genes", n_unmapped, len(genes))
+
+        return {
+            gene: symbol
+            for gene, symbol in zip(genes, symbols)
+            if symbol in self.network_genes
+        }
+
     def _load_susceptibility_genes(
         self,
         disease: str,
@@ -239,12 +283,15 @@ class ModuleBuilder:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        rows = []
-        for name, genes in modules.items():
-            for gene in genes:
-                rows.append({'module': name, 'gene': gene})
-        
-        df = pd.DataFrame(rows)
+        # Build the two columns directly rather than a dict per row: each
+        # module name repeated once per gene, alongside the genes flattened.
+        df = pd.DataFrame({
+            'module': np.repeat(
+                np.array(list(modules), dtype=object),
+                [len(genes) for genes in modules.values()],
+            ),
+            'gene': list(chain.from_iterable(modules.values())),
+        })
         df.to_csv(output_path, index=False)
         
         logger.info(f"Saved {len(modules)} modules to {output_path}")
@@ -264,13 +311,21 @@ class ModuleBuilder:
         dict
             {module_name: set of genes}
         """
-        df = pd.read_csv(filepath)
-        
-        modules = {}
-        for module_name in df['module'].unique():
-            genes = set(df[df['module'] == module_name]['gene'])
-            modules[module_name] = genes
-        
+        # Both columns repeat heavily, so they are read as categoricals.
+        df = pd.read_csv(
+            filepath,
+            usecols=['module', 'gene'],
+            dtype={'module': 'category', 'gene': 'category'},
+        )
+
+        # One grouping pass; a boolean mask per module name is O(rows * modules).
+        modules = {
+            module_name: set(genes)
+            for module_name, genes in df.groupby(
+                'module', sort=False, observed=True
+            )['gene']
+        }
+
         logger.info(f"Loaded {len(modules)} modules from {filepath}")
         
         return modules
\ No newline at end of file
@@ -5,12 +5,19 @@ Combines multiple data sources (PPI, complexes, pathways, signaling) into
 a unified network graph for propagation and distance calculations.
 """
 
+import hashlib
 import logging
+import os
+import pickle
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import networkx as nx
+import numpy as np
 import pandas as pd
+from scipy import sparse
+from scipy.sparse import csgraph
 
 from syndrumnet.io.id_mapping import IDMapper
 from syndrumnet.io.parsers import (
@@ -18,9 +25,36 @@ from syndrumnet.io.parsers import (
     parse_huri,
     parse_phosphositeplus,
 )
+from syndrumnet.metrics.adjacency import CSRAdjacency, as_csr, cache_csr
 
 logger = logging.getLogger(__name__)
 
+#: XML namespace of GraphML elements, as written by NetworkX.
+GRAPHML_NS = '{http://graphml.graphdrawing.org/xmlns}'
+
+#: Pickle protocol for .pkl networks; 5 writes large buffers out of band.
+PICKLE_PROTOCOL = 5
+
+#: Parsers for GraphML attribute types, matching nx.read_graphml.
+GRAPHML_TYPES: Dict[str, Callable[[str], Any]] = {
+    'boolean': lambda value: value.strip().lower() in ('true', '1'),
+    'int': int,
+    'long': int,
+    'float': float,
+    'double': float,
+    'string': str,
+}
+
+
+def _source_parser(source_name: str) -> Optional[Callable[..., pd.DataFrame]]:
+    """Parser `add_source` uses for a source, or None if it has none."""
+    parsers = {
+        'huri': parse_huri,
+        'corum': parse_corum,
+        'phosphositeplus': parse_phosphositeplus,
+    }
+    return parsers.get(source_name)
+
 
 class NetworkBuilder:
     """
@@ -37,6 +71,10 @@ class NetworkBuilder:
         Filter to specific organism (default: 'human').
     min_confidence : float, optional
         Minimum confidence score for interactions (source-dependent).
+    cache_dir : Path, optional
+        Directory for built networks. When set, `build` stores its result
+        here keyed on the source files and settings, and returns the stored
+        graph instead of rebuilding while none of them has changed.
         
     Examples
     --------
@@ -53,18 +91,30 @@ class NetworkBuilder:
         id_mapper: IDMapper,
         filter_organism: str = 'human',
         min_confidence: Optional[float] = None,
+        cache_dir: Optional[Path] = None,
     ) -> None:
         """Initialize network builder."""
         self.id_mapper = id_mapper
         self.filter_organism = filter_organism
         self.min_confidence = min_confidence
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         
-        # Store interactions from all sources
-        self.interactions: List[pd.DataFrame] = []
+        # Interactions from all sources, one (protein_a, protein_b, source,
+        # interaction_type) tuple of aligned object arrays per source
+        self.interactions: List[Tuple[np.ndarray, ...]] = []
         self.source_counts: Dict[str, int] = {}
+
+        # What each added source was read from, for the build cache key
+        self._cache_key_parts: List[Tuple] = []
+
+        # Sources added but not yet parsed, as (source_name, filepath,
+        # parser_kwargs); `build` parses them only on a cache miss
+        self._pending_sources: List[Tuple[str, Path, Dict[str, Any]]] = []
         
-        # Final network
+        # Final network, and its CSR adjacency for the distance and
+        # propagation code
         self.network: Optional[nx.Graph] = None
+        self.csr: Optional[CSRAdjacency] = None
     
     def add_source(
         self,
@@ -83,29 +133,93 @@ class NetworkBuilder:
             Path to source data file.
         **parser_kwargs
             Additional arguments for source-specific parser.
+
+        Notes
+        -----
+        The file is only recorded here: its path, modification time, size
+        and parser arguments go into the build cache key, and `build` parses
+        it only if no cached network matches.
         """
         logger.info(f"Adding interactions from {source_name}")
         
-        # Parse based on source
-        parsers = {
-            'huri': parse_huri,
-            'corum': parse_corum,
-            'phosphositeplus': parse_phosphositeplus,
-        }
-        
-        if source_name not in parsers:
+        if _source_parser(source_name) is None:
             logger.warning(f"No parser for {source_name}, skipping")
             return
         
-        parser = parsers[source_name]
-        df = parser(filepath, **parser_kwargs)
-        
-        if df is not None and not df.empty:
-            self.interactions.append(df)
-            self.source_counts[source_name] = len(df)
-            logger.info(f"Added {len(df)} interactions from {source_name}")
+        stat = Path(filepath).stat()
+        self._cache_key_parts.append((
+            source_name,
+            str(filepath),
+            stat.st_mtime_ns,
+            stat.st_size,
+            sorted(parser_kwargs.items()),
+        ))
+        self._pending_sources.append((source_name, Path(filepath), parser_kwargs))
+
+    def _parse_pending_sources(self) -> None:
+        """Parse every source recorded by `add_source`, in the order added."""
+        for source_name, filepath, parser_kwargs in self._pending_sources:
+            df = _source_parser(source_name)(filepath, **parser_kwargs)
+
+            if df is not None and not df.empty:
+                self._append_interactions(source_name, df)
+            else:
+                logger.warning(f"No interactions loaded from {source_name}")
+
+        self._pending_sources = []
+
+    def add_interactions(
+        self,
+        source_name: str,
+        interactions: pd.DataFrame,
+        cache_key: Optional[Tuple] = None,
+    ) -> None:
+        """
+        Add already-parsed interactions.
+
+        Parameters
+        ----------
+        source_name : str
+            Source identifier, for `source_counts`.
+        interactions : pd.DataFrame
+            Columns 'protein_a', 'protein_b' and 'source', and optionally
+            'interaction_type' (default 'PPI'), as the parsers return them.
+        cache_key : tuple, optional
+            What identifies these interactions in the build cache key. By
+            default a hash of their content.
+
+        Notes
+        -----
+        Only the four columns the graph is built from are kept, each as its
+        own array. `build` concatenates them once per column instead of
+        concatenating and then extending whole frames.
+        """
+        if cache_key is None:
+            cache_key = (
+                source_name,
+                int(pd.util.hash_pandas_object(interactions, index=False).sum()),
+            )
+        self._cache_key_parts.append(cache_key)
+
+        self._append_interactions(source_name, interactions)
+
+    def _append_interactions(self, source_name: str, interactions: pd.DataFrame) -> None:
+        """Keep the graph-building columns of parsed interactions."""
+        n = len(interactions)
+        if 'interaction_type' in interactions.columns:
+            interaction_type = interactions['interaction_type'].to_numpy(dtype=object)
         else:
-            logger.warning(f"No interactions loaded from {source_name}")
+            interaction_type = np.full(n, 'PPI', dtype=object)
+
+        self.interactions.append((
+            interactions['protein_a'].to_numpy(dtype=object),
+            interactions['protein_b'].to_numpy(dtype=object),
+            interactions['source'].to_numpy(dtype=object),
+            interaction_type,
+        ))
+
+        self.source_counts[source_name] = n
+        logger.info(f"Added {n} interactions from {source_name}")
     
     def build(self, deduplicate: bool = True) -> nx.Graph:
         """
@@ -120,105 +234,230 @@ class NetworkBuilder:
         -------
         nx.Graph
             Integrated molecular interaction network.
+
+        Notes
+        -----
+        With a `cache_dir`, the network is cached under a hash of every added
+        source's path, modification time, size and parser arguments, plus the
+        builder settings. On a hit the source files are never parsed. ID
+        mapping is not part of the key: after changing the mapper's
+        resources, clear the cache directory.
         """
         logger.info("Building integrated network")
         
-        if not self.interactions:
+        if not self.interactions and not self._pending_sources:
             raise ValueError("No interaction sources added")
+
+        cache_file = self._build_cache_file(deduplicate)
+        if cache_file is not None and cache_file.exists():
+            try:
+                self.network = self.load(cache_file)
+                self.csr = as_csr(self.network)
+                logger.info(f"Using cached network {cache_file.name}")
+                return self.network
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable network cache {cache_file}: {e}")
+
+        self._parse_pending_sources()
+        if not self.interactions:
+            raise ValueError("No interactions loaded from any source")
         
-        # Combine all interactions
-        all_interactions = pd.concat(self.interactions, ignore_index=True)
+        # Combine all interactions, one concatenation per column
+        protein_a, protein_b, source, interaction_type = (
+            np.concatenate(column) for column in zip(*self.interactions)
+        )
+        n_rows = len(protein_a)
         
-        logger.info(f"Total interactions before harmonization: {len(all_interactions)}")
+        logger.info(f"Total interactions before harmonization: {n_rows}")
         
-        # Harmonize gene IDs
-        all_genes = set(all_interactions['protein_a']) | set(all_interactions['protein_b'])
-        all_genes = list(all_genes)
+        # Harmonize gene IDs. Both endpoint columns are factorized together,
+        # so each distinct identifier is mapped once and the symbols are
+        # gathered back onto the rows by integer code.
+        codes, proteins = pd.factorize(np.concatenate([protein_a, protein_b]))
         
-        logger.info(f"Harmonizing {len(all_genes)} unique genes")
+        logger.info(f"Harmonizing {len(proteins)} unique genes")
 
         # to_hgnc() is the authoritative call here, and the only one needed.
         # harmonize_gene_list() used to be called first and its result thrown
         # away; it deduplicates and drops unmapped identifiers, which loses
         # exactly the correspondence to the original names that the edge
-        # rewrite below depends on.
-        gene_map = dict(zip(all_genes, self.id_mapper.to_hgnc(all_genes)))
-        
-        # Map to harmonized IDs
-        all_interactions['gene_a'] = all_interactions['protein_a'].map(gene_map)
-        all_interactions['gene_b'] = all_interactions['protein_b'].map(gene_map)
+        # rewrite below depends on. The trailing None is what code -1, a
+        # missing identifier, gathers.
+        symbols = np.empty(len(proteins) + 1, dtype=object)
+        symbols[:-1] = self.id_mapper.to_hgnc(list(proteins))
+        gene_a, gene_b = np.split(symbols[codes], 2)
         
-        # Remove unmapped
-        all_interactions = all_interactions[
-            all_interactions['gene_a'].notna() &
-            all_interactions['gene_b'].notna()
-        ]
+        # Map to harmonized IDs, removing unmapped
+        keep = pd.notna(gene_a) & pd.notna(gene_b)
         
-        logger.info(f"Interactions after ID mapping: {len(all_interactions)}")
-        
-        # Build NetworkX graph
-        G = nx.Graph()
-        
-        for _, row in all_interactions.iterrows():
-            gene_a = row['gene_a']
-            gene_b = row['gene_b']
-            
-            # Skip self-loops
-            if gene_a == gene_b:
-                continue
-            
-            # Add edge with metadata
-            if G.has_edge(gene_a, gene_b):
-                # Edge exists, add source to metadata
-                G[gene_a][gene_b]['sources'].append(row['source'])
-            else:
-                G.add_edge(
-                    gene_a,
-                    gene_b,
-                    sources=[row['source']],
-                    interaction_type=row.get('interaction_type', 'PPI'),
-                )
+        logger.info(f"Interactions after ID mapping: {int(keep.sum())}")
         
-        # Get largest connected component
-        if not nx.is_connected(G):
+        # Skip self-loops
+        keep &= gene_a != gene_b
+        gene_a, gene_b = gene_a[keep], gene_b[keep]
+        source, interaction_type = source[keep], interaction_type[keep]
+
+        # Key each row by its unordered gene pair, so A-B and B-A are the
+        # same edge: integer codes for both endpoints, smaller code first.
+        codes, gene_names = pd.factorize(np.concatenate([gene_a, gene_b]))
+        code_a, code_b = np.split(codes.astype(np.int64), 2)
+        n_genes = codes.max(initial=-1) + 1
+        pair_key = np.minimum(code_a, code_b) * n_genes + np.maximum(code_a, code_b)
+
+        # The first row of each pair sets the edge's orientation and type, as
+        # it would adding rows one at a time; every row contributes a source.
+        # Groups come out in first-appearance order, aligned with those rows.
+        is_first = ~pd.Series(pair_key).duplicated().to_numpy()
+        first_a, first_b = gene_a[is_first], gene_b[is_first]
+        interaction_types = interaction_type[is_first]
+        sources = pd.Series(source).groupby(pair_key, sort=False).agg(list)
+
+        # Get largest connected component, labelled on a sparse adjacency of
+        # the gene codes rather than by BFS over a NetworkX graph, so that
+        # the graph is only ever built from the edges that are kept.
+        edge_a, edge_b = code_a[is_first], code_b[is_first]
+        adjacency = sparse.coo_array(
+            (np.ones(len(edge_a), dtype=np.int8), (edge_a, edge_b)),
+            shape=(n_genes, n_genes),
+        )
+        n_components, labels = csgraph.connected_components(adjacency, directed=False)
+
+        if n_components > 1:
             logger.warning("Network is not connected, taking largest component")
-            components = list(nx.connected_components(G))
-            largest = max(components, key=len)
-            G = G.subgraph(largest).copy()
-            logger.info(f"Largest component: {len(largest)} nodes")
+            # Labels follow node order, so ties go to the earliest component
+            component_sizes = np.bincount(labels)
+            largest = component_sizes.argmax()
+            keep = labels[edge_a] == largest
+            edge_a, edge_b = edge_a[keep], edge_b[keep]
+            first_a, first_b = first_a[keep], first_b[keep]
+            sources = sources[keep]
+            interaction_types = interaction_types[keep]
+            logger.info(f"Largest component: {component_sizes[largest]} nodes")
+
+        # Build NetworkX graph in one call
+        G = nx.Graph()
+        G.add_edges_from(
+            (gene_a, gene_b, {'sources': edge_sources, 'interaction_type': kind})
+            for gene_a, gene_b, edge_sources, kind in zip(
+                first_a, first_b, sources, interaction_types
+            )
+        )
         
         self.network = G
+
+        # The CSR adjacency from the same edge arrays, with nodes renumbered
+        # in the graph's node order (first appearance along the edges), and
+        # registered so `as_csr(G)` never converts the graph again.
+        node_codes, node_genes = pd.factorize(
+            np.column_stack([edge_a, edge_b]).ravel()
+        )
+        self.csr = CSRAdjacency.from_edges(
+            gene_names[node_genes], node_codes[0::2], node_codes[1::2]
+        )
+        cache_csr(G, self.csr)
         
         logger.info(
             f"Built network: {G.number_of_nodes()} nodes, "
             f"{G.number_of_edges()} edges"
         )
+
+        if cache_file is not None:
+            self._write_build_cache(cache_file)
         
         return G
+
+    def _build_cache_file(self, deduplicate: bool) -> Optional[Path]:
+        """Cache path for the current sources and settings, if caching."""
+        if self.cache_dir is None:
+            return None
+
+        key = repr((
+            self._cache_key_parts,
+            self.filter_organism,
+            self.min_confidence,
+            deduplicate,
+        ))
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / f'network_{digest}.pkl'
+
+    def _write_build_cache(self, cache_file: Path) -> None:
+        """
+        Store the built network, atomically.
+
+        A failed write only costs the next run a rebuild, so it is logged
+        rather than raised.
+        """
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(self.network, f, protocol=PICKLE_PROTOCOL)
+            # Readers see the old file or the complete new one, never a
+            # partial write.
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write network cache {cache_file}: {e}")
+            tmp_file.unlink(missing_ok=True)
+            return
+
+        logger.debug(f"Cached network in {cache_file}")
     
-    def get_network_stats(self) -> Dict[str, any]:
+    def get_network_stats(self, expensive: bool = False) -> Dict[str, any]:
         """
         Get network statistics.
-        
+
+        Parameters
+        ----------
+        expensive : bool
+            Also compute the diameter and average clustering coefficient.
+            Both need a pass over every node's neighbourhood, so they are
+            skipped unless asked for.
+
         Returns
         -------
         dict
-            Network properties (nodes, edges, density, etc.).
+            Network properties (nodes, edges, density, etc.). 'diameter' and
+            'avg_clustering' are None unless `expensive` is set; 'diameter' is
+            also None for a disconnected network.
+
+        Notes
+        -----
+        The diameter is the double-sweep estimate: a breadth-first search
+        from any node finds a farthest node, and the eccentricity of that node
+        is reported. This takes two searches instead of one per node, and is
+        a lower bound on the true diameter that is exact on trees and
+        typically exact or off by one on scale-free interactomes.
         """
         if self.network is None:
             raise ValueError("Network not built yet")
         
         G = self.network
+        n_nodes = G.number_of_nodes()
+        n_edges = G.number_of_edges()
+
+        # Components are counted on the CSR adjacency in compiled code; only
+        # the count is needed, so no component is materialized as a node set.
+        adjacency = as_csr(G)
+        n_components, _ = csgraph.connected_components(
+            adjacency.matrix, directed=False
+        )
         
         stats = {
-            'n_nodes': G.number_of_nodes(),
-            'n_edges': G.number_of_edges(),
-            'density': nx.density(G),
-            'avg_degree': sum(dict(G.degree()).values()) / G.number_of_nodes(),
-            'n_components': nx.number_connected_components(G),
-            'diameter': nx.diameter(G) if nx.is_connected(G) else None,
-            'avg_clustering': nx.average_clustering(G),
+            'n_nodes': n_nodes,
+            'n_edges': n_edges,
+            # Both from the counts above by the handshake lemma (the degrees
+            # sum to 2E), as nx.density would compute it for a simple graph
+            'density': 2 * n_edges / (n_nodes * (n_nodes - 1)) if n_nodes > 1 else 0.0,
+            'avg_degree': 2 * n_edges / n_nodes,
+            'n_components': int(n_components),
+            'diameter': None,
+            'avg_clustering': None,
         }
+
+        if expensive:
+            if stats['n_components'] == 1:
+                stats['diameter'] = _double_sweep_diameter(adjacency)
+            stats['avg_clustering'] = _average_clustering(adjacency)
         
         return stats
     
@@ -229,7 +468,24 @@ class NetworkBuilder:
         Parameters
         ----------
         output_path : Path
-            Output file path (.graphml, .gml, .edgelist).
+            Output file path (.graphml, .gml, .edgelist, .parquet, .pkl).
+
+        Raises
+        ------
+        ImportError
+            For .parquet, if no Parquet engine (pyarrow) is installed. It is
+            the optional `parquet` extra.
+
+        Notes
+        -----
+        GraphML is XML and NetworkX parses it node by node with type inference
+        on every attribute, which on an interactome-sized graph takes minutes.
+        .parquet writes the edge table columnar instead and reloads in
+        seconds, so it is the format the pipeline reads back; GraphML is kept
+        for exchange with external tools. Like .edgelist, it stores edges
+        only, so isolated nodes are not preserved. .pkl pickles the graph
+        object itself: the fastest round trip and lossless, but readable only
+        from Python with a compatible NetworkX.
         """
         if self.network is None:
             raise ValueError("Network not built yet")
@@ -245,6 +501,12 @@ class NetworkBuilder:
             nx.write_gml(self.network, output_path)
         elif ext == '.edgelist':
             nx.write_edgelist(self.network, output_path)
+        elif ext == '.parquet':
+            edges = nx.to_pandas_edgelist(self.network, source='gene_a', target='gene_b')
+            edges.to_parquet(output_path, index=False, compression='zstd')
+        elif ext == '.pkl':
+            with open(output_path, 'wb') as f:
+                pickle.dump(self.network, f, protocol=PICKLE_PROTOCOL)
         else:
             raise ValueError(f"Unsupported format: {ext}")
         
@@ -258,7 +520,9 @@ class NetworkBuilder:
         Parameters
         ----------
         filepath : Path
-            Network file path.
+            Network file path (.graphml, .gml, .edgelist, .parquet, .pkl).
+            Only load .pkl files this pipeline wrote: unpickling can run
+            arbitrary code.
             
         Returns
         -------
@@ -268,14 +532,141 @@ class NetworkBuilder:
         ext = filepath.suffix.lower()
         
         if ext == '.graphml':
-            G = nx.read_graphml(filepath)
+            G = NetworkBuilder._load_graphml_streaming(filepath)
         elif ext == '.gml':
             G = nx.read_gml(filepath)
         elif ext == '.edgelist':
             G = nx.read_edgelist(filepath)
+        elif ext == '.parquet':
+            edges = pd.read_parquet(filepath)
+            attributes = [c for c in edges.columns if c not in ('gene_a', 'gene_b')]
+
+            # List columns come back as arrays; the graph carries lists.
+            if 'sources' in edges.columns:
+                edges['sources'] = edges['sources'].map(list)
+
+            G = nx.from_pandas_edgelist(
+                edges, 'gene_a', 'gene_b', edge_attr=attributes or None
+            )
+        elif ext == '.pkl':
+            with open(filepath, 'rb') as f:
+                G = pickle.load(f)
         else:
             raise ValueError(f"Unsupported format: {ext}")
         
         logger.info(f"Loaded network: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
         
         return G
+
+    @staticmethod
+    def _load_graphml_streaming(filepath: Path) -> nx.Graph:
+        """
+        Read an undirected GraphML file without building its XML tree.
+
+        Parameters
+        ----------
+        filepath : Path
+            GraphML file.
+
+        Returns
+        -------
+        nx.Graph
+            Loaded network, with node, edge and graph attributes typed as
+            their <key> declarations say.
+
+        Notes
+        -----
+        nx.read_graphml parses the whole document into an ElementTree first,
+        so peak memory is several times the file size. Here each <node> and
+        <edge> is decoded as soon as its end tag arrives and then detached,
+        which keeps memory flat however large the interactome. Directed
+        graphs, which the pipeline never writes, are handed to
+        nx.read_graphml unchanged; parallel edges, which an nx.Graph cannot
+        hold either, collapse to the last one.
+        """
+        # {key id: (attribute name, parser, element kind it is for, default)}
+        keys: Dict[str, Tuple[str, Callable[[str], Any], str, Any]] = {}
+        nodes = []
+        edges = []
+        graph = None
+
+        def decode(elem: ET.Element) -> Dict[str, Any]:
+            data = {}
+            for child in elem.iter(GRAPHML_NS + 'data'):
+                name, parse, _, _ = keys[child.get('key')]
+                data[name] = parse(child.text or '')
+            return data
+
+        for event, elem in ET.iterparse(filepath, events=('start', 'end')):
+            tag = elem.tag
+
+            if event == 'start':
+                if tag == GRAPHML_NS + 'graph':
+                    if elem.get('edgedefault') == 'directed':
+                        return nx.read_graphml(filepath)
+                    graph = elem
+                continue
+
+            if tag == GRAPHML_NS + 'key':
+                parse = GRAPHML_TYPES.get(elem.get('attr.type'), str)
+                default = elem.find(GRAPHML_NS + 'default')
+                keys[elem.get('id')] = (
+                    elem.get('attr.name'),
+                    parse,
+                    elem.get('for'),
+                    parse(default.text or '') if default is not None else None,
+                )
+            elif tag == GRAPHML_NS + 'node':
+                nodes.append((elem.get('id'), decode(elem)))
+                graph.remove(elem)
+            elif tag == GRAPHML_NS + 'edge':
+                data = decode(elem)
+                if elem.get('id') is not None:
+                    data['id'] = elem.get('id')
+                edges.append((elem.get('source'), elem.get('target'), data))
+                graph.remove(elem)
+
+        G = nx.Graph()
+
+        # Declared defaults are recorded, not applied, as nx.read_graphml does
+        for domain in ('node', 'edge'):
+            G.graph[f'{domain}_default'] = {
+                name: default
+                for name, _, applies_to, default in keys.values()
+                if applies_to == domain and default is not None
+            }
+
+        if graph is not None:
+            # Only the graph's own <data> children are left attached to it
+            G.graph.update(decode(graph))
+        G.add_nodes_from(nodes)
+        G.add_edges_from(edges)
+
+        return G
+
+
+def _double_sweep_diameter(adjacency: CSRAdjacency) -> int:
+    """Double-sweep lower bound on the diameter of a connected graph."""
+    first = adjacency.distances_from(np.array([0]))[0]
+    farthest = int(np.argmax(first))
+    second = adjacency.distances_from(np.array([farthest]))[0]
+    return int(second.max())
+
+
+def _average_clustering(adjacency: CSRAdjacency) -> float:
+    """
+    Mean local clustering coefficient, as `nx.average_clustering`.
+
+    Triangles through each node are counted with one sparse product: entry
+    (i, j) of A @ A counts the common neighbours of i and j, and summing it
+    over the neighbours j of i counts every triangle at i twice.
+    """
+    A = adjacency.matrix.astype(np.float64)
+    triangles = (A @ A).multiply(A).sum(axis=1) / 2
+    degrees = adjacency.degrees()
+
+    pairs = degrees * (degrees - 1) / 2
+    clustering = np.divide(
+        triangles, pairs, out=np.zeros(len(degrees)), where=pairs > 0
+    )
+    return float(clustering.mean())
@@ -8,10 +8,22 @@ import logging
 from pathlib import Path
 from typing import Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+#: Columns of a known-synergies file that are read, with their dtypes.
+SYNERGY_COLUMNS = {'drug_a': str, 'drug_b': str, 'disease': 'category'}
+
+#: DrugCombDB columns that are read, with their dtypes and standard names.
+DRUGCOMBDB_COLUMNS = {
+    'Drug1': (str, 'drug_a'),
+    'Drug2': (str, 'drug_b'),
+    'Disease': ('category', 'disease'),
+    'Synergy_Score': (float, 'synergy_score'),
+}
+
 
 def load_known_synergies(
     filepath: Path,
@@ -38,21 +50,25 @@ def load_known_synergies(
         logger.warning(f"Synergy file not found: {filepath}")
         return set()
     
-    df = pd.read_csv(filepath)
+    # Only the pair and disease columns, with their types given up front so
+    # no other column is parsed and nothing is type-inferred
+    df = pd.read_csv(
+        filepath,
+        usecols=lambda column: column in SYNERGY_COLUMNS,
+        dtype=SYNERGY_COLUMNS,
+        engine='c',
+    )
     
     # Filter by disease if specified
     if disease_filter and 'disease' in df.columns:
         df = df[df['disease'].str.lower() == disease_filter.lower()]
     
-    # Extract drug pairs
-    synergies = set()
-    for _, row in df.iterrows():
-        drug_a = str(row['drug_a']).strip()
-        drug_b = str(row['drug_b']).strip()
-        
-        # Canonical ordering (alphabetical)
-        pair = tuple(sorted([drug_a, drug_b]))
-        synergies.add(pair)
+    # Extract drug pairs, as stripped strings
+    pairs = np.char.strip(df[['drug_a', 'drug_b']].to_numpy(dtype=str))
+
+    # Canonical ordering (alphabetical), one row-wise sort for every pair
+    pairs.sort(axis=1)
+    synergies = set(zip(pairs[:, 0].tolist(), pairs[:, 1].tolist()))
     
     logger.info(f"Loaded {len(synergies)} known synergistic pairs")
     
@@ -71,18 +87,21 @@ def load_drugcombdb(filepath: Path) -> pd.DataFrame:
     Returns
     -------
     pd.DataFrame
-        DrugCombDB data.
+        DrugCombDB data: the columns 'drug_a', 'drug_b', 'disease' and
+        'synergy_score', those the file has. Other columns are not read.
     """
     logger.info(f"Loading DrugCombDB from {filepath}")
     
-    df = pd.read_csv(filepath)
+    df = pd.read_csv(
+        filepath,
+        usecols=lambda column: column in DRUGCOMBDB_COLUMNS,
+        dtype={column: dtype for column, (dtype, _) in DRUGCOMBDB_COLUMNS.items()},
+        engine='c',
+    )
     
     # Standardize column names
     df = df.rename(columns={
-        'Drug1': 'drug_a',
-        'Drug2': 'drug_b',
-        'Disease': 'disease',
-        'Synergy_Score': 'synergy_score',
+        column: name for column, (_, name) in DRUGCOMBDB_COLUMNS.items()
     })
     
     logger.info(f"Loaded {len(df)} drug combinations from DrugCombDB")
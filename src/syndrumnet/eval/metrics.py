@@ -5,14 +5,13 @@ Computes AUC-ROC, AUC-PR, and other classification metrics.
 """
 
 import logging
-from typing import Dict, Set, Tuple
+from typing import Dict, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
+from scipy.stats import rankdata
 from sklearn.metrics import (
-    average_precision_score,
     precision_recall_curve,
-    roc_auc_score,
     roc_curve,
 )
 
@@ -22,6 +21,7 @@ logger = logging.getLogger(__name__)
 def compute_auc(
     y_true: np.ndarray,
     y_score: np.ndarray,
+    ranks: Optional[np.ndarray] = None,
 ) -> float:
     """
     Compute AUC-ROC.
@@ -32,18 +32,84 @@ def compute_auc(
         True binary labels (0/1).
     y_score : np.ndarray
         Predicted scores.
+    ranks : np.ndarray, optional
+        `score_ranks(y_score)`, when the caller already has it.
         
     Returns
     -------
     float
         AUC-ROC score.
+
+    Notes
+    -----
+    Computed with the Mann-Whitney identity rather than by building the ROC
+    curve: the AUC is the rank sum of the positives, less its minimum
+    ``n_pos * (n_pos + 1) / 2``, over ``n_pos * n_neg``. With average ranks
+    for ties this equals `sklearn.metrics.roc_auc_score`, and the ranking,
+    the only sort, can be shared by every labelling of the same scores.
     """
-    if len(np.unique(y_true)) < 2:
+    y_true = np.asarray(y_true)
+    n_pos = int(np.count_nonzero(y_true))
+    n_neg = len(y_true) - n_pos
+
+    if n_pos == 0 or n_neg == 0:
         logger.warning("Only one class in y_true, cannot compute AUC")
         return np.nan
-    
-    auc = roc_auc_score(y_true, y_score)
-    return auc
+
+    if ranks is None:
+        ranks = score_ranks(y_score)
+
+    return float(_auc_from_ranks(ranks @ (y_true != 0), n_pos, n_neg))
+
+
+def compute_auc_many(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+) -> np.ndarray:
+    """
+    AUC-ROC of one set of scores against several labellings.
+
+    Parameters
+    ----------
+    y_true : np.ndarray
+        0/1 labels of shape (n_predictions, n_labellings), e.g. one column
+        per benchmark of known synergies.
+    y_score : np.ndarray
+        Predicted scores, shape (n_predictions,).
+
+    Returns
+    -------
+    np.ndarray
+        AUC-ROC per column; NaN where a column has only one class.
+
+    Notes
+    -----
+    The scores are ranked once and every column's positive rank sum comes
+    from a single matrix-vector product, instead of one sort per labelling.
+    """
+    positives = np.asarray(y_true) != 0
+    n_pos = positives.sum(axis=0)
+    n_neg = len(positives) - n_pos
+
+    rank_sums = score_ranks(y_score) @ positives
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        auc = _auc_from_ranks(rank_sums, n_pos, n_neg)
+    return np.where((n_pos > 0) & (n_neg > 0), auc, np.nan)
+
+
+def score_ranks(y_score: np.ndarray) -> np.ndarray:
+    """Ranks of the scores, ties averaged, as `compute_auc` consumes them."""
+    return rankdata(y_score)
+
+
+def _auc_from_ranks(
+    rank_sum_pos: np.ndarray,
+    n_pos: np.ndarray,
+    n_neg: np.ndarray,
+) -> np.ndarray:
+    """AUC from the rank sum of the positives (Mann-Whitney U / n_pos n_neg)."""
+    return (rank_sum_pos - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg)
 
 
 def compute_pr(
@@ -64,13 +130,34 @@ def compute_pr(
     -------
     float
         AUC-PR score.
+
+    Notes
+    -----
+    Same definition and tie handling as
+    `sklearn.metrics.average_precision_score`, computed directly with one
+    sort and cumulative sums. This skips sklearn's input validation, which
+    dominates on per-disease tables of a few hundred pairs.
     """
-    if len(np.unique(y_true)) < 2:
+    y_true = np.asarray(y_true) != 0
+    n_pos = int(np.count_nonzero(y_true))
+
+    if n_pos == 0 or n_pos == len(y_true):
         logger.warning("Only one class in y_true, cannot compute AUC-PR")
         return np.nan
-    
-    auc_pr = average_precision_score(y_true, y_score)
-    return auc_pr
+
+    order = np.argsort(-np.asarray(y_score, dtype=float), kind='mergesort')
+    y_sorted = y_true[order]
+    score_sorted = np.asarray(y_score, dtype=float)[order]
+
+    # One operating point per distinct score: the last row of each tie run
+    thresholds = np.flatnonzero(np.diff(score_sorted))
+    thresholds = np.append(thresholds, len(y_sorted) - 1)
+
+    tps = np.cumsum(y_sorted)[thresholds]
+    precision = tps / (thresholds + 1)
+    recall = tps / n_pos
+
+    return float(np.sum(np.diff(recall, prepend=0.0) * precision))
 
 
 def compute_roc_curve(
@@ -119,6 +206,109 @@ def compute_precision_recall_curve(
     return precision, recall, thresholds
 
 
+def encode_synergies(
+    known_synergies: Set[Tuple[str, str]],
+) -> Tuple[Dict[str, int], np.ndarray]:
+    """
+    Encode known synergistic pairs as sorted integer keys.
+
+    Parameters
+    ----------
+    known_synergies : set
+        Known synergistic pairs, each in sorted order as produced by
+        `load_known_synergies`.
+
+    Returns
+    -------
+    tuple
+        (drug_ids, keys) where drug_ids maps each drug to an integer assigned
+        in alphabetical order, and keys holds ``lo * n_drugs + hi`` for every
+        pair, sorted.
+
+    Notes
+    -----
+    Because IDs follow alphabetical order, a canonically ordered pair always
+    has lo <= hi, so the key of a pair does not depend on which drug came
+    first. Encode once and pass the result to every `label_predictions` call
+    over the same synergies.
+    """
+    drugs = sorted({drug for pair in known_synergies for drug in pair})
+    drug_ids = {drug: i for i, drug in enumerate(drugs)}
+    n_drugs = len(drugs)
+
+    keys = np.array(
+        sorted(drug_ids[a] * n_drugs + drug_ids[b] for a, b in known_synergies),
+        dtype=np.int64,
+    )
+
+    return drug_ids, keys
+
+
+def _drug_ids(column: pd.Series, drug_ids: Dict[str, int]) -> np.ndarray:
+    """Integer ID of each drug in a column, -1 for drugs with no known pair."""
+    categorical = column.astype('category')
+
+    # Look up each distinct name once, then gather by category code. The
+    # trailing -1 is what code -1 (a missing value) indexes.
+    lookup = np.fromiter(
+        (drug_ids.get(name, -1) for name in categorical.cat.categories),
+        dtype=np.int64,
+        count=len(categorical.cat.categories),
+    )
+    lookup = np.append(lookup, -1)
+
+    return lookup[categorical.cat.codes.to_numpy()]
+
+
+def label_predictions(
+    predictions: pd.DataFrame,
+    known_synergies: Set[Tuple[str, str]],
+    encoded: Optional[Tuple[Dict[str, int], np.ndarray]] = None,
+) -> np.ndarray:
+    """
+    Mark each predicted pair as a known synergy or not.
+
+    Parameters
+    ----------
+    predictions : pd.DataFrame
+        Predictions with 'drug_a' and 'drug_b'.
+    known_synergies : set
+        Known synergistic pairs, each in sorted order as produced by
+        `load_known_synergies`.
+    encoded : tuple, optional
+        `encode_synergies(known_synergies)`, when labelling many chunks
+        against the same synergies.
+
+    Returns
+    -------
+    np.ndarray
+        0/1 labels aligned with the rows of `predictions`.
+
+    Notes
+    -----
+    Drug names are mapped to integer IDs once per distinct name rather than
+    compared as strings per row, and each pair becomes a single int64 key
+    matched with one `np.isin` against the sorted known keys.
+    """
+    if predictions.empty or not known_synergies:
+        return np.zeros(len(predictions), dtype=np.int8)
+
+    drug_ids, keys = encoded if encoded is not None else encode_synergies(
+        known_synergies
+    )
+
+    id_a = _drug_ids(predictions['drug_a'], drug_ids)
+    id_b = _drug_ids(predictions['drug_b'], drug_ids)
+
+    # Canonical order, matching load_known_synergies
+    lo = np.minimum(id_a, id_b)
+    hi = np.maximum(id_a, id_b)
+
+    pair_keys = lo * len(drug_ids) + hi
+
+    return ((lo >= 0) & np.isin(pair_keys, keys)).astype(np.int8)
+
+
 def evaluate_predictions(
     predictions: pd.DataFrame,
     known_synergies: Set[Tuple[str, str]],
@@ -139,25 +329,44 @@ def evaluate_predictions(
         Evaluation metrics.
     """
     # Create labels
-    y_true = []
-    y_score = []
-    
-    for _, row in predictions.iterrows():
-        pair = tuple(sorted([row['drug_a'], row['drug_b']]))
-        label = 1 if pair in known_synergies else 0
-        
-        y_true.append(label)
-        y_score.append(row['prediction_score'])
-    
-    y_true = np.array(y_true)
-    y_score = np.array(y_score)
+    y_true = label_predictions(predictions, known_synergies)
+    y_score = predictions['prediction_score'].to_numpy(dtype=float)
     
-    # Compute metrics
+    return compute_metrics(y_true, y_score, len(known_synergies))
+
+
+def compute_metrics(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    n_known_synergies: int,
+) -> Dict[str, float]:
+    """
+    Compute the evaluation summary from labels and scores.
+
+    Parameters
+    ----------
+    y_true : np.ndarray
+        0/1 labels, as returned by `label_predictions`.
+    y_score : np.ndarray
+        Prediction scores aligned with `y_true`.
+    n_known_synergies : int
+        Size of the benchmark the labels were drawn from.
+
+    Returns
+    -------
+    dict
+        Evaluation metrics, the same keys as `evaluate_predictions`.
+
+    Notes
+    -----
+    Split out of `evaluate_predictions` so a caller that labels a large
+    predictions file chunk by chunk never needs the whole frame in memory.
+    """
     metrics = {
         'auc_roc': compute_auc(y_true, y_score),
         'auc_pr': compute_pr(y_true, y_score),
-        'n_predictions': len(predictions),
-        'n_known_synergies': len(known_synergies),
+        'n_predictions': len(y_true),
+        'n_known_synergies': n_known_synergies,
         'n_true_positives': int(np.sum(y_true)),
     }
     
@@ -5,14 +5,177 @@ Generates summary tables and reports.
 """
 
 import logging
+import os
+import sys
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Iterator, List, Optional
 
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 
+def prediction_file_name(disease: str) -> str:
+    """File name `run_pipeline.py` writes a disease's predictions under."""
+    return f"predictions_{disease.lower().replace(' ', '_')}.csv"
+
+
+def find_prediction_files(
+    predictions_dir: Path,
+    diseases: Iterable[str],
+) -> Dict[str, Path]:
+    """
+    Locate the predictions file of each disease that has one.
+
+    Parameters
+    ----------
+    predictions_dir : Path
+        Directory the pipeline writes predictions to.
+    diseases : iterable of str
+        Disease names, as in the config.
+
+    Returns
+    -------
+    dict
+        {disease: path} for the diseases whose file exists, in input order.
+        A missing directory yields an empty mapping.
+
+    Notes
+    -----
+    The directory is listed once and names are matched in memory, rather than
+    calling `exists()` per disease. Each of those is a `stat` round trip,
+    which on a network filesystem costs far more than the single listing.
+    """
+    predictions_dir = Path(predictions_dir)
+
+    try:
+        with os.scandir(predictions_dir) as entries:
+            existing = {entry.name for entry in entries}
+    except FileNotFoundError:
+        existing = set()
+
+    return {
+        disease: predictions_dir / prediction_file_name(disease)
+        for disease in diseases
+        if prediction_file_name(disease) in existing
+    }
+
+
+#: Prediction columns holding drug names, which repeat across pairs.
+DRUG_COLUMNS = ('drug_a', 'drug_b')
+
+
+def _parquet_copy(pred_file: Path) -> Optional[Path]:
+    """
+    The Parquet copy of a predictions CSV, if it exists, can be read, and is
+    at least as new as the CSV.
+
+    The CSV is the source of truth. `save_predictions` writes the copy after
+    it, so a CSV rewritten any other way (an older pipeline run, a hand edit,
+    a copy from another machine) is newer than the copy and is read instead.
+    """
+    pred_file = Path(pred_file)
+    parquet_file = pred_file.with_suffix('.parquet')
+
+    try:
+        if parquet_file.stat().st_mtime_ns < pred_file.stat().st_mtime_ns:
+            return None
+    except FileNotFoundError:
+        return None
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+
+    return parquet_file
+
+
+def _parquet_columns(parquet_file: Path, columns: Iterable[str]) -> List[str]:
+    """The requested columns that the Parquet file actually has."""
+    import pyarrow.parquet as pq
+
+    present = set(pq.read_schema(parquet_file).names)
+    return [column for column in columns if column in present]
+
+
+def read_predictions(pred_file: Path, columns: Iterable[str]) -> pd.DataFrame:
+    """
+    Read the given columns of a predictions table.
+
+    Parameters
+    ----------
+    pred_file : Path
+        Predictions CSV, as found by `find_prediction_files`.
+    columns : iterable of str
+        Columns to read. Any the file lacks are skipped.
+
+    Returns
+    -------
+    pd.DataFrame
+        Predictions, with drug names as categoricals.
+
+    Notes
+    -----
+    `SynergyPredictor.save_predictions` writes a Parquet copy beside the CSV
+    when pyarrow is installed. Unless the CSV is newer, it is read in
+    preference: it is columnar, so only the requested columns are decoded,
+    and its dictionary-encoded drug names load straight into categoricals
+    with no text parsing.
+    """
+    columns = list(columns)
+    parquet_file = _parquet_copy(pred_file)
+
+    if parquet_file is not None:
+        selected = _parquet_columns(parquet_file, columns)
+        return pd.read_parquet(
+            parquet_file,
+            columns=selected,
+            read_dictionary=[c for c in DRUG_COLUMNS if c in selected],
+        )
+
+    return pd.read_csv(
+        pred_file,
+        usecols=lambda column: column in columns,
+        dtype={column: 'category' for column in DRUG_COLUMNS},
+    )
+
+
+def iter_predictions(
+    pred_file: Path,
+    columns: Iterable[str],
+    chunk_rows: int,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read the given columns of a predictions table in chunks.
+
+    Like `read_predictions`, but yields at most `chunk_rows` rows at a time
+    so a table of every pair over a large drug library never has to fit in
+    memory at once.
+    """
+    columns = list(columns)
+    parquet_file = _parquet_copy(pred_file)
+
+    if parquet_file is not None:
+        import pyarrow.parquet as pq
+
+        selected = _parquet_columns(parquet_file, columns)
+        reader = pq.ParquetFile(
+            parquet_file,
+            read_dictionary=[c for c in DRUG_COLUMNS if c in selected],
+        )
+        for batch in reader.iter_batches(batch_size=chunk_rows, columns=selected):
+            yield batch.to_pandas()
+        return
+
+    yield from pd.read_csv(
+        pred_file,
+        usecols=lambda column: column in columns,
+        dtype={column: 'category' for column in DRUG_COLUMNS},
+        chunksize=chunk_rows,
+    )
+
+
 def generate_evaluation_report(
     results: Dict[str, Dict[str, float]],
     output_path: Path,
@@ -29,16 +192,21 @@ def generate_evaluation_report(
     """
     logger.info("Generating evaluation report")
     
-    rows = []
-    for disease, metrics in results.items():
-        row = {'disease': disease}
-        row.update(metrics)
-        rows.append(row)
-    
-    df = pd.DataFrame(rows)
+    # Metric names in first-seen order, then one tuple per disease, so the
+    # frame is built against a known schema rather than inferred from dicts
+    metric_names = list(dict.fromkeys(
+        name for metrics in results.values() for name in metrics
+    ))
+    df = pd.DataFrame.from_records(
+        [
+            (disease, *(metrics.get(name) for name in metric_names))
+            for disease, metrics in results.items()
+        ],
+        columns=['disease', *metric_names],
+    )
     
-    # Sort by AUC-ROC
-    df = df.sort_values('auc_roc', ascending=False)
+    # Sort by AUC-ROC; stable, so tied diseases keep their input order
+    df = df.sort_values('auc_roc', ascending=False, kind='mergesort')
     
     # Save
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -50,5 +218,6 @@ def generate_evaluation_report(
     print("\n" + "="*60)
     print("EVALUATION SUMMARY")
     print("="*60)
-    print(df.to_string(index=False))
+    # Streamed row by row rather than formatted into one string first
+    df.to_csv(sys.stdout, sep='\t', index=False)
     print("="*60 + "\n")
@@ -13,8 +13,9 @@ once per machine rather than once per run.
 
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import mygene
 import pandas as pd
@@ -35,6 +36,9 @@ ID_SCOPES = {
 #: Filename of the on-disk symbol cache inside `cache_dir`.
 SYMBOL_CACHE_FILE = "hgnc_symbols.json"
 
+#: Filename of the on-disk Entrez ID cache inside `cache_dir`.
+ENTREZ_CACHE_FILE = "entrez_ids.json"
+
 
 class IDMapper:
     """
@@ -50,8 +54,8 @@ class IDMapper:
     hgnc_file : Path, optional
         Path to HGNC complete set file.
     cache_dir : Path, optional
-        Directory for ID mapping cache. Resolved symbols are written here and
-        reloaded on the next run.
+        Directory for ID mapping cache. Resolved symbols and Entrez IDs,
+        misses included, are written here and reloaded on the next run.
     use_disk_cache : bool
         Read and write the on-disk cache. Set False to force fresh lookups.
 
@@ -90,6 +94,9 @@ class IDMapper:
         # resolved-and-not-found identifier, so it is not queried again.
         self._cache: Dict[str, Dict] = {}
 
+        # Entrez IDs resolved remotely, by symbol; None records a miss.
+        self._entrez_cache: Dict[str, Optional[int]] = {}
+
         if self.use_disk_cache:
             self.load_cache()
 
@@ -118,43 +125,72 @@ class IDMapper:
         """Path of the on-disk symbol cache."""
         return self.cache_dir / SYMBOL_CACHE_FILE
 
+    @property
+    def entrez_cache_file(self) -> Path:
+        """Path of the on-disk Entrez ID cache."""
+        return self.cache_dir / ENTREZ_CACHE_FILE
+
     def load_cache(self) -> None:
         """
-        Load previously resolved symbols from disk.
+        Load previously resolved symbols and Entrez IDs from disk.
 
         A corrupt or unreadable cache is a performance problem, not a
         correctness one, so it is logged and ignored rather than raised.
         """
-        if not self.cache_file.exists():
-            return
-
-        try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                stored = json.load(f)
-        except (OSError, json.JSONDecodeError) as e:
-            logger.warning(f"Ignoring unreadable ID cache {self.cache_file}: {e}")
-            return
-
+        stored = self._read_cache(self.cache_file)
         self._cache.update({
             key: ({'symbol': value} if value else {})
             for key, value in stored.items()
         })
 
-        logger.info(f"Loaded {len(stored)} cached identifiers from {self.cache_file}")
+        self._entrez_cache.update(self._read_cache(self.entrez_cache_file))
+
+        if stored or self._entrez_cache:
+            logger.info(
+                f"Loaded {len(stored)} cached identifiers and "
+                f"{len(self._entrez_cache)} cached Entrez IDs from {self.cache_dir}"
+            )
 
     def save_cache(self) -> None:
-        """Write resolved symbols to disk for the next run."""
+        """Write resolved symbols and Entrez IDs to disk for the next run."""
         stored = {key: value.get('symbol') for key, value in self._cache.items()}
 
+        self._write_cache(self.cache_file, stored)
+        self._write_cache(self.entrez_cache_file, self._entrez_cache)
+
+    @staticmethod
+    def _read_cache(path: Path) -> Dict[str, Any]:
+        """One JSON cache file, or {} if it is missing or unreadable."""
+        if not path.exists():
+            return {}
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable ID cache {path}: {e}")
+            return {}
+
+    def _write_cache(self, path: Path, stored: Dict[str, Any]) -> None:
+        """
+        Write one JSON cache file.
+
+        Written to a temporary file and moved into place, so an interrupted
+        run or a concurrent reader never sees a truncated cache.
+        """
+        tmp_path = path.with_name(path.name + '.tmp')
+
         try:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(stored, f)
+            os.replace(tmp_path, path)
         except OSError as e:
-            logger.warning(f"Could not write ID cache {self.cache_file}: {e}")
+            logger.warning(f"Could not write ID cache {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
             return
 
-        logger.debug(f"Cached {len(stored)} identifiers in {self.cache_file}")
+        logger.debug(f"Cached {len(stored)} identifiers in {path}")
 
     # ----------------------------------------------------------------------
     # Conversions
@@ -286,7 +322,8 @@ class IDMapper:
         Notes
         -----
         Batched for the same reason as `to_hgnc`. Symbols present in a loaded
-        HGNC table are answered locally and never reach the network.
+        HGNC table are answered locally and never reach the network, and
+        remote answers, misses included, are cached in memory and on disk.
         """
         resolved: Dict[str, Optional[int]] = {}
         unresolved = []
@@ -296,6 +333,8 @@ class IDMapper:
 
             if entrez is not None and not pd.isna(entrez):
                 resolved[symbol] = int(entrez)
+            elif symbol in self._entrez_cache:
+                resolved[symbol] = self._entrez_cache[symbol]
             else:
                 unresolved.append(symbol)
 
@@ -331,6 +370,13 @@ class IDMapper:
             entrez = None if hit.get('notfound') else hit.get('entrezgene')
             resolved[query] = int(entrez) if entrez else None
 
+        # Record the misses too, so they are not re-queried.
+        for symbol in symbols:
+            self._entrez_cache[symbol] = resolved.get(symbol)
+
+        if self.use_disk_cache:
+            self.save_cache()
+
         return resolved
 
     def harmonize_gene_list(
@@ -377,7 +423,7 @@ class IDMapper:
                 result.append(gene)
 
         if n_unmapped > 0:
-            logger.warning(f"Could not map {n_unmapped}/{len(genes)} genes")
+            logger.warning("Could not map %d/%d genes", n_unmapped, len(genes))
 
         return result
 
@@ -1,5 +1,6 @@
 """Network metrics: distances, proximities, and null models."""
 
+from syndrumnet.metrics.adjacency import CSRAdjacency, as_csr
 from syndrumnet.metrics.distances import (
     module_proximity,
     separation_score,
@@ -11,15 +12,21 @@ from syndrumnet.metrics.null_models import (
 )
 from syndrumnet.metrics.transcription import (
     compute_correlation,
+    signature_to_series,
     transcriptional_similarity,
+    transcriptional_similarity_batch,
 )
 
 __all__ = [
+    "CSRAdjacency",
+    "as_csr",
     "shortest_path_distance",
     "module_proximity",
     "separation_score",
     "compute_correlation",
+    "signature_to_series",
     "transcriptional_similarity",
+    "transcriptional_similarity_batch",
     "degree_preserving_randomization",
     "compute_zscore",
 ]
\ No newline at end of file
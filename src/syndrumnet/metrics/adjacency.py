@@ -0,0 +1,287 @@
+"""
+Integer-indexed CSR view of an interaction network.
+
+NetworkX stores a graph as nested dicts, so every step of a breadth-first
+search is a Python-level hash lookup. The distance metrics instead run on a
+compressed sparse row adjacency, where a node's neighbours are one contiguous
+slice of an integer array and shortest paths are computed in compiled code by
+`scipy.sparse.csgraph`.
+"""
+
+import logging
+import weakref
+from typing import Iterable, Optional, Sequence, Tuple
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+
+logger = logging.getLogger(__name__)
+
+
+class CSRAdjacency:
+    """
+    Unweighted CSR adjacency of a graph with a node <-> integer index.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        Network graph. Edge weights are ignored; distances count hops.
+
+    Attributes
+    ----------
+    nodes : np.ndarray
+        Node labels, position i holding the node with index i.
+    node_index : dict
+        {node: index}
+    matrix : scipy.sparse.csr_array
+        Symmetric 0/1 adjacency matrix.
+    indptr, indices : np.ndarray
+        The CSR arrays of `matrix`: the neighbours of node i are
+        ``indices[indptr[i]:indptr[i + 1]]``.
+    """
+
+    def __init__(self, G: nx.Graph) -> None:
+        """Convert the graph once."""
+        nodelist = list(G.nodes())
+
+        if nodelist:
+            matrix = nx.to_scipy_sparse_array(
+                G, nodelist=nodelist, weight=None, format='csr'
+            )
+        else:
+            # NetworkX refuses to convert a graph with no nodes
+            matrix = sparse.csr_array((0, 0), dtype=np.int64)
+
+        self._set(nodelist, matrix)
+
+    @classmethod
+    def from_edges(
+        cls,
+        nodes: Sequence,
+        edge_u: np.ndarray,
+        edge_v: np.ndarray,
+    ) -> "CSRAdjacency":
+        """
+        Build the adjacency straight from integer edge arrays.
+
+        Parameters
+        ----------
+        nodes : sequence
+            Node labels; node i is ``nodes[i]``.
+        edge_u, edge_v : np.ndarray
+            Endpoint indices of each undirected edge, each edge listed once
+            and without self-loops.
+
+        Returns
+        -------
+        CSRAdjacency
+            The same adjacency `CSRAdjacency(G)` gives for the graph of these
+            edges with nodes in this order, without building the graph.
+        """
+        n = len(nodes)
+        rows = np.concatenate([edge_u, edge_v])
+        cols = np.concatenate([edge_v, edge_u])
+        matrix = sparse.coo_array(
+            (np.ones(len(rows), dtype=np.int64), (rows, cols)), shape=(n, n)
+        ).tocsr()
+        matrix.sort_indices()
+
+        adjacency = cls.__new__(cls)
+        adjacency._set(nodes, matrix)
+        return adjacency
+
+    def _set(self, nodelist: Sequence, matrix: sparse.csr_array) -> None:
+        """Store the node labels and matrix, and derive the rest."""
+        self.nodes = np.empty(len(nodelist), dtype=object)
+        self.nodes[:] = nodelist
+        self.node_index = {node: i for i, node in enumerate(nodelist)}
+
+        self.matrix = matrix
+        self.indptr = self.matrix.indptr
+        self.indices = self.matrix.indices
+
+        logger.debug(
+            f"Built CSR adjacency: {len(nodelist)} nodes, "
+            f"{len(self.indices)} stored entries"
+        )
+
+    @property
+    def n_nodes(self) -> int:
+        """Number of nodes."""
+        return len(self.nodes)
+
+    def neighbors(self, i: int) -> np.ndarray:
+        """Indices of the neighbours of node index `i`."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def degrees(self) -> np.ndarray:
+        """Degree of every node, in index order."""
+        return np.diff(self.indptr)
+
+    def indices_of(self, genes: Iterable) -> np.ndarray:
+        """
+        Map genes to node indices, dropping any not in the network.
+
+        Parameters
+        ----------
+        genes : iterable
+            Node labels.
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the genes present, in iteration order.
+        """
+        index = self.node_index
+        return np.fromiter(
+            (index[gene] for gene in genes if gene in index), dtype=np.intp
+        )
+
+    def distances_from(self, sources: np.ndarray) -> np.ndarray:
+        """
+        Hop distances from each source to every node.
+
+        Parameters
+        ----------
+        sources : np.ndarray
+            Source node indices.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (len(sources), n_nodes); unreachable nodes are inf.
+        """
+        return csgraph.shortest_path(
+            self.matrix,
+            method='D',
+            directed=False,
+            unweighted=True,
+            indices=sources,
+        )
+
+    def nearest(self, sources: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Hop distance from every node to its nearest source, in one search.
+
+        Parameters
+        ----------
+        sources : np.ndarray
+            Source node indices.
+
+        Returns
+        -------
+        distances : np.ndarray
+            Distance from each node to the closest source; inf if none is
+            reachable.
+        origins : np.ndarray
+            Index of that closest source (one of them, on ties); negative if
+            none is reachable.
+
+        Notes
+        -----
+        A single breadth-first search seeded from all sources at once,
+        rather than one search per source and a minimum over the results.
+        """
+        distances, _, origins = csgraph.dijkstra(
+            self.matrix,
+            directed=False,
+            indices=sources,
+            unweighted=True,
+            min_only=True,
+            return_predecessors=True,
+        )
+        return distances, origins
+
+    def nearest_other(
+        self,
+        sources: np.ndarray,
+        nearest: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> np.ndarray:
+        """
+        Hop distance from each source to the closest *other* source.
+
+        Parameters
+        ----------
+        sources : np.ndarray
+            Source node indices, without duplicates.
+        nearest : tuple of np.ndarray, optional
+            `self.nearest(sources)`, if the caller already has it.
+
+        Returns
+        -------
+        np.ndarray
+            One distance per source, aligned with `sources`; inf where no
+            other source is reachable.
+
+        Notes
+        -----
+        The search from all sources partitions the reachable nodes by their
+        closest source. On a shortest path from a source s to its closest
+        other source, the first node outside s's part follows an edge
+        (u, v) from that part, and ``dist(u) + 1 + dist(v)`` is exactly the
+        path's length. No such edge gives less, so minimising over the edges
+        between parts gives every source's answer from the one search.
+        """
+        distances, origins = nearest if nearest is not None else self.nearest(sources)
+
+        rows = np.repeat(np.arange(self.n_nodes), self.degrees())
+        cols = self.indices
+        crossing = (origins[rows] >= 0) & (origins[rows] != origins[cols])
+        rows, cols = rows[crossing], cols[crossing]
+
+        best = np.full(self.n_nodes, np.inf)
+        np.minimum.at(best, origins[rows], distances[rows] + 1 + distances[cols])
+
+        return best[sources]
+
+
+#: Adjacencies already built, keyed weakly so a dropped graph frees its copy.
+_CSR_CACHE: "weakref.WeakKeyDictionary[nx.Graph, CSRAdjacency]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def as_csr(G: nx.Graph) -> CSRAdjacency:
+    """
+    Return the CSR adjacency of a graph, converting it on first use.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        Network graph.
+
+    Returns
+    -------
+    CSRAdjacency
+        Cached view of `G`.
+
+    Notes
+    -----
+    The conversion is cached per graph object, so the pipeline pays for it
+    once however many distances it computes. The cache does not track edits:
+    after modifying a graph that has already been queried, call
+    `clear_csr_cache`.
+    """
+    adjacency = _CSR_CACHE.get(G)
+    if adjacency is None:
+        adjacency = CSRAdjacency(G)
+        _CSR_CACHE[G] = adjacency
+    return adjacency
+
+
+def cache_csr(G: nx.Graph, adjacency: CSRAdjacency) -> None:
+    """
+    Register an adjacency already built for `G`, so `as_csr` returns it.
+
+    For code that builds a graph and its adjacency from the same arrays,
+    such as `NetworkBuilder.build`, and would otherwise convert twice.
+    """
+    _CSR_CACHE[G] = adjacency
+
+
+def clear_csr_cache() -> None:
+    """Drop every cached adjacency."""
+    _CSR_CACHE.clear()
+
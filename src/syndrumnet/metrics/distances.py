@@ -6,12 +6,33 @@ in Iida et al. (2024) and Guney et al. (2016).
 """
 
 import logging
-from typing import Dict, Set, Tuple
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Set, Tuple
 
 import networkx as nx
+import numpy as np
+
+from syndrumnet.metrics.adjacency import CSRAdjacency, as_csr
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 logger = logging.getLogger(__name__)
 
+#: Distances remembered per graph by `shortest_path_distance`, least recently
+#: used first out.
+DISTANCE_CACHE_SIZE = 4096
+
+#: {adjacency: OrderedDict of {call key: distance}}. Keyed weakly on the CSR
+#: adjacency rather than the graph, so `clear_csr_cache` also retires every
+#: remembered distance of a graph that has since been edited.
+_DISTANCE_CACHE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_DISTANCE_CACHE_LOCK = threading.Lock()
+
 
 def shortest_path_distance(
     G: nx.Graph,
@@ -50,56 +71,93 @@ def shortest_path_distance(
     This is the proximity measure used in Guney et al. (2016) and
     adopted by Iida et al. (2024) for disease-drug proximity.
 
+    Results are memoized per graph on the two gene sets, so repeated queries
+    (the same disease module against many drugs, or a drug's intra-module
+    term in every pair `separation_score` sees) are computed once. Like
+    `as_csr`, the memo does not track edits to the graph; `clear_csr_cache`
+    or `clear_distance_cache` resets it.
+
     For a cross-module term d(A,B) the default exclude_self=False is correct:
     a gene shared by both modules genuinely sits at distance 0. For an
     intra-module term d(A,A) it is not, which is what separation_score needs
     it for.
     """
+    adjacency = as_csr(G)
+    key = (frozenset(source_set), frozenset(target_set), infinity_value, exclude_self)
+
+    with _DISTANCE_CACHE_LOCK:
+        cache = _DISTANCE_CACHE.setdefault(adjacency, OrderedDict())
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+    avg_distance = _shortest_path_distance(
+        adjacency, source_set, target_set, infinity_value, exclude_self
+    )
+
+    with _DISTANCE_CACHE_LOCK:
+        cache[key] = avg_distance
+        if len(cache) > DISTANCE_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    return avg_distance
+
+
+def _shortest_path_distance(
+    adjacency: CSRAdjacency,
+    source_set: Set[str],
+    target_set: Set[str],
+    infinity_value: float,
+    exclude_self: bool,
+) -> float:
+    """The uncached computation behind `shortest_path_distance`."""
     # Filter to genes in network
-    source_set = source_set & set(G.nodes())
-    target_set = target_set & set(G.nodes())
+    source_idx = adjacency.indices_of(source_set)
+    target_idx = adjacency.indices_of(target_set)
 
-    if len(source_set) == 0 or len(target_set) == 0:
+    if len(source_idx) == 0 or len(target_idx) == 0:
         logger.warning("Empty source or target set after filtering to network")
         return infinity_value
 
-    total_distance = 0.0
-    counted = 0
-
-    for source in source_set:
-        # Find minimum distance to any target
-        min_dist = infinity_value
-        candidates = 0
-
-        for target in target_set:
-            if exclude_self and target == source:
-                continue
-            candidates += 1
-            try:
-                dist = nx.shortest_path_length(G, source, target)
-                min_dist = min(min_dist, dist)
-            except nx.NetworkXNoPath:
-                # Nodes are disconnected
-                pass
-
-        if candidates == 0:
-            # Single-gene module under exclude_self: there is no internal
-            # spread to measure, so it contributes nothing rather than a
-            # sentinel that would swamp the average.
-            continue
+    # One breadth-first search seeded from every target at once gives each
+    # node its distance to the nearest target, where a search per source
+    # repeated most of the same traversal |S| times.
+    nearest = adjacency.nearest(target_idx)
+    dist = nearest[0][source_idx]
 
-        total_distance += min_dist
-        counted += 1
+    if exclude_self:
+        # Genes in both sets are their own nearest target; they need the
+        # nearest *other* one instead, which the same search also yields.
+        # Overlap is found by a sorted merge of the integer codes.
+        _, in_source, in_target = np.intersect1d(
+            source_idx, target_idx, assume_unique=True, return_indices=True
+        )
+        dist[in_source] = adjacency.nearest_other(target_idx, nearest)[in_target]
 
-    if counted == 0:
+        # Single-gene module under exclude_self: there is no internal spread
+        # to measure, so it contributes nothing rather than a sentinel that
+        # would swamp the average.
+        if len(target_idx) == 1:
+            dist = np.delete(dist, in_source)
+
+    if len(dist) == 0:
         logger.debug("No comparable gene pairs; returning 0.0")
         return 0.0
 
-    avg_distance = total_distance / counted
+    # Disconnected genes are inf and fall back to the sentinel
+    min_dist = np.minimum(dist, infinity_value)
+
+    avg_distance = float(min_dist.sum()) / len(min_dist)
 
     return avg_distance
 
 
+def clear_distance_cache() -> None:
+    """Forget every distance memoized by `shortest_path_distance`."""
+    with _DISTANCE_CACHE_LOCK:
+        _DISTANCE_CACHE.clear()
+
+
 def module_proximity(
     G: nx.Graph,
     module_a: Set[str],
@@ -183,6 +241,183 @@ def separation_score(
     return s_ab
 
 
+def pairwise_separations(
+    G: nx.Graph,
+    modules: Dict[str, Set[str]],
+    pairs: List[Tuple[str, str]],
+    infinity_value: float = 1000.0,
+) -> Dict[Tuple[str, str], float]:
+    """
+    Compute `separation_score` for many module pairs at once.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        Network graph.
+    modules : dict
+        {name: gene_module}; must cover every name in `pairs`.
+    pairs : list of tuple
+        (name_a, name_b) pairs to score.
+    infinity_value : float
+        Value to use for disconnected nodes.
+
+    Returns
+    -------
+    dict
+        {(name_a, name_b): s_AB}, each equal to `separation_score` on the two
+        modules.
+
+    Notes
+    -----
+    `separation_score` runs two breadth-first searches per pair, one from
+    each module, for its cross terms. Across P pairs over D modules that is
+    2P searches of the whole graph where D suffice: here each module is
+    searched once and its nearest-distance vector kept as one row of a
+    modules x nodes matrix. The cross terms of every pair sharing a source
+    module are then a single gather from that matrix at the source's genes
+    and a mean along each row, fused into one pass when numba is installed.
+    The rows hold hop counts in the narrowest unsigned integer type that fits
+    them, normally one byte per node (see `_quantize_hops`), so the matrix
+    takes about D x nodes bytes; callers sweeping very many modules pass the
+    pairs in chunks.
+    """
+    adjacency = as_csr(G)
+    names = sorted({name for pair in pairs for name in pair})
+
+    index = {name: adjacency.indices_of(modules[name]) for name in names}
+
+    # One row per searched module: its nearest-distance vector over all nodes
+    searched = [name for name in names if len(index[name])]
+    row = {name: i for i, name in enumerate(searched)}
+    stacked = np.empty((len(searched), adjacency.n_nodes), dtype=np.float32)
+    for name in searched:
+        stacked[row[name]] = adjacency.nearest(index[name])[0]
+    hops, unreachable = _quantize_hops(stacked)
+    del stacked
+
+    # Cross terms grouped by source module: d(source, target) for all of a
+    # source's partners is one gather of the partners' rows at the source's
+    # genes and one mean along it
+    partners: Dict[str, Set[str]] = {}
+    for a, b in pairs:
+        partners.setdefault(a, set()).add(b)
+        partners.setdefault(b, set()).add(a)
+
+    between: Dict[Tuple[str, str], float] = {}
+    for source, targets in partners.items():
+        targets = sorted(targets)
+        if source in row:
+            reachable = [target for target in targets if target in row]
+        else:
+            reachable = []
+        if len(reachable) < len(targets):
+            logger.warning("Empty source or target set after filtering to network")
+            for target in targets:
+                between[(source, target)] = infinity_value
+        if not reachable:
+            continue
+
+        # d(source, target) as `_shortest_path_distance` computes it
+        means = _mean_hops(
+            hops,
+            np.array([row[target] for target in reachable], dtype=np.intp),
+            index[source],
+            unreachable,
+            infinity_value,
+        )
+        between.update(zip(((source, target) for target in reachable), means.tolist()))
+
+    # Intra-module terms are per module; the memo already shares them
+    within = {
+        name: shortest_path_distance(
+            G, modules[name], modules[name], infinity_value, exclude_self=True
+        )
+        for name in names
+    }
+
+    return {
+        (a, b): (between[(a, b)] + between[(b, a)]) / 2 - (within[a] + within[b]) / 2
+        for a, b in pairs
+    }
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _mean_hops_kernel(hops, rows, cols, unreachable, infinity_value, out):
+        """
+        Fused gather and mean: ``out[i]`` is the mean of ``hops[rows[i], cols]``
+        with `unreachable` read as, and every value capped at,
+        `infinity_value`. Each row is summed in `cols` order.
+
+        Serial, like `_prince_step`: it runs inside the predictor's pair
+        workers, where a numba thread pool per process would oversubscribe
+        the cores, and its threads do not survive the fork those workers
+        are started with.
+        """
+        for i in range(len(rows)):
+            line = hops[rows[i]]
+            total = 0.0
+            for j in range(len(cols)):
+                value = line[cols[j]]
+                if value == unreachable:
+                    total += infinity_value
+                else:
+                    total += min(float(value), infinity_value)
+            out[i] = total / len(cols)
+else:
+    _mean_hops_kernel = None
+
+
+def _mean_hops(
+    hops: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    unreachable: int,
+    infinity_value: float,
+) -> np.ndarray:
+    """
+    Mean capped hop distance along each of `rows` of `hops`, at `cols`.
+
+    With numba installed this is one fused pass (`_mean_hops_kernel`) that
+    never materializes the rows x cols block; otherwise the block is
+    gathered and reduced with NumPy. Values are whole numbers, so both sum
+    exactly and agree.
+    """
+    if _mean_hops_kernel is not None:
+        out = np.empty(len(rows), dtype=np.float64)
+        _mean_hops_kernel(hops, rows, cols, unreachable, float(infinity_value), out)
+        return out
+
+    block = hops[np.ix_(rows, cols)]
+    dist = np.minimum(
+        np.where(block == unreachable, infinity_value, block.astype(np.float64)),
+        infinity_value,
+    )
+    return dist.sum(axis=1) / dist.shape[1]
+
+
+def _quantize_hops(distances: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Store hop distances in the narrowest unsigned integer type that fits.
+
+    Returns the converted array and its sentinel for unreachable nodes, the
+    type's largest value, which takes the place of inf. Protein interaction
+    networks have diameters of a few tens of hops, so this is nearly always
+    uint8 and a quarter the size of float32.
+    """
+    reachable = np.isfinite(distances)
+    longest = int(distances[reachable].max()) if reachable.any() else 0
+
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        sentinel = int(np.iinfo(dtype).max)
+        if longest < sentinel:
+            break
+
+    hops = np.full(distances.shape, sentinel, dtype=dtype)
+    hops[reachable] = distances[reachable]
+    return hops, sentinel
+
+
 def compute_all_pairwise_distances(
     G: nx.Graph,
     gene_set: Set[str],
@@ -200,19 +435,21 @@ def compute_all_pairwise_distances(
     Returns
     -------
     dict
-        {(gene_i, gene_j): distance}
+        {(gene_i, gene_j): distance} for every ordered pair of genes in the
+        network that are connected, each gene with itself at 0.
     """
-    genes = list(gene_set & set(G.nodes()))
-    distances = {}
-    
-    # Use NetworkX all pairs shortest path for efficiency
-    lengths = dict(nx.all_pairs_shortest_path_length(G))
-    
-    for i, gene_i in enumerate(genes):
-        for gene_j in genes[i:]:
-            if gene_i in lengths and gene_j in lengths[gene_i]:
-                dist = lengths[gene_i][gene_j]
-                distances[(gene_i, gene_j)] = dist
-                distances[(gene_j, gene_i)] = dist
-    
-    return distances
+    adjacency = as_csr(G)
+    gene_idx = adjacency.indices_of(gene_set)
+
+    # One compiled BFS per gene of the set, read back at the set's own
+    # columns, instead of all-pairs lengths over the whole network.
+    dist = adjacency.distances_from(gene_idx)[:, gene_idx]
+
+    # Unreachable pairs are left out, as before
+    rows, cols = np.nonzero(np.isfinite(dist))
+    genes = adjacency.nodes[gene_idx]
+
+    return dict(zip(
+        zip(genes[rows].tolist(), genes[cols].tolist()),
+        dist[rows, cols].astype(int).tolist(),
+    ))
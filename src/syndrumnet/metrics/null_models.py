@@ -6,12 +6,15 @@ significance testing of proximity scores.
 """
 
 import logging
-import random
+import weakref
 from typing import Dict, List, Optional, Set, Tuple
 
 import networkx as nx
 import numpy as np
 
+from syndrumnet.metrics.adjacency import CSRAdjacency, as_csr
+from syndrumnet.utils.seeds import get_rng
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,46 +52,190 @@ def degree_preserving_randomization(
     This is the standard approach for network proximity null models
     (Guney et al., 2016; Iida et al., 2024).
     """
-    if seed is not None:
-        random.seed(seed)
-        np.random.seed(seed)
-    
-    # Filter module to genes in network
-    module = module & set(G.nodes())
-    module_size = len(module)
+    drawn = _draw_random_modules(G, module, n_random, seed)
+    if drawn is None:
+        return []
+
+    names = as_csr(G).nodes[drawn]
+    return [set(row) for row in names.tolist()]
+
+
+def _draw_random_modules(
+    G: nx.Graph,
+    module: Set[str],
+    n_random: int,
+    seed: Optional[int],
+) -> Optional[np.ndarray]:
+    """
+    Draw degree-matched random modules as node indices.
+
+    The work behind `degree_preserving_randomization`, which converts the
+    result to gene sets. Returns an array of shape (n_random, module size)
+    whose rows are the random modules (a row may repeat a node), or None if
+    no module gene is in the network.
+    """
+    # Filter module to genes in network, in node order so the draws do not
+    # depend on set iteration order
+    degree_bins = _degree_bins(G)
+    module_idx = np.sort(degree_bins.adjacency.indices_of(module))
+    module_size = len(module_idx)
     
     if module_size == 0:
         logger.warning("Empty module after filtering to network")
-        return []
-    
-    # Build degree bins
-    degrees = dict(G.degree())
-    degree_bins, bin_edges = _build_degree_bins(degrees, n_bins=20)
-
-    # Get degree bin for each gene in module. _get_bin is deterministic and is
-    # the same function that populated degree_bins, so every index produced here
-    # is guaranteed to point at a non-empty bin.
-    module_bins = [_get_bin(degrees[gene], bin_edges) for gene in module]
-    
-    # Generate random modules
-    random_modules = []
+        return None
 
-    for _ in range(n_random):
-        random_module = set()
-        
-        for bin_idx in module_bins:
-            # Sample from same degree bin
-            candidates = degree_bins[bin_idx]
-            
-            if len(candidates) > 0:
-                gene = random.choice(candidates)
-                random_module.add(gene)
-        
-        random_modules.append(random_module)
-    
-    logger.debug(f"Generated {n_random} random modules of size {module_size}")
-    
-    return random_modules
+    return _draw_from_bins(
+        degree_bins, degree_bins.bin_of_node[module_idx], n_random, get_rng(seed)
+    )
+
+
+def _draw_from_bins(
+    degree_bins: "_DegreeBins",
+    module_bins: np.ndarray,
+    n_random: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Draw random modules with one node from each of the given degree bins.
+
+    Returns the (n_random, len(module_bins)) array of node indices, drawn
+    from `rng`.
+    """
+    module_size = len(module_bins)
+
+    # Every draw at once: for each random module and each module gene, a
+    # uniform pick among the nodes of that gene's degree bin. A gene's own
+    # bin always holds at least the gene itself.
+    bin_sizes = degree_bins.bin_sizes[module_bins]
+    picks = (rng.random((n_random, module_size)) * bin_sizes).astype(np.intp)
+    drawn = degree_bins.members[degree_bins.bin_starts[module_bins] + picks]
+
+    logger.debug("Generated %d random modules of size %d", n_random, module_size)
+
+    return drawn
+
+
+def degree_profile(G: nx.Graph, module: Set[str]) -> Tuple[int, ...]:
+    """
+    Degree bins of a module's genes, sorted.
+
+    Two modules with the same profile have the same degree-preserving null
+    distribution: `_draw_random_modules` draws one node from each gene's bin,
+    whatever the genes themselves are. Genes not in the network are dropped,
+    as they are there.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        Network graph.
+    module : set
+        Gene module.
+
+    Returns
+    -------
+    tuple of int
+        One bin index per module gene in the network, ascending.
+    """
+    degree_bins = _degree_bins(G)
+    module_idx = degree_bins.adjacency.indices_of(module)
+    return tuple(np.sort(degree_bins.bin_of_node[module_idx]).tolist())
+
+
+def null_proximity_moments(
+    G: nx.Graph,
+    disease_module: Set[str],
+    profile: Tuple[int, ...],
+    n_random: int = 1000,
+    seed: Optional[int] = None,
+) -> Tuple[float, float]:
+    """
+    Mean and standard deviation of the disease proximity of random modules.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        Network graph.
+    disease_module : set
+        Disease gene module.
+    profile : tuple of int
+        Degree profile of the drug modules being scored, from `degree_profile`.
+    n_random : int
+        Number of randomizations.
+    seed : int, optional
+        Random seed.
+
+    Returns
+    -------
+    tuple
+        (null_mean, null_std), or (0.0, 0.0) for an empty profile.
+
+    Notes
+    -----
+    The null that `compute_normalized_proximity` draws for one drug, computed
+    from the profile alone so that it can be shared by every drug with that
+    profile. It is the same distribution, not the same sample: the draws are
+    seeded by the caller rather than by each drug's module.
+    """
+    if len(profile) == 0:
+        logger.warning("Empty module after filtering to network")
+        return 0.0, 0.0
+
+    drawn = _draw_from_bins(
+        _degree_bins(G), np.asarray(profile, dtype=np.intp), n_random, get_rng(seed)
+    )
+    null_proximities = _null_proximities(G, disease_module, drawn)
+
+    return float(np.mean(null_proximities)), float(np.std(null_proximities))
+
+
+class _DegreeBins:
+    """
+    Degree strata of a graph's nodes, as integer arrays.
+
+    Attributes
+    ----------
+    adjacency : CSRAdjacency
+        The graph's adjacency; node indices below refer to it.
+    bin_of_node : np.ndarray
+        Degree bin of every node.
+    members : np.ndarray
+        Node indices grouped by bin, bin 0 first.
+    bin_starts, bin_sizes : np.ndarray
+        Where each bin's nodes start in `members`, and how many there are.
+    """
+
+    def __init__(self, G: nx.Graph, n_bins: int = 20) -> None:
+        self.adjacency = as_csr(G)
+        degrees = self.adjacency.degrees()
+
+        bin_edges = _degree_bin_edges(degrees, n_bins)
+        self.bin_of_node = _get_bins(degrees, bin_edges)
+
+        # Stable, so each bin lists its nodes in index order
+        self.members = np.argsort(self.bin_of_node, kind='stable').astype(np.intp)
+        self.bin_sizes = np.bincount(self.bin_of_node, minlength=n_bins).astype(np.intp)
+        self.bin_starts = np.concatenate([[0], np.cumsum(self.bin_sizes)[:-1]])
+
+
+#: Degree bins already built, keyed weakly by graph like the CSR cache.
+_DEGREE_BINS: "weakref.WeakKeyDictionary[nx.Graph, _DegreeBins]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _degree_bins(G: nx.Graph) -> _DegreeBins:
+    """
+    Degree bins of a graph, computed on first use.
+
+    The stratification depends only on the graph, so it is built once and
+    shared by every randomization instead of being rebuilt per call. Like
+    `as_csr`, the cache does not track edits to the graph.
+    """
+    degree_bins = _DEGREE_BINS.get(G)
+    if degree_bins is None:
+        degree_bins = _DegreeBins(G)
+        _DEGREE_BINS[G] = degree_bins
+    return degree_bins
 
 
 def _build_degree_bins(
@@ -120,27 +267,43 @@ def _build_degree_bins(
     and some bins come out empty; that is harmless, because _get_bin is
     deterministic and never assigns a gene to a bin it did not itself fill.
     """
-    # Get degree percentiles
-    degree_values = sorted(degrees.values())
-    percentiles = np.linspace(0, 100, n_bins + 1)
-    bin_edges = np.percentile(degree_values, percentiles)
+    genes = np.empty(len(degrees), dtype=object)
+    genes[:] = list(degrees)
+    degree_values = np.fromiter(degrees.values(), dtype=float, count=len(degrees))
 
-    # Assign genes to bins
-    bins: List[List[str]] = [[] for _ in range(n_bins)]
+    bin_edges = _degree_bin_edges(degree_values, n_bins)
+    bin_idx = _get_bins(degree_values, bin_edges)
 
-    for gene, degree in degrees.items():
-        bin_idx = _get_bin(degree, bin_edges)
-        bins[bin_idx].append(gene)
+    # Group genes by bin in one stable sort, keeping their order within a bin
+    order = np.argsort(bin_idx, kind='stable')
+    bounds = np.cumsum(np.bincount(bin_idx, minlength=n_bins))[:-1]
+    bins: List[List[str]] = [part.tolist() for part in np.split(genes[order], bounds)]
 
     return bins, bin_edges
 
 
+def _degree_bin_edges(degrees: np.ndarray, n_bins: int) -> np.ndarray:
+    """Percentile boundaries splitting the degrees into `n_bins` strata."""
+    return np.percentile(degrees, np.linspace(0, 100, n_bins + 1))
+
+
+def _get_bins(degrees: np.ndarray, bin_edges: np.ndarray) -> np.ndarray:
+    """
+    Bin index of each degree, as `_get_bin` assigns it, in one search.
+
+    A degree falls in the last bin i with ``bin_edges[i] <= degree``, which
+    with duplicated edges is the only non-empty interval containing it.
+    Degrees outside [first edge, last edge) go to the last bin.
+    """
+    n_bins = len(bin_edges) - 1
+    bin_idx = np.searchsorted(bin_edges, degrees, side='right') - 1
+    bin_idx[(bin_idx < 0) | (bin_idx >= n_bins)] = n_bins - 1
+    return bin_idx
+
+
 def _get_bin(degree: int, bin_edges: np.ndarray) -> int:
     """Get bin index for a degree value."""
-    for i in range(len(bin_edges) - 1):
-        if bin_edges[i] <= degree < bin_edges[i + 1]:
-            return i
-    return len(bin_edges) - 2  # Last bin
+    return int(_get_bins(np.array([degree]), bin_edges)[0])
 
 
 def compute_zscore(
@@ -208,26 +371,142 @@ def compute_normalized_proximity(
     tuple
         (raw_proximity, z_score, p_value)
     """
-    from syndrumnet.metrics.distances import shortest_path_distance
+    # Observed proximity, d(disease, drug) as `shortest_path_distance`
+    # computes it, read from the disease's cached distances rather than
+    # searching the graph again from the drug
+    observed = _observed_proximity(G, disease_module, drug_module)
     
-    # Observed proximity
-    observed = shortest_path_distance(G, disease_module, drug_module)
-    
-    # Generate random modules
-    random_drug_modules = degree_preserving_randomization(
-        G, drug_module, n_random, seed
-    )
-    
-    # Compute null distribution
-    null_proximities = []
-    for random_module in random_drug_modules:
-        null_prox = shortest_path_distance(G, disease_module, random_module)
-        null_proximities.append(null_prox)
+    # Null distribution: the proximity of the disease module to each
+    # degree-matched random drug module
+    drawn = _draw_random_modules(G, drug_module, n_random, seed)
+    if drawn is None:
+        null_proximities = np.zeros(0)
+    else:
+        null_proximities = _null_proximities(G, disease_module, drawn)
     
     # Z-score
     z = compute_zscore(observed, null_proximities)
     
     # Empirical p-value (one-tailed: observed < null)
-    p_value = np.mean([null_p <= observed for null_p in null_proximities])
+    p_value = np.mean(null_proximities <= observed)
     
-    return observed, z, p_value
\ No newline at end of file
+    return observed, z, p_value
+
+
+def _observed_proximity(
+    G: nx.Graph,
+    disease_module: Set[str],
+    drug_module: Set[str],
+    infinity_value: float = 1000.0,
+) -> float:
+    """
+    `shortest_path_distance(G, disease_module, drug_module)` from the disease
+    distances `_null_proximities` already holds.
+
+    Each disease gene's distance to the drug is the minimum of its row over
+    the drug's columns, so no search from the drug module is needed; in a
+    sweep of many drugs against one disease the only searches left are the
+    disease's own, run once.
+    """
+    adjacency = as_csr(G)
+    dist = _disease_distances(adjacency, disease_module)
+    drug_idx = adjacency.indices_of(drug_module)
+
+    if len(dist) == 0 or len(drug_idx) == 0:
+        logger.warning("Empty source or target set after filtering to network")
+        return infinity_value
+
+    nearest = np.minimum(dist[:, drug_idx].min(axis=1), infinity_value)
+    return float(nearest.sum()) / len(nearest)
+
+
+#: Distance entries gathered at once when scoring random modules; bounds the
+#: temporary (disease genes x random modules x module size) block.
+NULL_BLOCK_ELEMENTS = 1 << 22
+
+
+def _null_proximities(
+    G: nx.Graph,
+    disease_module: Set[str],
+    drawn: np.ndarray,
+    infinity_value: float = 1000.0,
+) -> np.ndarray:
+    """
+    Proximity of the disease module to each of a batch of random modules.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        Network graph.
+    disease_module : set
+        Disease gene module.
+    drawn : np.ndarray
+        Random modules as node index rows, from `_draw_random_modules`.
+    infinity_value : float
+        Value to use for disconnected nodes.
+
+    Returns
+    -------
+    np.ndarray
+        One value per row of `drawn`, each equal to
+        `shortest_path_distance(G, disease_module, random_module)`.
+
+    Notes
+    -----
+    The disease side is the same in every randomization, so its distances to
+    all nodes are computed once, one search per disease gene. Each random
+    module's proximity is then a gather of its columns and a minimum, rather
+    than a fresh graph search per randomization. The distances are also kept
+    for the next call, so a sweep of many drugs against one disease searches
+    from the disease once in total rather than once per drug.
+    """
+    dist = _disease_distances(as_csr(G), disease_module)
+
+    if len(dist) == 0:
+        logger.warning("Empty source or target set after filtering to network")
+        return np.full(len(drawn), infinity_value)
+
+    n_disease = len(dist)
+
+    null_proximities = np.empty(len(drawn))
+    block = max(1, NULL_BLOCK_ELEMENTS // (n_disease * drawn.shape[1]))
+
+    for start in range(0, len(drawn), block):
+        rows = drawn[start:start + block]
+        # (disease genes, modules, module genes) -> nearest module gene
+        nearest = dist[:, rows].min(axis=2)
+        null_proximities[start:start + block] = (
+            np.minimum(nearest, infinity_value).sum(axis=0) / n_disease
+        )
+
+    return null_proximities
+
+
+#: {adjacency: (disease module, its distance matrix)} for the most recent
+#: disease module scored on each graph. One entry, because a sweep scores
+#: every drug against one disease before moving to the next, and the matrix
+#: is (disease genes x nodes).
+_DISEASE_DISTANCES: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _disease_distances(adjacency: CSRAdjacency, disease_module: Set[str]) -> np.ndarray:
+    """
+    Hop distances from each disease gene in the network to every node.
+
+    Returns the (disease genes, n_nodes) array, with no rows if no disease
+    gene is in the network; reused while consecutive calls pass the same
+    module on the same graph.
+    """
+    key = frozenset(disease_module)
+    cached = _DISEASE_DISTANCES.get(adjacency)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    disease_idx = adjacency.indices_of(key)
+    if len(disease_idx) == 0:
+        dist = np.empty((0, adjacency.n_nodes))
+    else:
+        dist = adjacency.distances_from(disease_idx)
+
+    _DISEASE_DISTANCES[adjacency] = (key, dist)
+    return dist
@@ -6,17 +6,45 @@ for the CQAB component of the prediction score.
 """
 
 import logging
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Union
 
 import numpy as np
-from scipy.stats import pearsonr, spearmanr
+import pandas as pd
+from scipy.stats import rankdata
 
 logger = logging.getLogger(__name__)
 
+#: A gene expression signature: {gene: fold_change}, or the same as a Series
+#: indexed by gene.
+Signature = Union[Dict[str, float], pd.Series]
+
+
+def signature_to_series(signature: Signature) -> pd.Series:
+    """
+    Convert a signature to a float Series indexed by gene.
+
+    Callers that correlate one signature against many others (a disease
+    against every drug) should convert it once with this and pass the Series,
+    so its gene index and hash table are built a single time.
+
+    Parameters
+    ----------
+    signature : dict or pd.Series
+        {gene: fold_change}. A Series is returned as is.
+
+    Returns
+    -------
+    pd.Series
+        Fold changes indexed by gene.
+    """
+    if isinstance(signature, pd.Series):
+        return signature
+    return pd.Series(signature, dtype=float)
+
 
 def compute_correlation(
-    signature_a: Dict[str, float],
-    signature_b: Dict[str, float],
+    signature_a: Signature,
+    signature_b: Signature,
     method: str = 'spearman',
 ) -> float:
     """
@@ -24,9 +52,9 @@ def compute_correlation(
     
     Parameters
     ----------
-    signature_a : dict
+    signature_a : dict or pd.Series
         {gene: fold_change} for signature A.
-    signature_b : dict
+    signature_b : dict or pd.Series
         {gene: fold_change} for signature B.
     method : str
         Correlation method ('spearman' or 'pearson').
@@ -38,24 +66,32 @@ def compute_correlation(
         
     Notes
     -----
-    Only genes present in both signatures are used for correlation.
+    Only genes present in both signatures are used for correlation. They
+    are matched by an index lookup of B's genes in A's, not a Python loop
+    over a set intersection.
     """
-    # Find common genes
-    common_genes = set(signature_a.keys()) & set(signature_b.keys())
+    series_a = signature_to_series(signature_a)
+    series_b = signature_to_series(signature_b)
+
+    # Position of each of B's genes in A, -1 where A lacks it
+    positions = series_a.index.get_indexer(series_b.index)
+    common = positions >= 0
+    n_common = int(common.sum())
     
-    if len(common_genes) < 3:
-        logger.warning(f"Only {len(common_genes)} common genes for correlation")
+    if n_common < 3:
+        logger.warning("Only %d common genes for correlation", n_common)
         return 0.0
     
     # Extract values for common genes
-    values_a = np.array([signature_a[g] for g in common_genes])
-    values_b = np.array([signature_b[g] for g in common_genes])
+    values_a = series_a.to_numpy(dtype=float)[positions[common]]
+    values_b = series_b.to_numpy(dtype=float)[common]
     
-    # Compute correlation
+    # Compute correlation. Spearman is Pearson on average ranks; the ranks
+    # are taken over the common genes only, as spearmanr does.
     if method == 'spearman':
-        corr, _ = spearmanr(values_a, values_b)
+        corr = _pearson(rankdata(values_a), rankdata(values_b))
     elif method == 'pearson':
-        corr, _ = pearsonr(values_a, values_b)
+        corr = _pearson(values_a, values_b)
     else:
         raise ValueError(f"Unknown correlation method: {method}")
     
@@ -66,8 +102,27 @@ def compute_correlation(
     return corr
 
 
+def _pearson(values_a: np.ndarray, values_b: np.ndarray) -> float:
+    """
+    Pearson correlation coefficient alone.
+
+    `scipy.stats.pearsonr` and `spearmanr` also compute a p-value from the
+    t distribution, which is discarded here and dominates the cost of a
+    call. NaN if either array is constant.
+    """
+    centred_a = values_a - values_a.mean()
+    centred_b = values_b - values_b.mean()
+
+    denominator = np.sqrt((centred_a @ centred_a) * (centred_b @ centred_b))
+    if denominator == 0:
+        return np.nan
+
+    # Rounding can carry a perfect correlation just past +/-1
+    return float(np.clip((centred_a @ centred_b) / denominator, -1.0, 1.0))
+
+
 def transcriptional_similarity(
-    disease_signature: Dict[str, float],
+    disease_signature: Signature,
     drug_signature_up: Set[str],
     drug_signature_down: Set[str],
     inverse_correlation: bool = True,
@@ -79,7 +134,7 @@ def transcriptional_similarity(
     
     Parameters
     ----------
-    disease_signature : dict
+    disease_signature : dict or pd.Series
         Disease expression signature {gene: fold_change}.
     drug_signature_up : set
         Drug up-regulated genes.
@@ -98,12 +153,11 @@ def transcriptional_similarity(
     For synergy prediction, we expect drugs to have INVERSE correlation
     with disease (i.e., drugs reverse the disease signature).
     """
-    # Convert drug signature to signed dictionary
-    drug_sig = {}
-    for gene in drug_signature_up:
-        drug_sig[gene] = 1.0
-    for gene in drug_signature_down:
-        drug_sig[gene] = -1.0
+    # Signed drug signature; a gene in both sets counts as down
+    drug_sig = {
+        **dict.fromkeys(drug_signature_up, 1.0),
+        **dict.fromkeys(drug_signature_down, -1.0),
+    }
     
     # Compute correlation
     corr = compute_correlation(disease_signature, drug_sig, method='spearman')
@@ -115,6 +169,120 @@ def transcriptional_similarity(
     return corr
 
 
+def transcriptional_similarity_batch(
+    disease_signature: Signature,
+    drug_signatures: Dict[str, Dict[str, Set[str]]],
+    inverse_correlation: bool = True,
+) -> Dict[str, float]:
+    """
+    Transcriptional similarity of every drug to one disease, in one pass.
+
+    Parameters
+    ----------
+    disease_signature : dict or pd.Series
+        Disease expression signature {gene: fold_change}.
+    drug_signatures : dict
+        {drug_name: {'up': set, 'down': set}}
+    inverse_correlation : bool
+        If True, compute -correlation (drug reversal of disease).
+
+    Returns
+    -------
+    dict
+        {drug_name: score}, each equal to `transcriptional_similarity` for
+        that drug.
+
+    Notes
+    -----
+    A drug signature is +1/-1 per gene, so its Spearman correlation with the
+    disease reduces to a Pearson correlation between the disease values'
+    ranks, taken among the genes that drug shares with the disease, and the
+    signs themselves: ranking a two-valued array is an affine map of it.
+    All drugs' (gene, sign) entries are laid end to end, ranked per drug by
+    one sort, and reduced per drug with `np.bincount`, replacing a
+    correlation call per drug.
+    """
+    disease = signature_to_series(disease_signature)
+    drugs = list(drug_signatures)
+
+    # Every drug's signed genes, one entry per (drug, gene); a gene in both
+    # sets counts as down, as in `transcriptional_similarity`
+    genes = []
+    signs = []
+    counts = []
+    for drug in drugs:
+        signed = {
+            **dict.fromkeys(drug_signatures[drug]['up'], 1.0),
+            **dict.fromkeys(drug_signatures[drug]['down'], -1.0),
+        }
+        genes.extend(signed)
+        signs.extend(signed.values())
+        counts.append(len(signed))
+
+    owner = np.repeat(np.arange(len(drugs)), counts)
+    positions = disease.index.get_indexer(pd.Index(genes, dtype=object))
+    common = positions >= 0
+
+    owner = owner[common]
+    values = disease.to_numpy(dtype=float)[positions[common]]
+    signs = np.asarray(signs, dtype=float)[common]
+
+    n_drugs = len(drugs)
+    n_common = np.bincount(owner, minlength=n_drugs)
+    has_nan = np.bincount(owner, weights=np.isnan(values), minlength=n_drugs) > 0
+
+    # Average ranks of the disease values within each drug's shared genes:
+    # sort by (drug, value), then give each run of equal values the mean of
+    # the ranks it spans
+    order = np.lexsort((values, owner))
+    sorted_owner = owner[order]
+    sorted_values = values[order]
+
+    group_start = np.concatenate([[0], np.cumsum(n_common)[:-1]])
+    new_run = np.ones(len(order), dtype=bool)
+    new_run[1:] = (sorted_owner[1:] != sorted_owner[:-1]) | (
+        sorted_values[1:] != sorted_values[:-1]
+    )
+    run_starts = np.flatnonzero(new_run)
+    run_lengths = np.diff(np.append(run_starts, len(order)))
+    run_ranks = (
+        run_starts - group_start[sorted_owner[run_starts]] + (run_lengths + 1) / 2
+    )
+
+    ranks = np.empty(len(order))
+    ranks[order] = np.repeat(run_ranks, run_lengths)
+
+    # Pearson per drug on centred values; ranks of n values always average
+    # (n + 1) / 2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        centred_ranks = ranks - (n_common[owner] + 1) / 2
+        sign_means = np.bincount(owner, weights=signs, minlength=n_drugs) / n_common
+        centred_signs = signs - sign_means[owner]
+
+        covariance = np.bincount(
+            owner, weights=centred_ranks * centred_signs, minlength=n_drugs
+        )
+        rank_ss = np.bincount(owner, weights=centred_ranks ** 2, minlength=n_drugs)
+        sign_ss = np.bincount(owner, weights=centred_signs ** 2, minlength=n_drugs)
+
+        corr = np.clip(covariance / np.sqrt(rank_ss * sign_ss), -1.0, 1.0)
+
+    # As in `compute_correlation`: too few shared genes, a constant array
+    # or a missing value give 0.0
+    too_few = n_common < 3
+    if too_few.any():
+        logger.warning(
+            f"{int(too_few.sum())}/{n_drugs} drugs share fewer than 3 genes "
+            f"with the disease signature; their correlation is 0.0"
+        )
+    corr[too_few | has_nan | np.isnan(corr)] = 0.0
+
+    if inverse_correlation:
+        corr = -corr
+
+    return dict(zip(drugs, corr.tolist()))
+
+
 def aggregate_transcriptional_scores(
     scores: List[float],
     method: str = 'mean',
@@ -7,6 +7,11 @@ Measures correlation between disease and drug expression signatures.
 import logging
 from typing import Dict, List, Set, Tuple
 
+from syndrumnet.metrics.transcription import (
+    transcriptional_similarity,
+    transcriptional_similarity_batch,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,8 +48,6 @@ def compute_cqab(
     tuple
         (cqab_score, cqa_score, cqb_score)
     """
-    from syndrumnet.metrics.transcription import transcriptional_similarity
-    
     logger.debug("Computing CQAB")
     
     # Compute transcriptional similarities (inverse correlation)
@@ -65,7 +68,7 @@ def compute_cqab(
     # Average
     cqab = (c_qa + c_qb) / 2
     
-    logger.debug(f"CQAB: C_QA={c_qa:.3f}, C_QB={c_qb:.3f}, CQAB={cqab:.3f}")
+    logger.debug("CQAB: C_QA=%.3f, C_QB=%.3f, CQAB=%.3f", c_qa, c_qb, cqab)
     
     return cqab, c_qa, c_qb
 
@@ -97,19 +100,14 @@ def compute_cqab_batch(
     Like P_QA, C_QA depends only on the disease and one drug, so it is computed
     once per drug and reused across every pair that drug appears in.
     """
-    from syndrumnet.metrics.transcription import transcriptional_similarity
-
     needed = {drug for pair in drug_pairs for drug in pair if drug in drug_signatures}
 
-    similarities: Dict[str, float] = {
-        drug: transcriptional_similarity(
-            disease_signature,
-            drug_signatures[drug]['up'],
-            drug_signatures[drug]['down'],
-            inverse_correlation=True,
-        )
-        for drug in sorted(needed)
-    }
+    # Every needed drug against the disease in one vectorized pass
+    similarities: Dict[str, float] = transcriptional_similarity_batch(
+        disease_signature,
+        {drug: drug_signatures[drug] for drug in sorted(needed)},
+        inverse_correlation=True,
+    )
 
     results = {}
 
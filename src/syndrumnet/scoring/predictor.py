@@ -5,19 +5,89 @@ Orchestrates computation of all scoring components and combines them
 into final prediction scores.
 """
 
+import itertools
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import networkx as nx
+import numpy as np
 import pandas as pd
 
+from syndrumnet.metrics.adjacency import as_csr
 from syndrumnet.scoring.cqab import compute_cqab_batch
-from syndrumnet.scoring.pqab import compute_pqab_batch, proximity_zscore
+from syndrumnet.scoring.pqab import (
+    compute_pqab_batch,
+    proximity_zscore,
+    shared_null_zscores,
+)
 from syndrumnet.scoring.tqab import compute_tqab_batch
+from syndrumnet.utils.parallel import fork_context
 
 logger = logging.getLogger(__name__)
 
+#: Pair chunks per worker when TQAB is sharded; several per worker keeps the
+#: load balanced when some drugs' modules are much larger than others.
+CHUNKS_PER_WORKER = 4
+
+#: (network, disease module, drug modules, z-scores, separations) a pair
+#: worker scores against, set once by `_init_pair_worker`.
+_PAIR_STATE = None
+
+
+def _init_pair_worker(
+    network: nx.Graph,
+    disease_module: Set[str],
+    drug_module_sets: Dict[str, Set[str]],
+    zscores: Dict[str, float],
+    separations: Dict[Tuple[str, str], float],
+) -> None:
+    """Hand the state shared by every pair chunk to a worker process."""
+    global _PAIR_STATE
+    _PAIR_STATE = (network, disease_module, drug_module_sets, zscores, separations)
+
+
+def _tqab_chunk(drug_pairs: List[Tuple[str, str]]) -> Tuple[dict, dict]:
+    """
+    TQAB for one chunk of drug pairs, in a worker process.
+
+    Returns the chunk's results and the separations it had to compute, for
+    the parent to add to its cache.
+    """
+    network, disease_module, drug_module_sets, zscores, known = _PAIR_STATE
+    separations = {pair: known[pair] for pair in drug_pairs if pair in known}
+    results = compute_tqab_batch(
+        network,
+        disease_module,
+        drug_module_sets,
+        drug_pairs,
+        proximity_zscores=zscores,
+        separations=separations,
+    )
+    new = {pair: s_ab for pair, s_ab in separations.items() if pair not in known}
+    return results, new
+
+
+def _columns(results: dict, drug_pairs: List[Tuple[str, str]], default: tuple) -> tuple:
+    """
+    One column per field of a component's per-pair results, in pair order.
+
+    Fields whose default is a float are filled into preallocated float64
+    arrays, the rest into object arrays.
+    """
+    rows = [results.get(pair, default) for pair in drug_pairs]
+    columns = []
+    for field, fill in enumerate(default):
+        values = (row[field] for row in rows)
+        if isinstance(fill, float):
+            column = np.fromiter(values, dtype=np.float64, count=len(rows))
+        else:
+            column = np.empty(len(rows), dtype=object)
+            column[:] = list(values)
+        columns.append(column)
+    return tuple(columns)
+
 
 class SynergyPredictor:
     """
@@ -31,11 +101,22 @@ class SynergyPredictor:
     Parameters
     ----------
     network : nx.Graph
-        Molecular interaction network.
+        Molecular interaction network. Treated as immutable once the
+        predictor is built: its CSR adjacency, and the drug-pair separations
+        computed on it, are cached and shared by every disease.
     n_randomizations : int
         Number of randomizations for proximity z-scores.
     seed : int
         Random seed for reproducibility.
+    n_workers : int
+        Processes to shard the drug-pair sweep of `predict_all` over. The
+        default of 1 scores every pair in this process.
+    shared_null : bool
+        Opt in to null distributions shared by drugs with the same degree
+        profile, via `shared_null_zscores`. Fewer null-model runs when many
+        drug modules share a profile, but the z-scores, and so the scores, are
+        statistically equivalent to the default per-drug nulls rather than
+        identical to them.
         
     Examples
     --------
@@ -51,14 +132,25 @@ class SynergyPredictor:
         network: nx.Graph,
         n_randomizations: int = 1000,
         seed: int = 42,
+        n_workers: int = 1,
+        shared_null: bool = False,
     ) -> None:
         """Initialize predictor."""
         self.network = network
+        # Convert to CSR up front: every distance query reuses it, and worker
+        # processes forked from here inherit it rather than rebuilding it.
+        self.adjacency = as_csr(network)
         self.n_randomizations = n_randomizations
         self.seed = seed
+        self.n_workers = n_workers
+        self.shared_null = shared_null
         
         self.disease_modules: Optional[Dict[str, Set[str]]] = None
         self.drug_modules: Optional[Dict[str, Dict[str, Set[str]]]] = None
+        self.drug_module_sets: Optional[Dict[str, Set[str]]] = None
+        # s_AB per drug pair. It depends on the network and the drug modules
+        # but not on the disease, so it is kept across predict_all calls
+        self._separations: Dict[Tuple[str, str], float] = {}
         self.disease_signatures: Optional[Dict[str, Dict[str, float]]] = None
         
         logger.info("SynergyPredictor initialized")
@@ -71,6 +163,12 @@ class SynergyPredictor:
     def set_drug_modules(self, modules: Dict[str, Dict[str, Set[str]]]) -> None:
         """Set drug modules."""
         self.drug_modules = modules
+        # Union of up/down per drug, for the topological and proximity
+        # components; built here once rather than on every predict_all
+        self.drug_module_sets = {
+            drug: module['up'] | module['down'] for drug, module in modules.items()
+        }
+        self._separations = {}
         logger.info(f"Loaded {len(modules)} drug modules")
     
     def set_disease_signatures(self, signatures: Dict[str, Dict[str, float]]) -> None:
@@ -113,48 +211,56 @@ class SynergyPredictor:
         disease_module = self.disease_modules[disease]
         drug_names = list(self.drug_modules.keys())
         
-        # Generate all drug pairs
-        drug_pairs = []
-        for i, drug_a in enumerate(drug_names):
-            for drug_b in drug_names[i+1:]:
-                drug_pairs.append((drug_a, drug_b))
-        
-        if max_pairs:
-            drug_pairs = drug_pairs[:max_pairs]
+        # Generate drug pairs, stopping at max_pairs rather than building
+        # all of them first
+        drug_pairs = list(
+            itertools.islice(itertools.combinations(drug_names, 2), max_pairs or None)
+        )
         
         logger.info(f"Evaluating {len(drug_pairs)} drug pairs")
         
-        # Extract drug modules (union of up/down for topological analysis)
-        drug_module_sets = {
-            drug: self.drug_modules[drug]['up'] | self.drug_modules[drug]['down']
-            for drug in drug_names
-        }
+        drug_module_sets = self.drug_module_sets
         
         # Proximity z-scores are per drug and both TQAB and PQAB need them.
         # Computing them once here keeps the null model to one run per drug
         # rather than one per drug per pair, and guarantees the two components
         # classify and score against identical numbers.
-        logger.info(f"Computing proximity z-scores for {len(drug_names)} drugs")
-        zscores = {
-            drug: proximity_zscore(
+        if self.shared_null:
+            zscores = shared_null_zscores(
                 self.network,
                 disease_module,
-                drug_module_sets[drug],
+                drug_module_sets,
                 self.n_randomizations,
                 self.seed,
             )
-            for drug in sorted(drug_module_sets)
-        }
+        else:
+            logger.info(f"Computing proximity z-scores for {len(drug_names)} drugs")
+            zscores = {
+                drug: proximity_zscore(
+                    self.network,
+                    disease_module,
+                    drug_module_sets[drug],
+                    self.n_randomizations,
+                    self.seed,
+                )
+                for drug in sorted(drug_module_sets)
+            }
 
         # Compute TQAB
         logger.info("Computing TQAB (topological)")
-        tqab_results = compute_tqab_batch(
-            self.network,
-            disease_module,
-            drug_module_sets,
-            drug_pairs,
-            proximity_zscores=zscores,
-        )
+        if self.n_workers > 1 and len(drug_pairs) > 1:
+            tqab_results = self._tqab_parallel(
+                disease_module, drug_module_sets, drug_pairs, zscores
+            )
+        else:
+            tqab_results = compute_tqab_batch(
+                self.network,
+                disease_module,
+                drug_module_sets,
+                drug_pairs,
+                proximity_zscores=zscores,
+                separations=self._separations,
+            )
 
         # Compute PQAB
         logger.info("Computing PQAB (proximity)")
@@ -178,33 +284,32 @@ class SynergyPredictor:
                 drug_pairs,
             )
         
-        # Combine results
-        predictions = []
+        # Combine results into one preallocated buffer per column rather
+        # than a dict per pair; missing pairs score zero
+        n_pairs = len(drug_pairs)
+        drug_a = np.array([pair[0] for pair in drug_pairs], dtype=object)
+        drug_b = np.array([pair[1] for pair in drug_pairs], dtype=object)
+        tqab, topo_class = _columns(tqab_results, drug_pairs, (0.0, 'unknown'))
+        pqab, pqa, pqb = _columns(pqab_results, drug_pairs, (0.0, 0.0, 0.0))
+        cqab, cqa, cqb = _columns(cqab_results, drug_pairs, (0.0, 0.0, 0.0))
         
-        for drug_a, drug_b in drug_pairs:
-            tqab, topo_class = tqab_results.get((drug_a, drug_b), (0.0, 'unknown'))
-            pqab, pqa, pqb = pqab_results.get((drug_a, drug_b), (0.0, 0.0, 0.0))
-            cqab, cqa, cqb = cqab_results.get((drug_a, drug_b), (0.0, 0.0, 0.0))
-            
-            # Final prediction
-            prediction = tqab + pqab + cqab
-            
-            predictions.append({
-                'disease': disease,
-                'drug_a': drug_a,
-                'drug_b': drug_b,
-                'tqab': tqab,
-                'pqab': pqab,
-                'cqab': cqab,
-                'prediction_score': prediction,
-                'topology_class': topo_class,
-                'pqa': pqa,
-                'pqb': pqb,
-                'cqa': cqa,
-                'cqb': cqb,
-            })
+        # Final prediction
+        prediction = tqab + pqab + cqab
         
-        df = pd.DataFrame(predictions)
+        df = pd.DataFrame({
+            'disease': np.full(n_pairs, disease, dtype=object),
+            'drug_a': drug_a,
+            'drug_b': drug_b,
+            'tqab': tqab,
+            'pqab': pqab,
+            'cqab': cqab,
+            'prediction_score': prediction,
+            'topology_class': topo_class,
+            'pqa': pqa,
+            'pqb': pqb,
+            'cqa': cqa,
+            'cqb': cqb,
+        })
         
         # Sort by prediction score
         df = df.sort_values('prediction_score', ascending=False)
@@ -213,6 +318,62 @@ class SynergyPredictor:
         
         return df
     
+    def _tqab_parallel(
+        self,
+        disease_module: Set[str],
+        drug_module_sets: Dict[str, Set[str]],
+        drug_pairs: List[Tuple[str, str]],
+        zscores: Dict[str, float],
+    ) -> Dict[Tuple[str, str], Tuple[float, str]]:
+        """
+        `compute_tqab_batch` over `drug_pairs`, sharded across processes.
+
+        Notes
+        -----
+        TQAB is the only component with real per-pair work, a separation
+        score per pair, so it is the one worth sharding; PQAB is a lookup of
+        the per-drug z-scores and CQAB a few dot products per pair. The pairs
+        are split into contiguous chunks and the results merged in chunk
+        order, so the returned dict matches the serial one.
+
+        The network, disease module, drug modules and z-scores reach each
+        worker once, through the pool initializer. Under fork they are
+        inherited copy-on-write, together with the cached CSR adjacency;
+        under spawn they are pickled once per worker, which on a large
+        network costs seconds and only pays off for large pair sweeps.
+
+        No shared-memory segment is needed for the null model either. What
+        the workers read from it is the z-scores, one float per drug; the
+        random modules behind them never leave the parent. The inherited
+        CSR arrays stay shared under fork, because NumPy keeps reference
+        counts in the array header rather than in the data pages, so reading
+        them in a worker copies nothing.
+        """
+        n_workers = min(self.n_workers, len(drug_pairs))
+        n_chunks = min(len(drug_pairs), n_workers * CHUNKS_PER_WORKER)
+        chunk_size = -(-len(drug_pairs) // n_chunks)
+        chunks = [
+            drug_pairs[start:start + chunk_size]
+            for start in range(0, len(drug_pairs), chunk_size)
+        ]
+
+        logger.info(f"Scoring {len(chunks)} pair chunks on {n_workers} workers")
+
+        results: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=fork_context(),
+            initializer=_init_pair_worker,
+            initargs=(
+                self.network, disease_module, drug_module_sets, zscores, self._separations
+            ),
+        ) as pool:
+            for chunk_results, separations in pool.map(_tqab_chunk, chunks):
+                results.update(chunk_results)
+                self._separations.update(separations)
+
+        return results
+    
     def predict_multiple_diseases(
         self,
         diseases: List[str],
@@ -245,7 +406,7 @@ class SynergyPredictor:
         output_path: Path,
     ) -> None:
         """
-        Save predictions to CSV.
+        Save predictions to CSV, with a Parquet copy beside it.
         
         Parameters
         ----------
@@ -253,7 +414,23 @@ class SynergyPredictor:
             Prediction results.
         output_path : Path
             Output file path.
+
+        Notes
+        -----
+        The Parquet copy (same name, .parquet) is what `evaluate.py` and
+        `make_figures.py` read when present: zstd-compressed, columnar and
+        dictionary-encoded, it is a fraction of the CSV's size and loads
+        without text parsing. It needs the optional `parquet` extra; without
+        pyarrow only the CSV is written, and any older copy is removed so it
+        can never be read in place of the new scores.
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
         predictions.to_csv(output_path, index=False)
+
+        parquet_path = output_path.with_suffix('.parquet')
+        try:
+            predictions.to_parquet(parquet_path, index=False, compression='zstd')
+        except ImportError:
+            parquet_path.unlink(missing_ok=True)
+
         logger.info(f"Saved predictions to {output_path}")
\ No newline at end of file
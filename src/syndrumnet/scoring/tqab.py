@@ -10,8 +10,12 @@ import logging
 from typing import Dict, List, Optional, Set, Tuple
 
 import networkx as nx
+import numpy as np
+from scipy.sparse import csgraph
 
-from syndrumnet.metrics.distances import separation_score
+from syndrumnet.metrics.adjacency import CSRAdjacency, as_csr
+from syndrumnet.metrics.distances import pairwise_separations
+from syndrumnet.scoring.pqab import proximity_zscore
 
 logger = logging.getLogger(__name__)
 
@@ -107,6 +111,48 @@ def classify_topology(z_qa: float, z_qb: float, s_ab: float) -> str:
     )
 
 
+#: Class by [number of drugs near the disease, separated], the table of
+#: `classify_topology` for lookup by array index.
+_CLASS_TABLE = np.array(
+    [
+        [TopologyClass.NON_EXPOSURE, TopologyClass.INDEPENDENT_ACTION],
+        [TopologyClass.INDIRECT_EXPOSURE, TopologyClass.SINGLE_EXPOSURE],
+        [TopologyClass.OVERLAPPING_EXPOSURE, TopologyClass.COMPLEMENTARY_EXPOSURE],
+    ],
+    dtype=object,
+)
+
+
+def classify_topology_batch(
+    z_qa: np.ndarray,
+    z_qb: np.ndarray,
+    s_ab: np.ndarray,
+) -> np.ndarray:
+    """
+    `classify_topology` over arrays of pairs at once.
+
+    Parameters
+    ----------
+    z_qa, z_qb, s_ab : np.ndarray
+        One entry per drug pair, as for `classify_topology`.
+
+    Returns
+    -------
+    np.ndarray
+        Object array of TopologyClass constants, one per pair.
+
+    Notes
+    -----
+    The two axes of the classification become array indices, the number of
+    drugs near the disease (0-2) and whether the modules are separated, into
+    the same six-class table, so the whole batch is a few comparisons and one
+    gather instead of a Python call per pair.
+    """
+    n_near = (np.asarray(z_qa) < 0).astype(np.intp) + (np.asarray(z_qb) < 0)
+    separated = (np.asarray(s_ab) >= 0).astype(np.intp)
+    return _CLASS_TABLE[n_near, separated]
+
+
 def compute_tqab(z_qa: float, z_qb: float, s_ab: float) -> Tuple[float, str]:
     """
     Compute the topological class score T_QAB.
@@ -140,14 +186,31 @@ def compute_tqab(z_qa: float, z_qb: float, s_ab: float) -> Tuple[float, str]:
         else 0.0
     )
 
+    # %-style, so the message is only formatted when DEBUG is enabled
     logger.debug(
-        f"TQAB: z_QA={z_qa:.3f}, z_QB={z_qb:.3f}, s_AB={s_ab:.3f}, "
-        f"class={topology_class}, score={score}"
+        "TQAB: z_QA=%.3f, z_QB=%.3f, s_AB=%.3f, class=%s, score=%s",
+        z_qa, z_qb, s_ab, topology_class, score,
     )
 
     return score, topology_class
 
 
+def _lookup(table: dict, pair: Tuple[str, str]):
+    """Entry for `pair` in either orientation, or None; s_AB is symmetric."""
+    if pair in table:
+        return table[pair]
+    return table.get((pair[1], pair[0]))
+
+
+def _reachable_from(adjacency: CSRAdjacency, module: Set[str]) -> np.ndarray:
+    """
+    Mask over the adjacency's nodes: True in any connected component that
+    holds a gene of `module`. Components are labelled by SciPy in C.
+    """
+    _, labels = csgraph.connected_components(adjacency.matrix, directed=False)
+    return np.isin(labels, labels[adjacency.indices_of(module)])
+
+
 def compute_tqab_batch(
     G: nx.Graph,
     disease_module: Set[str],
@@ -156,6 +219,7 @@ def compute_tqab_batch(
     proximity_zscores: Optional[Dict[str, float]] = None,
     n_randomizations: int = 1000,
     seed: int = 42,
+    separations: Optional[Dict[Tuple[str, str], float]] = None,
 ) -> Dict[Tuple[str, str], Tuple[float, str]]:
     """
     Compute TQAB for multiple drug pairs.
@@ -177,6 +241,10 @@ def compute_tqab_batch(
         Randomizations per z-score, when they have to be computed here.
     seed : int
         Run-level seed, when z-scores have to be computed here.
+    separations : dict, optional
+        {(drug_a, drug_b): s_AB} cache, read and filled in place. s_AB does
+        not involve the disease, so one dict can be passed for every disease
+        scored against the same network and drug modules.
 
     Returns
     -------
@@ -185,23 +253,34 @@ def compute_tqab_batch(
 
     Notes
     -----
-    z-scores are per drug and are cached; separation is genuinely per pair and
-    is not.
+    z-scores are per drug and are cached. Separation is genuinely per pair,
+    but the graph searches behind it are per drug, and `pairwise_separations`
+    runs each of those once for the whole batch.
+
+    When z-scores are computed here, a drug with no gene in a connected
+    component of the disease module skips its null model. Every distance
+    from such a drug to the disease is the infinity sentinel, the largest
+    value a null draw can reach, so its z-score can never be negative and
+    the drug is classified as not near the disease. Any pair containing it
+    scores 0. Graphs from `NetworkBuilder.build` are a single component, so
+    this only matters for graphs supplied some other way.
     """
-    from syndrumnet.scoring.pqab import proximity_zscore
-
     needed = {drug for pair in drug_pairs for drug in pair if drug in drug_modules}
 
     if proximity_zscores is None:
-        proximity_zscores = {
-            drug: proximity_zscore(
+        adjacency = as_csr(G)
+        reachable = _reachable_from(adjacency, disease_module)
+        proximity_zscores = {}
+        for drug in sorted(needed):
+            if not reachable[adjacency.indices_of(drug_modules[drug])].any():
+                # Cannot be closer than chance; see Notes
+                proximity_zscores[drug] = np.inf
+                continue
+            proximity_zscores[drug] = proximity_zscore(
                 G, disease_module, drug_modules[drug], n_randomizations, seed
             )
-            for drug in sorted(needed)
-        }
-
-    results = {}
 
+    scorable = []
     for drug_a, drug_b in drug_pairs:
         if drug_a not in drug_modules or drug_b not in drug_modules:
             logger.warning(f"Missing module for pair ({drug_a}, {drug_b})")
@@ -209,11 +288,41 @@ def compute_tqab_batch(
         if drug_a not in proximity_zscores or drug_b not in proximity_zscores:
             logger.warning(f"Missing z-score for pair ({drug_a}, {drug_b})")
             continue
+        scorable.append((drug_a, drug_b))
+
+    # Separations for every pair not already known, sharing one search per
+    # drug between all of them. s_AB is symmetric, so a pair whose reverse
+    # is known or already queued is not computed again.
+    known = separations if separations is not None else {}
+    missing: List[Tuple[str, str]] = []
+    queued: Set[Tuple[str, str]] = set()
+    for pair in scorable:
+        if _lookup(known, pair) is None and pair not in queued:
+            missing.append(pair)
+            queued.update((pair, (pair[1], pair[0])))
+
+    computed = pairwise_separations(G, drug_modules, missing)
+    if separations is not None:
+        separations.update(computed)
+
+    s_ab = []
+    for pair in scorable:
+        value = _lookup(computed, pair)
+        s_ab.append(_lookup(known, pair) if value is None else value)
+
+    # Classify and score every pair in one vectorized pass, as compute_tqab
+    # does pair by pair
+    classes = classify_topology_batch(
+        np.array([proximity_zscores[a] for a, _ in scorable], dtype=float),
+        np.array([proximity_zscores[b] for _, b in scorable], dtype=float),
+        np.array(s_ab, dtype=float),
+    )
+    scores = np.where(
+        classes == TopologyClass.COMPLEMENTARY_EXPOSURE,
+        COMPLEMENTARY_EXPOSURE_SCORE,
+        0.0,
+    )
 
-        s_ab = separation_score(G, drug_modules[drug_a], drug_modules[drug_b])
-
-        results[(drug_a, drug_b)] = compute_tqab(
-            proximity_zscores[drug_a], proximity_zscores[drug_b], s_ab
-        )
+    results = dict(zip(scorable, zip(scores.tolist(), classes.tolist())))
 
     return results
@@ -5,57 +5,114 @@ Handles loading YAML configs, merging defaults with overrides, and
 providing nested dictionary access.
 """
 
+import copy
 from pathlib import Path
-from typing import Any, Dict, Union
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
 
 import yaml
 
+try:
+    #: YAML loader and dumper: libyaml's C implementations when PyYAML was
+    #: built against it, otherwise the pure-Python ones with the same output.
+    from yaml import CDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import Dumper as _Dumper
+    from yaml import SafeLoader as _Loader
 
-class Config:
+
+class Config(SimpleNamespace):
     """
     Configuration container with nested access support.
     
     Supports both dict-like and attribute-like access:
         config['data']['network_sources']  # dict-style
         config.data.network_sources         # attribute-style
+    
+    Keys are stored once, in the instance `__dict__`, with nested mappings
+    converted to Config when the config is built. Both access styles read the
+    same storage, so there is no separate backing dict to keep in sync.
     """
     
-    def __init__(self, config_dict: Dict[str, Any]) -> None:
+    # Bookkeeping lives in slots, outside the __dict__ that holds the keys
+    __slots__ = ('_dict_cache', '__weakref__')
+    
+    def __init__(self, config_dict: Optional[Dict[str, Any]] = None) -> None:
         """Initialize config from dictionary."""
-        self._config = config_dict
-        
-        # Convert nested dicts to Config objects
-        for key, value in config_dict.items():
-            if isinstance(value, dict):
-                setattr(self, key, Config(value))
-            else:
-                setattr(self, key, value)
+        super().__init__()
+        object.__setattr__(self, '_dict_cache', None)
+        # Written through __dict__ so keys need not be valid identifiers
+        self.__dict__.update(
+            (key, Config(value) if isinstance(value, dict) else value)
+            for key, value in (config_dict or {}).items()
+        )
+    
+    def __getattr__(self, name: str) -> Any:
+        """Called only for missing keys; gives them a clearer message."""
+        if name.startswith('__'):
+            raise AttributeError(name)
+        raise AttributeError(f"Config has no key {name!r}")
     
     def __getitem__(self, key: str) -> Any:
         """Dict-like access."""
-        return self._config[key]
+        return self.__dict__[key]
     
     def __setitem__(self, key: str, value: Any) -> None:
         """Dict-like assignment."""
-        self._config[key] = value
-        setattr(self, key, value)
+        self.__dict__[key] = Config(value) if isinstance(value, dict) else value
+        object.__setattr__(self, '_dict_cache', None)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Attribute assignment, which also invalidates the dict cache."""
+        super().__setattr__(name, value)
+        object.__setattr__(self, '_dict_cache', None)
+    
+    def __delattr__(self, name: str) -> None:
+        """Attribute deletion, which also invalidates the dict cache."""
+        super().__delattr__(name)
+        object.__setattr__(self, '_dict_cache', None)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get with default value."""
-        return self._config.get(key, default)
+        return self.__dict__.get(key, default)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert back to plain dictionary."""
-        result = {}
-        for key, value in self._config.items():
-            if isinstance(value, Config):
-                result[key] = value.to_dict()
-            else:
-                result[key] = value
-        return result
+        """
+        Convert back to plain dictionary.
+
+        The result is a fresh deep copy, so callers may change it freely
+        without reaching the config.
+        """
+        return copy.deepcopy(self._cached_dict())
+    
+    def _cached_dict(self) -> Dict[str, Any]:
+        """
+        The plain-dict form of the config, cached and shared between calls.
+
+        For read-only use within this module: `__repr__`, `merge_configs` and
+        `save_config` only read it, so they skip the copy `to_dict` makes.
+        Assigning a key discards the cache of that Config; a parent's cache is
+        reused only while each nested Config still returns the very dict it
+        was built from, so edits at any depth are seen.
+        """
+        children = {
+            key: value._cached_dict()
+            for key, value in self.__dict__.items()
+            if isinstance(value, Config)
+        }
+        cache = self._dict_cache
+        if cache is not None and all(
+            cache.get(key) is child for key, child in children.items()
+        ):
+            return cache
+        
+        cache = {key: children.get(key, value) for key, value in self.__dict__.items()}
+        object.__setattr__(self, '_dict_cache', cache)
+        return cache
     
     def __repr__(self) -> str:
-        return f"Config({self._config})"
+        return f"Config({self._cached_dict()})"
 
 
 def load_config(config_path: Union[str, Path]) -> Config:
@@ -96,7 +153,7 @@ def load_config(config_path: Union[str, Path]) -> Config:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     with open(config_path, 'r') as f:
-        config_dict = yaml.safe_load(f)
+        config_dict = yaml.load(f, Loader=_Loader)
 
     if config_dict is None:
         raise ValueError(f"Configuration file is empty: {config_path}")
@@ -115,6 +172,10 @@ def merge_configs(base: Config, override: Dict[str, Any]) -> Config:
     Merge override dictionary into base config.
     
     Supports nested keys with dot notation: 'propagation.alpha' = 0.7
+
+    Overrides apply in order, so {'propagation': {...}, 'propagation.alpha':
+    0.7} replaces the block and then sets one key in it, while the reverse
+    order leaves only the replacement block.
     
     Parameters
     ----------
@@ -134,21 +195,50 @@ def merge_configs(base: Config, override: Dict[str, Any]) -> Config:
     >>> overrides = {'propagation.alpha': 0.7, 'n_cores': 8}
     >>> config = merge_configs(config, overrides)
     """
-    merged = base.to_dict()
+    flat = dict(_flatten(base._cached_dict()))
     
     for key, value in override.items():
-        # Handle dot notation: 'propagation.alpha' -> ['propagation', 'alpha']
-        keys = key.split('.')
-        target = merged
-        
-        for k in keys[:-1]:
-            if k not in target:
-                target[k] = {}
-            target = target[k]
-        
-        target[keys[-1]] = value
+        # Handle dot notation: 'propagation.alpha' -> ('propagation', 'alpha').
+        # Re-inserting moves the key to the end, so overrides apply in order
+        path = tuple(key.split('.'))
+        flat.pop(path, None)
+        flat[path] = value
     
-    return Config(merged)
+    return Config(_unflatten(flat))
+
+
+def _flatten(tree: Dict[Any, Any], prefix: Tuple = ()) -> Iterator[Tuple[Tuple, Any]]:
+    """Yield (key path, value) for every leaf of a nested dict, in order."""
+    for key, value in tree.items():
+        path = prefix + (key,)
+        if isinstance(value, dict) and value:
+            yield from _flatten(value, path)
+        elif isinstance(value, dict):
+            # A fresh empty mapping, so later writes below it cannot reach
+            # the base config's cached dict
+            yield path, {}
+        else:
+            yield path, value
+
+
+def _unflatten(flat: Dict[Tuple, Any]) -> Dict[Any, Any]:
+    """
+    Rebuild a nested dict from `_flatten` output, applying paths in order.
+
+    A later path wins over an earlier one: writing `('propagation',)` drops
+    any `('propagation', ...)` written before it, and writing below a path
+    that holds a scalar replaces the scalar with a mapping.
+    """
+    tree: Dict[Any, Any] = {}
+    for path, value in flat.items():
+        target = tree
+        for key in path[:-1]:
+            child = target.get(key)
+            if not isinstance(child, dict):
+                child = target[key] = {}
+            target = child
+        target[path[-1]] = value
+    return tree
 
 
 def save_config(config: Config, output_path: Union[str, Path]) -> None:
@@ -166,4 +256,6 @@ def save_config(config: Config, output_path: Union[str, Path]) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     with open(output_path, 'w') as f:
-        yaml.dump(config.to_dict(), f, default_flow_style=False, sort_keys=False)
\ No newline at end of file
+        yaml.dump(
+            config._cached_dict(), f, Dumper=_Dumper, default_flow_style=False, sort_keys=False
+        )
\ No newline at end of file
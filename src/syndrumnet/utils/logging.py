@@ -4,11 +4,47 @@ Structured logging for SyndrumNET pipeline.
 Provides consistent logging across all modules with automatic file/console output.
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+#: {logger name: (its queue handler, the listener draining it, the real
+#: handlers behind it)} for every logger `setup_logger` configured. Held at
+#: module level so the listener threads live as long as the loggers.
+_QUEUED: Dict[str, Tuple[QueueHandler, QueueListener, List[logging.Handler]]] = {}
+
+
+def _stop_listeners() -> None:
+    """Flush and stop every listener; registered to run at exit."""
+    for _, listener, _ in _QUEUED.values():
+        listener.stop()
+
+
+def _unqueue_in_child() -> None:
+    """
+    Attach the real handlers directly in a forked child.
+
+    The listener thread does not survive fork, so records a child pushed to
+    the inherited queue would never be written; children log synchronously,
+    as they did before the queue existed.
+    """
+    for name, (queue_handler, _, handlers) in _QUEUED.items():
+        logger = logging.getLogger(name)
+        logger.removeHandler(queue_handler)
+        for handler in handlers:
+            logger.addHandler(handler)
+    _QUEUED.clear()
+
+
+atexit.register(_stop_listeners)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_unqueue_in_child)
 
 
 def setup_logger(
@@ -35,6 +71,13 @@ def setup_logger(
     -------
     logging.Logger
         Configured logger instance.
+    
+    Notes
+    -----
+    The file and console handlers sit behind a `QueueHandler`: logging calls
+    only enqueue the record, and a background `QueueListener` writes it. The
+    listener is flushed at interpreter exit. Processes forked afterwards
+    write through the handlers directly.
         
     Examples
     --------
@@ -46,8 +89,10 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
-    # Clear existing handlers
+    # Clear existing handlers, and the listener of an earlier setup
     logger.handlers.clear()
+    if name in _QUEUED:
+        _QUEUED.pop(name)[1].stop()
     
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -71,14 +116,23 @@ def setup_logger(
     file_handler = logging.FileHandler(log_file, mode='w')
     file_handler.setLevel(logging.DEBUG)  # Always log everything to file
     file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
+    handlers: List[logging.Handler] = [file_handler]
     
     # Console handler
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         console_handler.setFormatter(simple_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # The caller only enqueues each record; a listener thread formats and
+    # writes it, so disk and console IO stay off the compute path
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    logger.addHandler(queue_handler)
+    _QUEUED[name] = (queue_handler, listener, handlers)
     
     # Log setup completion
     logger.info(f"Logger initialized: {name}")
@@ -0,0 +1,32 @@
+"""
+Process-pool helpers shared by the pipeline scripts and the predictor.
+"""
+
+import multiprocessing
+from multiprocessing.context import BaseContext
+from typing import Optional
+
+
+def fork_context() -> Optional[BaseContext]:
+    """
+    The 'fork' multiprocessing context, or None where the platform lacks it.
+
+    Returns
+    -------
+    BaseContext or None
+        Pass as `mp_context` to `ProcessPoolExecutor`. None falls back to the
+        platform's default start method.
+
+    Notes
+    -----
+    Every process pool in the pipeline asks for fork explicitly rather than
+    taking the default, which is spawn on macOS and forkserver on Linux from
+    Python 3.14. Forked workers inherit the parent's state copy-on-write:
+    the network and predictor without unpickling them, and the handlers
+    `setup_logger` attached, so worker log lines reach the console and log
+    file. A spawned worker starts with unconfigured loggers and its info and
+    warning lines are lost.
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None
@@ -6,12 +6,19 @@ Ensures all random operations (NumPy, Python random, NetworkX) use consistent se
 
 import logging
 import random
-from typing import Optional
+from typing import List, Optional
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+#: Generator handed out by `get_rng()` without a seed, reseeded by
+#: `set_random_seed`. None until either is first called.
+_default_rng: Optional[np.random.Generator] = None
+
+#: Seed sequence behind `_default_rng`, from which `spawn_rngs` splits streams.
+_seed_sequence: Optional[np.random.SeedSequence] = None
+
 
 def set_random_seed(seed: Optional[int] = None) -> int:
     """
@@ -19,7 +26,8 @@ def set_random_seed(seed: Optional[int] = None) -> int:
     
     Sets seeds for:
     - Python's built-in random module
-    - NumPy random number generator
+    - NumPy's legacy global generator
+    - The shared NumPy Generator returned by `get_rng()`
     - Hash seed (for consistent dict/set ordering in Python 3.3+)
     
     Parameters
@@ -48,15 +56,22 @@ def set_random_seed(seed: Optional[int] = None) -> int:
     This function should be called at the start of each script to ensure
     reproducibility. NetworkX graph operations that depend on random will
     also respect these seeds.
+
+    The null models draw from `get_rng`, not the legacy global generator, so
+    unseeded draws there follow this seed through the shared Generator.
     """
+    global _default_rng, _seed_sequence
+
     if seed is None:
         seed = 42
     
     # Python random
     random.seed(seed)
     
-    # NumPy random
+    # NumPy random, legacy global state and the shared Generator
     np.random.seed(seed)
+    _seed_sequence = np.random.SeedSequence(seed)
+    _default_rng = np.random.default_rng(_seed_sequence)
     
     # Set hash seed via environment (for subprocess calls)
     import os
@@ -90,4 +105,68 @@ def get_random_state(seed: Optional[int] = None) -> np.random.RandomState:
     >>> rng.randint(100)
     51
     """
-    return np.random.RandomState(seed)
\ No newline at end of file
+    return np.random.RandomState(seed)
+
+
+def get_rng(seed: Optional[int] = None) -> np.random.Generator:
+    """
+    NumPy Generator (PCG64) for the randomization hot paths.
+
+    Parameters
+    ----------
+    seed : int, optional
+        Seed for a fresh, independent Generator. If None, returns the shared
+        Generator seeded by `set_random_seed`, so successive unseeded calls
+        continue one stream rather than restarting it.
+
+    Returns
+    -------
+    np.random.Generator
+        Random number generator.
+
+    Examples
+    --------
+    >>> rng = get_rng(42)
+    >>> draws = rng.random(10)  # Same ten values for every call with seed 42
+    """
+    global _default_rng
+    if seed is not None:
+        return np.random.default_rng(seed)
+    if _default_rng is None:
+        _default_rng = np.random.default_rng()
+    return _default_rng
+
+
+def spawn_rngs(n: int, seed: Optional[int] = None) -> List[np.random.Generator]:
+    """
+    Independent Generators, one per worker.
+
+    Parameters
+    ----------
+    n : int
+        Number of streams.
+    seed : int, optional
+        Seed to split. If None, splits the sequence seeded by
+        `set_random_seed`, or fresh OS entropy if it has not been called.
+
+    Returns
+    -------
+    list of np.random.Generator
+        `n` Generators whose streams do not overlap.
+
+    Notes
+    -----
+    The streams come from `SeedSequence.spawn`, so they are statistically
+    independent without sharing any state: workers can draw in parallel
+    without coordinating, and a given seed always yields the same streams.
+    Spawning from the shared sequence advances it, so a second call returns
+    new streams rather than repeating the first.
+    """
+    global _seed_sequence
+    if seed is not None:
+        sequence = np.random.SeedSequence(seed)
+    else:
+        if _seed_sequence is None:
+            _seed_sequence = np.random.SeedSequence()
+        sequence = _seed_sequence
+    return [np.random.default_rng(child) for child in sequence.spawn(n)]
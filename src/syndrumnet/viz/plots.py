@@ -5,7 +5,8 @@ All plots use matplotlib only (no seaborn) as specified.
 
 Every function that takes an `output_path` creates the parent directory,
 writes the figure, and releases it even if the write fails, so a failed save
-in a loop cannot leak figures.
+in a loop cannot leak figures. Given the `source_path` its data came from, it
+skips figures that are already newer than that file.
 """
 
 import logging
@@ -38,19 +39,61 @@ def _save(fig: plt.Figure, output_path: Path, description: str, dpi: int) -> Non
     variable holding them, so an exception between `subplots` and `close`
     leaves the figure open for the rest of the process. In a loop over
     diseases that accumulates until matplotlib starts warning about it.
+
+    `tight_layout` already fits the labels inside the figure, so the figure
+    is saved as laid out; `bbox_inches='tight'` on top of it would cost a
+    second full draw only to measure the same bounds.
     """
     output_path = Path(output_path)
 
     try:
         fig.tight_layout()
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
+        fig.savefig(output_path, dpi=dpi)
     finally:
         plt.close(fig)
 
     logger.info(f"Saved {description} to {output_path}")
 
 
+def figure_is_current(
+    output_path: Optional[Path],
+    source_path: Optional[Path],
+) -> bool:
+    """
+    Whether a saved figure is newer than the file its data came from.
+
+    Parameters
+    ----------
+    output_path : Path, optional
+        Figure file. None, for a figure that is shown rather than saved, is
+        never current.
+    source_path : Path, optional
+        Input file the figure is drawn from. None means the input is
+        unknown, so the figure is never treated as current.
+
+    Returns
+    -------
+    bool
+        True if both files exist and the figure was written after the input
+        was last modified.
+
+    Notes
+    -----
+    Re-running the pipeline otherwise redraws and re-encodes every figure
+    even when no input changed. Comparing modification times is the same
+    test `make` uses; callers with an input to load, such as the network,
+    can check this first and skip the load as well.
+    """
+    if output_path is None or source_path is None:
+        return False
+
+    try:
+        return Path(output_path).stat().st_mtime > Path(source_path).stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
 def _require_columns(df: pd.DataFrame, columns: Sequence[str], what: str) -> None:
     """Fail with the full list of missing columns rather than the first one."""
     missing = [column for column in columns if column not in df.columns]
@@ -67,6 +110,7 @@ def plot_degree_distribution(
     output_path: Path,
     log_scale: bool = True,
     dpi: int = DEFAULT_DPI,
+    source_path: Optional[Path] = None,
 ) -> None:
     """
     Plot network degree distribution.
@@ -82,6 +126,9 @@ def plot_degree_distribution(
     dpi : int
         Output resolution. `configs/default.yaml` sets this under
         `visualization.dpi`.
+    source_path : Path, optional
+        File the plotted data was read from. If given and the figure at
+        `output_path` is newer, nothing is drawn; see `figure_is_current`.
 
     Raises
     ------
@@ -98,10 +145,16 @@ def plot_degree_distribution(
     magnitude. Isolated nodes cannot be placed on a logarithmic axis at all,
     so they are counted in the title instead of silently dropped.
     """
+    if figure_is_current(output_path, source_path):
+        logger.info(f"Degree distribution at {output_path} is up to date")
+        return
+
     if G.number_of_nodes() == 0:
         raise ValueError("Cannot plot a degree distribution for a graph with no nodes.")
 
-    degrees = np.array([degree for _, degree in G.degree()])
+    degrees = np.fromiter(
+        (degree for _, degree in G.degree()), dtype=np.intp, count=G.number_of_nodes()
+    )
     n_isolated = int((degrees == 0).sum())
     connected = degrees[degrees > 0]
 
@@ -116,21 +169,27 @@ def plot_degree_distribution(
 
     title = 'Network Degree Distribution'
 
+    # Bin with NumPy and draw the counts as bars, rather than handing every
+    # degree to ax.hist
     if log_scale:
-        ax.hist(
-            connected,
-            bins=np.logspace(0, np.log10(connected.max()), 50),
-            edgecolor='black',
-            alpha=0.7,
+        counts, edges = np.histogram(
+            connected, bins=np.logspace(0, np.log10(connected.max()), 50)
         )
+    else:
+        counts, edges = np.histogram(degrees, bins=50)
+
+    ax.bar(
+        edges[:-1], counts, width=np.diff(edges), align='edge',
+        edgecolor='black', alpha=0.7,
+    )
+
+    if log_scale:
         ax.set_xscale('log')
         ax.set_yscale('log')
 
         if n_isolated:
             title += f' ({n_isolated} isolated nodes not shown)'
             logger.warning(f"{n_isolated} isolated nodes omitted from the log-scaled plot")
-    else:
-        ax.hist(degrees, bins=50, edgecolor='black', alpha=0.7)
 
     ax.set_xlabel('Degree', fontsize=12)
     ax.set_ylabel('Count', fontsize=12)
@@ -147,6 +206,7 @@ def plot_roc_curve(
     output_path: Path,
     title: str = "ROC Curve",
     dpi: int = DEFAULT_DPI,
+    source_path: Optional[Path] = None,
 ) -> None:
     """
     Plot ROC curve.
@@ -166,7 +226,14 @@ def plot_roc_curve(
     dpi : int
         Output resolution. `configs/default.yaml` sets this under
         `visualization.dpi`.
+    source_path : Path, optional
+        File the plotted data was read from. If given and the figure at
+        `output_path` is newer, nothing is drawn; see `figure_is_current`.
     """
+    if figure_is_current(output_path, source_path):
+        logger.info(f"ROC curve at {output_path} is up to date")
+        return
+
     fig, ax = plt.subplots(figsize=(8, 6))
 
     ax.plot(fpr, tpr, linewidth=2, label=f'AUC = {auc:.3f}')
@@ -188,6 +255,7 @@ def plot_pr_curve(
     output_path: Path,
     title: str = "Precision-Recall Curve",
     dpi: int = DEFAULT_DPI,
+    source_path: Optional[Path] = None,
 ) -> None:
     """
     Plot precision-recall curve.
@@ -207,7 +275,14 @@ def plot_pr_curve(
     dpi : int
         Output resolution. `configs/default.yaml` sets this under
         `visualization.dpi`.
+    source_path : Path, optional
+        File the plotted data was read from. If given and the figure at
+        `output_path` is newer, nothing is drawn; see `figure_is_current`.
     """
+    if figure_is_current(output_path, source_path):
+        logger.info(f"PR curve at {output_path} is up to date")
+        return
+
     fig, ax = plt.subplots(figsize=(8, 6))
 
     ax.plot(recall, precision, linewidth=2, label=f'AUC-PR = {auc_pr:.3f}')
@@ -225,6 +300,7 @@ def plot_score_distributions(
     predictions: pd.DataFrame,
     output_path: Path,
     dpi: int = DEFAULT_DPI,
+    source_path: Optional[Path] = None,
 ) -> None:
     """
     Plot distributions of TQAB, PQAB, CQAB scores.
@@ -238,6 +314,9 @@ def plot_score_distributions(
     dpi : int
         Output resolution. `configs/default.yaml` sets this under
         `visualization.dpi`.
+    source_path : Path, optional
+        File the plotted data was read from. If given and the figure at
+        `output_path` is newer, nothing is drawn; see `figure_is_current`.
 
     Raises
     ------
@@ -246,6 +325,10 @@ def plot_score_distributions(
         columns leave their panel blank, which is informative; all three
         missing means the caller passed the wrong frame.
     """
+    if figure_is_current(output_path, source_path):
+        logger.info(f"Score distributions at {output_path} is up to date")
+        return
+
     if not any(column in predictions.columns for column in SCORE_COMPONENTS):
         raise KeyError(
             f"predictions has none of the score columns {list(SCORE_COMPONENTS)}. "
@@ -284,6 +367,7 @@ def plot_top_predictions(
     k: int = 20,
     output_path: Optional[Path] = None,
     dpi: int = DEFAULT_DPI,
+    source_path: Optional[Path] = None,
 ) -> None:
     """
     Plot top-k predictions as a signed decomposition of the total score.
@@ -300,6 +384,9 @@ def plot_top_predictions(
     dpi : int
         Output resolution. `configs/default.yaml` sets this under
         `visualization.dpi`.
+    source_path : Path, optional
+        File the plotted data was read from. If given and the figure at
+        `output_path` is newer, nothing is drawn; see `figure_is_current`.
 
     Raises
     ------
@@ -322,10 +409,16 @@ def plot_top_predictions(
     inferred from where the bar ends. The y axis is inverted so the
     highest-scoring pair is at the top.
     """
+    if figure_is_current(output_path, source_path):
+        logger.info(f"Top predictions plot at {output_path} is up to date")
+        return
+
     _require_columns(predictions, REQUIRED_PREDICTION_COLUMNS, "predictions")
 
     top_k = predictions.nlargest(k, 'prediction_score')
-    labels = [f"{a}-{b}" for a, b in zip(top_k['drug_a'], top_k['drug_b'])]
+    labels = (top_k['drug_a'].astype(str) + '-' + top_k['drug_b'].astype(str)).tolist()
+    # All component columns in one (k, components) block
+    components = top_k[list(SCORE_COMPONENTS)].to_numpy(dtype=float)
 
     fig, ax = plt.subplots(figsize=(12, 8))
 
@@ -335,8 +428,7 @@ def plot_top_predictions(
     positive_base = np.zeros(len(top_k))
     negative_base = np.zeros(len(top_k))
 
-    for component in SCORE_COMPONENTS:
-        values = top_k[component].to_numpy(dtype=float)
+    for component, values in zip(SCORE_COMPONENTS, components.T):
         base = np.where(values >= 0, positive_base, negative_base)
 
         ax.barh(y, values, height, left=base, label=component.upper(), alpha=0.8)
@@ -373,6 +465,7 @@ def plot_auc_comparison(
     results: Dict[str, Dict[str, float]],
     output_path: Path,
     dpi: int = DEFAULT_DPI,
+    source_path: Optional[Path] = None,
 ) -> None:
     """
     Plot AUC comparison across diseases.
@@ -386,6 +479,9 @@ def plot_auc_comparison(
     dpi : int
         Output resolution. `configs/default.yaml` sets this under
         `visualization.dpi`.
+    source_path : Path, optional
+        File the plotted data was read from. If given and the figure at
+        `output_path` is newer, nothing is drawn; see `figure_is_current`.
 
     Raises
     ------
@@ -395,6 +491,10 @@ def plot_auc_comparison(
         If any disease is missing a metric, naming the disease and the metric
         rather than surfacing a bare KeyError from inside a comprehension.
     """
+    if figure_is_current(output_path, source_path):
+        logger.info(f"AUC comparison at {output_path} is up to date")
+        return
+
     if not results:
         raise ValueError("results is empty, there is nothing to compare.")
 
@@ -5,6 +5,7 @@ The interesting cases are the malformed ones. `configs/diseases/` ships five
 empty files, so "empty YAML" is not a hypothetical input here.
 """
 
+import pickle
 from pathlib import Path
 
 import pytest
@@ -25,6 +26,49 @@ def test_nested_access_both_ways(tmp_path):
     assert config.n_cores == 4
 
 
+def test_assignment_replaces_a_resolved_attribute():
+    config = Config({'propagation': {'alpha': 0.5}})
+    assert config.propagation.alpha == 0.5
+
+    config['propagation'] = {'alpha': 0.7}
+
+    assert config.propagation.alpha == 0.7
+    with pytest.raises(AttributeError):
+        config.missing
+
+
+def test_round_trips_through_pickle_and_to_dict():
+    raw = {'propagation': {'alpha': 0.5}, 'n_cores': 4}
+    config = Config(raw)
+
+    restored = pickle.loads(pickle.dumps(config))
+
+    assert restored.propagation.alpha == 0.5
+    assert restored.to_dict() == raw
+
+
+def test_to_dict_is_cached_until_a_nested_key_changes():
+    config = Config({'propagation': {'alpha': 0.5}, 'n_cores': 4})
+    first = config._cached_dict()
+
+    assert config._cached_dict() is first
+
+    config.propagation['alpha'] = 0.7
+
+    assert config.to_dict() == {'propagation': {'alpha': 0.7}, 'n_cores': 4}
+
+
+def test_mutating_to_dict_output_leaves_the_config_alone():
+    config = Config({'propagation': {'alpha': 0.5}, 'sources': ['huri']})
+
+    plain = config.to_dict()
+    plain['propagation']['alpha'] = 0.9
+    plain['sources'].append('string')
+
+    assert config.propagation.alpha == 0.5
+    assert config.to_dict() == {'propagation': {'alpha': 0.5}, 'sources': ['huri']}
+
+
 def test_empty_file_is_rejected(tmp_path):
     """
     yaml.safe_load returns None for an empty file. That used to reach Config
@@ -69,6 +113,20 @@ def test_merge_configs_handles_dot_notation(tmp_path):
     assert merged.n_cores == 8
 
 
+def test_merge_configs_applies_overrides_in_order():
+    base = Config({'propagation': {'alpha': 0.5, 'tolerance': 1e-6}})
+
+    block_then_key = merge_configs(
+        base, {'propagation': {'alpha': 0.1}, 'propagation.tolerance': 1e-3}
+    )
+    key_then_block = merge_configs(
+        base, {'propagation.tolerance': 1e-3, 'propagation': {'alpha': 0.1}}
+    )
+
+    assert block_then_key.propagation.to_dict() == {'alpha': 0.1, 'tolerance': 1e-3}
+    assert key_then_block.propagation.to_dict() == {'alpha': 0.1}
+
+
 def test_default_config_carries_the_visualization_block():
     """
     `scripts/make_figures.py` and `scripts/evaluate.py` read dpi, format and
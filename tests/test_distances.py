@@ -1,9 +1,13 @@
 """Tests for distance and proximity calculations."""
 
 import networkx as nx
+import numpy as np
 
+from syndrumnet.metrics.adjacency import as_csr, clear_csr_cache
 from syndrumnet.metrics.distances import (
+    compute_all_pairwise_distances,
     module_proximity,
+    pairwise_separations,
     separation_score,
     shortest_path_distance,
 )
@@ -57,3 +61,116 @@ def test_separation_score():
     
     # Separated communities should have positive separation
     assert s_ab > 0
+
+
+def test_csr_adjacency_matches_the_graph():
+    """Neighbour slices and degrees of the CSR view agree with NetworkX."""
+    G = nx.karate_club_graph()
+
+    adjacency = as_csr(G)
+
+    for node in G:
+        i = adjacency.node_index[node]
+        neighbours = set(adjacency.nodes[adjacency.neighbors(i)])
+        assert neighbours == set(G[node])
+        assert adjacency.degrees()[i] == G.degree(node)
+
+
+def test_csr_adjacency_is_built_once_per_graph():
+    G = nx.path_graph(4)
+
+    assert as_csr(G) is as_csr(G)
+
+
+def test_genes_outside_the_network_are_dropped():
+    G = nx.Graph([('A', 'B')])
+
+    indices = as_csr(G).indices_of(['B', 'MISSING', 'A'])
+
+    assert list(as_csr(G).nodes[indices]) == ['B', 'A']
+
+
+def test_intra_module_distance_skips_each_gene_itself():
+    """With exclude_self, a path A-B-C gives every gene a nearest other at 1."""
+    G = nx.Graph([('A', 'B'), ('B', 'C')])
+
+    assert shortest_path_distance(G, {'A', 'C'}, {'A', 'C'}, exclude_self=True) == 2.0
+    assert shortest_path_distance(G, {'A', 'B', 'C'}, {'A', 'B', 'C'}, exclude_self=True) == 1.0
+    assert shortest_path_distance(G, {'A'}, {'A'}, exclude_self=True) == 0.0
+
+
+def test_nearest_other_source_matches_brute_force():
+    """One seeded search answers what a search per source would."""
+    G = nx.connected_watts_strogatz_graph(60, 4, 0.1, seed=3)
+    G.add_edge(100, 101)  # a component no source can reach
+    adjacency = as_csr(G)
+    sources = adjacency.indices_of([0, 7, 21, 40, 41, 100])
+
+    expected = []
+    for s in sources:
+        lengths = nx.single_source_shortest_path_length(G, adjacency.nodes[s])
+        expected.append(min(
+            (lengths.get(adjacency.nodes[t], np.inf) for t in sources if t != s),
+        ))
+
+    assert adjacency.nearest_other(sources).tolist() == expected
+
+
+def test_pairwise_distances_cover_connected_pairs_within_the_set():
+    G = nx.Graph([('A', 'B'), ('B', 'C'), ('X', 'Y')])
+
+    distances = compute_all_pairwise_distances(G, {'A', 'C', 'X', 'MISSING'})
+
+    assert distances == {
+        ('A', 'A'): 0, ('C', 'C'): 0, ('X', 'X'): 0,
+        ('A', 'C'): 2, ('C', 'A'): 2,
+    }
+
+
+def test_an_empty_graph_converts_and_has_no_distances():
+    G = nx.Graph()
+
+    assert as_csr(G).n_nodes == 0
+    assert shortest_path_distance(G, {'A'}, {'B'}) == 1000.0
+
+
+def test_distances_are_memoized_until_the_csr_cache_is_cleared():
+    G = nx.path_graph(6)
+
+    assert shortest_path_distance(G, {0}, {2, 5}) == 2.0
+    # Same sets in another order hit the memo
+    assert shortest_path_distance(G, {0}, {5, 2}) == 2.0
+
+    G.add_edge(0, 5)
+    assert shortest_path_distance(G, {0}, {2, 5}) == 2.0
+
+    clear_csr_cache()
+    assert shortest_path_distance(G, {0}, {2, 5}) == 1.0
+
+
+def test_pairwise_separations_match_separation_score():
+    G = nx.karate_club_graph()
+    G.add_node('island')
+    modules = {
+        'a': {0, 1, 2},
+        'b': {30, 31, 32, 33},
+        'c': {2, 3, 'island'},
+        'd': {'absent'},
+    }
+    pairs = [('a', 'b'), ('a', 'c'), ('b', 'c'), ('c', 'd')]
+
+    batch = pairwise_separations(G, modules, pairs)
+
+    for a, b in pairs:
+        assert batch[(a, b)] == separation_score(G, modules[a], modules[b])
+
+
+def test_pairwise_separations_survive_paths_longer_than_a_byte():
+    """Hop counts past 254 widen the stored type instead of wrapping."""
+    G = nx.path_graph(300)
+    modules = {'a': {0, 1}, 'b': {298, 299}}
+
+    batch = pairwise_separations(G, modules, [('a', 'b')])
+
+    assert batch[('a', 'b')] == separation_score(G, modules['a'], modules['b'])
+    assert batch[('a', 'b')] == 296.5
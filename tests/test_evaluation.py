@@ -0,0 +1,184 @@
+"""Tests for evaluation against known synergies."""
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import average_precision_score, roc_auc_score
+
+from syndrumnet.eval.benchmarks import load_known_synergies
+from syndrumnet.eval.metrics import (
+    compute_auc,
+    compute_auc_many,
+    compute_pr,
+    encode_synergies,
+    evaluate_predictions,
+    label_predictions,
+)
+from syndrumnet.eval.reporting import (
+    find_prediction_files,
+    iter_predictions,
+    prediction_file_name,
+    read_predictions,
+)
+from syndrumnet.scoring.predictor import SynergyPredictor
+
+
+def test_rank_auc_matches_sklearn_with_ties():
+    rng = np.random.default_rng(0)
+    y_score = rng.integers(0, 20, size=500).astype(float)
+    labels = rng.integers(0, 2, size=(500, 3))
+    labels[:, 2] = 0
+
+    assert compute_auc(labels[:, 0], y_score) == pytest.approx(
+        roc_auc_score(labels[:, 0], y_score)
+    )
+
+    many = compute_auc_many(labels, y_score)
+    assert many[:2] == pytest.approx(
+        [roc_auc_score(labels[:, k], y_score) for k in range(2)]
+    )
+    assert np.isnan(many[2])
+
+
+def test_average_precision_matches_sklearn_with_ties():
+    rng = np.random.default_rng(1)
+    y_score = rng.integers(0, 10, size=300).astype(float)
+    y_true = rng.integers(0, 2, size=300)
+
+    assert compute_pr(y_true, y_score) == pytest.approx(
+        average_precision_score(y_true, y_score)
+    )
+
+
+def test_labels_ignore_pair_order():
+    """A known pair matches whichever drug the predictor listed first."""
+    predictions = pd.DataFrame({
+        "drug_a": ["imatinib", "dasatinib", "aspirin"],
+        "drug_b": ["nilotinib", "imatinib", "ibuprofen"],
+    })
+    known = {("imatinib", "nilotinib"), ("dasatinib", "imatinib")}
+
+    assert label_predictions(predictions, known).tolist() == [1, 1, 0]
+
+
+def test_no_known_synergies_labels_everything_negative():
+    predictions = pd.DataFrame({"drug_a": ["a", "b"], "drug_b": ["c", "d"]})
+
+    assert label_predictions(predictions, set()).tolist() == [0, 0]
+
+
+def test_labels_from_categorical_chunks_with_a_shared_encoding():
+    """Chunks read as categoricals label the same as plain strings."""
+    known = {("imatinib", "nilotinib")}
+    encoded = encode_synergies(known)
+    chunk = pd.DataFrame({
+        "drug_a": ["nilotinib", "unknown", "imatinib", None],
+        "drug_b": ["imatinib", "nilotinib", "imatinib", "nilotinib"],
+    }).astype("category")
+
+    assert label_predictions(chunk, known, encoded).tolist() == [1, 0, 0, 0]
+
+
+def test_evaluate_predictions_scores_the_labelled_pairs():
+    """Perfectly ranked known pairs give AUC 1, counted in either order."""
+    predictions = pd.DataFrame({
+        "drug_a": ["nilotinib", "dasatinib", "aspirin", "aspirin"],
+        "drug_b": ["imatinib", "imatinib", "ibuprofen", "imatinib"],
+        "prediction_score": [3.0, 2.0, 1.0, 0.0],
+    })
+    known = {("imatinib", "nilotinib"), ("dasatinib", "imatinib"), ("a", "b")}
+
+    metrics = evaluate_predictions(predictions, known)
+
+    assert metrics["auc_roc"] == 1.0
+    assert metrics["n_true_positives"] == 2
+    assert metrics["n_known_synergies"] == 3
+
+
+def test_known_synergies_are_stripped_and_canonically_ordered(tmp_path):
+    path = tmp_path / "synergies.csv"
+    pd.DataFrame({
+        "drug_a": ["nilotinib ", "dasatinib", "imatinib"],
+        "drug_b": [" imatinib", "imatinib", "nilotinib"],
+        "disease": ["CML", "cml", "asthma"],
+    }).to_csv(path, index=False)
+
+    assert load_known_synergies(path, disease_filter="cml") == {
+        ("imatinib", "nilotinib"), ("dasatinib", "imatinib"),
+    }
+
+
+def test_prediction_files_are_found_by_disease(tmp_path):
+    """Only diseases with a file on disk are returned, in config order."""
+    (tmp_path / prediction_file_name("Type 2 Diabetes")).touch()
+    (tmp_path / prediction_file_name("asthma")).touch()
+    (tmp_path / "unrelated.csv").touch()
+
+    found = find_prediction_files(tmp_path, ["asthma", "aml", "Type 2 Diabetes"])
+
+    assert list(found) == ["asthma", "Type 2 Diabetes"]
+    assert found["Type 2 Diabetes"] == tmp_path / "predictions_type_2_diabetes.csv"
+
+
+def test_missing_predictions_directory_finds_nothing(tmp_path):
+    assert find_prediction_files(tmp_path / "absent", ["asthma"]) == {}
+
+
+@pytest.fixture
+def predictions() -> pd.DataFrame:
+    return pd.DataFrame({
+        "drug_a": ["imatinib", "dasatinib", "imatinib"],
+        "drug_b": ["nilotinib", "imatinib", "aspirin"],
+        "prediction_score": [2.5, 1.0, -0.5],
+    })
+
+
+def test_saved_predictions_read_back_from_parquet(tmp_path, predictions):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / prediction_file_name("asthma")
+
+    SynergyPredictor(nx.Graph()).save_predictions(predictions, path)
+
+    assert path.with_suffix(".parquet").exists()
+
+    loaded = read_predictions(path, ["drug_a", "prediction_score", "absent"])
+    assert list(loaded.columns) == ["drug_a", "prediction_score"]
+    assert isinstance(loaded["drug_a"].dtype, pd.CategoricalDtype)
+    assert loaded["prediction_score"].tolist() == [2.5, 1.0, -0.5]
+
+    chunks = list(iter_predictions(path, ["drug_b"], chunk_rows=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert pd.concat(chunks)["drug_b"].astype(str).tolist() == predictions["drug_b"].tolist()
+
+
+def test_a_csv_newer_than_its_parquet_copy_is_read_instead(tmp_path, predictions):
+    """A CSV rewritten outside save_predictions must not be shadowed."""
+    pytest.importorskip("pyarrow")
+    import os
+
+    path = tmp_path / prediction_file_name("asthma")
+    SynergyPredictor(nx.Graph()).save_predictions(predictions, path)
+
+    predictions.assign(prediction_score=[9.0, 8.0, 7.0]).to_csv(path, index=False)
+    parquet_mtime = path.with_suffix(".parquet").stat().st_mtime_ns
+    os.utime(path, ns=(parquet_mtime + 10**9, parquet_mtime + 10**9))
+
+    assert read_predictions(path, ["prediction_score"])["prediction_score"].tolist() == [9.0, 8.0, 7.0]
+    chunks = list(iter_predictions(path, ["prediction_score"], chunk_rows=2))
+    assert pd.concat(chunks)["prediction_score"].tolist() == [9.0, 8.0, 7.0]
+
+
+def test_a_stale_parquet_copy_is_removed_without_pyarrow(tmp_path, predictions, monkeypatch):
+    """The CSV is the source of truth; an outdated copy must not shadow it."""
+    path = tmp_path / prediction_file_name("asthma")
+    path.with_suffix(".parquet").write_bytes(b"stale")
+
+    def no_engine(*args, **kwargs):
+        raise ImportError("pyarrow is not installed")
+
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", no_engine)
+    SynergyPredictor(nx.Graph()).save_predictions(predictions, path)
+
+    assert not path.with_suffix(".parquet").exists()
+    assert read_predictions(path, ["prediction_score"])["prediction_score"].tolist() == [2.5, 1.0, -0.5]
@@ -296,6 +296,20 @@ def test_to_entrez_batches_the_rest(tmp_path, hgnc_file):
     assert instance.mg.n_requests == 1
 
 
+def test_entrez_lookups_survive_a_new_mapper(tmp_path):
+    cache_dir = tmp_path / "cache"
+
+    first = IDMapper(cache_dir=cache_dir)
+    first.mg = FakeMyGene(entrez={'KRAS': 3845})
+    first.to_entrez(['KRAS', 'NOPE'])
+
+    second = IDMapper(cache_dir=cache_dir)
+    second.mg = FakeMyGene(entrez={'KRAS': 3845})
+
+    assert second.to_entrez(['KRAS', 'NOPE']) == [3845, None]
+    assert second.mg.n_requests == 0
+
+
 def test_harmonize_deduplicates_and_preserves_order(mapper):
     result = mapper.harmonize_gene_list(['672', 'ENSG00000141510', 'P38398'])
 
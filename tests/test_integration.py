@@ -8,11 +8,20 @@ handed the wrong argument, seeded inconsistently, or recomputed per pair when
 it only depends on one drug.
 """
 
+import subprocess
+import sys
+
 import networkx as nx
+import pandas as pd
 import pytest
 
 from syndrumnet.metrics.distances import separation_score, shortest_path_distance
-from syndrumnet.scoring.pqab import compute_pqab, compute_pqab_batch, proximity_zscore
+from syndrumnet.scoring.pqab import (
+    compute_pqab,
+    compute_pqab_batch,
+    compute_pqab_batch_cached,
+    proximity_zscore,
+)
 from syndrumnet.scoring.predictor import SynergyPredictor
 from syndrumnet.scoring.tqab import (
     COMPLEMENTARY_EXPOSURE_SCORE,
@@ -154,6 +163,78 @@ def test_batch_matches_single_pair(network, disease_module, drug_modules):
         assert batch[(drug_a, drug_b)] == pytest.approx(direct, abs=1e-12)
 
 
+def test_shared_null_batch_agrees_on_ordering(network, disease_module, drug_modules):
+    """
+    The shared-null batch draws different samples from the same null, so its
+    scores are not identical to the per-drug batch; they must still cover
+    the same pairs and rank FAR behind LEFT.
+    """
+    module_sets = {
+        name: sig["up"] | sig["down"] for name, sig in drug_modules.items()
+    }
+    names = sorted(module_sets)
+    pairs = [(a, b) for i, a in enumerate(names) for b in names[i + 1:]]
+
+    cached = compute_pqab_batch_cached(
+        network, disease_module, module_sets, pairs, N_RANDOMIZATIONS, SEED
+    )
+
+    assert set(cached) == set(pairs)
+    z = {}
+    for (drug_a, drug_b), (_, z_a, z_b) in cached.items():
+        z[drug_a], z[drug_b] = z_a, z_b
+    assert z["far"] > z["left"]
+
+
+def test_shared_null_predictor_scores_every_pair(predictor, predictions):
+    """
+    The opt-in shared nulls change the z-scores' samples, not which pairs are
+    scored or which drug sits further from the disease.
+    """
+    predictor.shared_null = True
+
+    shared = predictor.predict_all("synth")
+
+    assert len(shared) == len(predictions)
+    assert not shared.isna().to_numpy().any()
+    pqa = dict(zip(shared.drug_a, shared.pqa))
+    pqa.update(zip(shared.drug_b, shared.pqb))
+    assert pqa["far"] > pqa["left"]
+
+
+def test_sharded_pair_sweep_matches_serial(predictor, predictions):
+    """Splitting the pairs across worker processes must not change a score."""
+    predictor.n_workers = 2
+
+    sharded = predictor.predict_all("synth")
+
+    pd.testing.assert_frame_equal(sharded, predictions)
+
+
+def test_sharded_pair_sweep_exits_cleanly_with_numba():
+    """
+    The pair workers are forked. A numba kernel that starts its own thread
+    pool left the sharded sweep passing but the interpreter hung at exit, so
+    the sweep runs in a child process that must finish in time.
+    """
+    pytest.importorskip("numba")
+    from syndrumnet.metrics import distances
+
+    assert distances._mean_hops_kernel is not None
+
+    result = subprocess.run(
+        [
+            sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+            f"{__file__}::test_sharded_pair_sweep_matches_serial",
+        ],
+        capture_output=True,
+        text=True,
+        timeout=600,
+    )
+
+    assert result.returncode == 0, result.stdout[-2000:]
+
+
 def test_each_drug_has_one_proximity_score(predictions):
     """A drug's z-score is identical in every row it appears in."""
     per_drug = {}
@@ -349,3 +430,15 @@ def test_disconnected_network_does_not_produce_infinities(
     distance = shortest_path_distance(G, {"LEFT1", "LEFT2"}, disease_module)
 
     assert distance == 1000.0
+
+
+def test_separations_are_reused_across_diseases(predictor, disease_module, predictions):
+    """s_AB does not involve the disease, so a second disease reuses it."""
+    n_cached = len(predictor._separations)
+    assert n_cached == len(predictions)
+
+    predictor.set_disease_modules({"synth": disease_module, "again": disease_module})
+    again = predictor.predict_all("again")
+
+    assert len(predictor._separations) == n_cached
+    assert again.tqab.tolist() == predictions.tqab.tolist()
@@ -0,0 +1,93 @@
+"""Tests for module persistence."""
+
+import networkx as nx
+import pandas as pd
+
+from syndrumnet.data.modules import ModuleBuilder
+from syndrumnet.io.id_mapping import IDMapper
+
+
+def test_load_modules_groups_genes_by_module(tmp_path):
+    """Every row lands in its own module, and duplicates collapse."""
+    path = tmp_path / "modules.csv"
+    pd.DataFrame({
+        "module": ["asthma", "aml", "asthma", "asthma", "aml"],
+        "gene": ["IL4", "FLT3", "IL13", "IL4", "NPM1"],
+    }).to_csv(path, index=False)
+
+    modules = ModuleBuilder.load_modules(path)
+
+    assert modules == {"asthma": {"IL4", "IL13"}, "aml": {"FLT3", "NPM1"}}
+
+
+class CountingMyGene:
+    """Stand-in for `mygene.MyGeneInfo` that maps every ID to itself."""
+
+    def __init__(self, missing=()):
+        self.calls = []
+        self.missing = set(missing)
+
+    def querymany(self, queries, **kwargs):
+        self.calls.append(list(queries))
+        return [
+            {"query": query, "notfound": True}
+            if query in self.missing
+            else {"query": query, "symbol": query}
+            for query in queries
+        ]
+
+
+def test_disease_modules_resolve_all_genes_in_one_request(tmp_path):
+    """
+    Harmonizing disease by disease on a cold cache used to cost one lookup
+    per disease. The union is resolved up front instead.
+    """
+    creeds = tmp_path / "creeds.txt"
+    pd.DataFrame({
+        "disease_name": ["asthma", "asthma", "aml", "aml"],
+        "direction": ["up", "down", "up", "down"],
+        "gene_symbol": ["IL4", "IL13", "FLT3", "IL4"],
+    }).to_csv(creeds, sep="\t", index=False)
+
+    network = nx.path_graph(["IL4", "IL13", "FLT3"])
+    mapper = IDMapper(cache_dir=tmp_path / "cache", use_disk_cache=False)
+    mapper.mg = CountingMyGene()
+
+    modules = ModuleBuilder(network, mapper).build_disease_modules(creeds)
+
+    assert modules == {"asthma": {"IL4", "IL13"}, "aml": {"FLT3", "IL4"}}
+    assert len(mapper.mg.calls) == 1
+
+
+def test_genes_off_the_network_never_reach_a_module(tmp_path, caplog):
+    """Unmapped and off-network identifiers are dropped once, up front."""
+    creeds = tmp_path / "creeds.txt"
+    pd.DataFrame({
+        "disease_name": ["asthma", "asthma", "asthma"],
+        "direction": ["up", "up", "down"],
+        "gene_symbol": ["IL4", "OFFNET", "UNMAPPED"],
+    }).to_csv(creeds, sep="\t", index=False)
+
+    mapper = IDMapper(cache_dir=tmp_path / "cache", use_disk_cache=False)
+    mapper.mg = CountingMyGene(missing={"UNMAPPED"})
+    builder = ModuleBuilder(nx.path_graph(["IL4", "IL13"]), mapper)
+
+    with caplog.at_level("WARNING"):
+        modules = builder.build_disease_modules(creeds)
+
+    assert modules == {"asthma": {"IL4"}}
+    assert "Could not map 1/3 genes" in caplog.text
+
+
+def test_saved_modules_load_back_unchanged(tmp_path):
+    path = tmp_path / "modules.csv"
+    modules = {"asthma": {"IL4", "IL13"}, "aml": {"FLT3"}, "empty": set()}
+    builder = ModuleBuilder(
+        nx.Graph(), IDMapper(cache_dir=tmp_path / "cache", use_disk_cache=False)
+    )
+
+    builder.save_modules(modules, path)
+
+    assert ModuleBuilder.load_modules(path) == {
+        "asthma": {"IL4", "IL13"}, "aml": {"FLT3"},
+    }
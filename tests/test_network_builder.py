@@ -0,0 +1,198 @@
+"""Tests for integrated network construction and persistence."""
+
+import networkx as nx
+import pandas as pd
+import pytest
+
+from syndrumnet.data.network_builder import NetworkBuilder
+from syndrumnet.io.id_mapping import IDMapper
+from syndrumnet.metrics.adjacency import CSRAdjacency, as_csr
+
+
+@pytest.fixture
+def builder(tmp_path) -> NetworkBuilder:
+    """A builder whose mapper never leaves the machine."""
+    return NetworkBuilder(IDMapper(cache_dir=tmp_path / "cache", use_disk_cache=False))
+
+
+def test_parquet_round_trip_keeps_edges_and_attributes(builder, tmp_path):
+    """The fast format must reload the same graph, list attributes included."""
+    pytest.importorskip("pyarrow")
+
+    G = nx.Graph()
+    G.add_edge("TP53", "MDM2", sources=["HuRI", "CORUM"], interaction_type="PPI")
+    G.add_edge("MDM2", "CDKN1A", sources=["HuRI"], interaction_type="complex")
+    builder.network = G
+
+    path = tmp_path / "network.parquet"
+    builder.save(path)
+    loaded = NetworkBuilder.load(path)
+
+    assert nx.utils.edges_equal(loaded.edges(), G.edges())
+    assert loaded["TP53"]["MDM2"]["sources"] == ["HuRI", "CORUM"]
+    assert loaded["MDM2"]["CDKN1A"]["interaction_type"] == "complex"
+
+
+def test_pickle_round_trip_keeps_isolated_nodes(builder, tmp_path):
+    G = nx.Graph()
+    G.add_edge("TP53", "MDM2", sources=["HuRI", "CORUM"], interaction_type="PPI")
+    G.add_node("BRCA1")
+    builder.network = G
+
+    path = tmp_path / "network.pkl"
+    builder.save(path)
+    loaded = NetworkBuilder.load(path)
+
+    assert nx.utils.graphs_equal(loaded, G)
+
+
+def test_graphml_is_streamed_into_the_same_graph_networkx_reads(tmp_path):
+    """The streaming reader must agree with nx.read_graphml, attributes and all."""
+    G = nx.Graph(name="interactome")
+    G.add_edge("TP53", "MDM2", interaction_type="PPI", confidence=0.9)
+    G.add_edge("MDM2", "CDKN1A", interaction_type="complex", confidence=0.4)
+    G.add_node("ISOLATED", essential=True)
+
+    path = tmp_path / "network.graphml"
+    nx.write_graphml(G, path)
+
+    loaded = NetworkBuilder.load(path)
+    expected = nx.read_graphml(path)
+
+    assert nx.utils.graphs_equal(loaded, expected)
+    assert loaded.graph == expected.graph
+    assert loaded["TP53"]["MDM2"]["confidence"] == 0.9
+    assert loaded.nodes["ISOLATED"]["essential"] is True
+
+
+def test_build_merges_both_orientations_of_a_pair(builder):
+    """A-B and B-A are one edge listing every source; self-loops are dropped."""
+    builder.id_mapper.to_hgnc = lambda ids: list(ids)
+    builder.add_interactions("huri", pd.DataFrame({
+        "protein_a": ["TP53", "MDM2", "TP53"],
+        "protein_b": ["MDM2", "TP53", "TP53"],
+        "source": ["HuRI", "HuRI", "HuRI"],
+        "interaction_type": ["PPI", "PPI", "PPI"],
+    }))
+    builder.add_interactions("corum", pd.DataFrame({
+        "protein_a": ["MDM2", "MDM2"],
+        "protein_b": ["TP53", "CDKN1A"],
+        "source": ["CORUM", "CORUM"],
+        "interaction_type": ["complex", "complex"],
+    }))
+
+    G = builder.build()
+
+    assert list(G.nodes) == ["TP53", "MDM2", "CDKN1A"]
+    assert G.number_of_edges() == 2
+    assert G["TP53"]["MDM2"] == {
+        "sources": ["HuRI", "HuRI", "CORUM"], "interaction_type": "PPI",
+    }
+    assert G["MDM2"]["CDKN1A"]["sources"] == ["CORUM"]
+
+
+def test_build_keeps_only_the_largest_component(builder):
+    builder.id_mapper.to_hgnc = lambda ids: list(ids)
+    builder.add_interactions("huri", pd.DataFrame({
+        "protein_a": ["X1", "TP53", "MDM2", "X2"],
+        "protein_b": ["X2", "MDM2", "CDKN1A", "X1"],
+        "source": "HuRI",
+    }))
+
+    G = builder.build()
+
+    assert list(G.nodes) == ["TP53", "MDM2", "CDKN1A"]
+    assert G["TP53"]["MDM2"]["interaction_type"] == "PPI"
+
+
+def test_build_exposes_the_csr_adjacency_of_the_graph(builder):
+    builder.id_mapper.to_hgnc = lambda ids: list(ids)
+    builder.add_interactions("huri", pd.DataFrame({
+        "protein_a": ["X1", "TP53", "MDM2", "CDKN1A", "BRCA1"],
+        "protein_b": ["X2", "MDM2", "CDKN1A", "TP53", "TP53"],
+        "source": "HuRI",
+    }))
+
+    G = builder.build()
+    expected = CSRAdjacency(G)
+
+    assert as_csr(G) is builder.csr
+    assert builder.csr.nodes.tolist() == expected.nodes.tolist()
+    assert (builder.csr.matrix != expected.matrix).nnz == 0
+
+
+def test_network_stats_skip_expensive_metrics_by_default(builder):
+    builder.network = nx.path_graph(5)
+
+    stats = builder.get_network_stats()
+
+    assert stats["avg_degree"] == pytest.approx(8 / 5)
+    assert stats["density"] == pytest.approx(nx.density(builder.network))
+    assert stats["diameter"] is None
+    assert stats["avg_clustering"] is None
+
+
+def test_expensive_network_stats_match_networkx(builder):
+    G = nx.relabel_nodes(nx.barabasi_albert_graph(200, 3, seed=1), str)
+    builder.network = G
+
+    stats = builder.get_network_stats(expensive=True)
+
+    assert stats["avg_clustering"] == pytest.approx(nx.average_clustering(G))
+    assert stats["diameter"] <= nx.diameter(G)
+
+    # Double sweep is exact on trees
+    builder.network = nx.random_labeled_tree(50, seed=2)
+    assert builder.get_network_stats(expensive=True)["diameter"] == nx.diameter(
+        builder.network
+    )
+
+
+def test_build_reuses_the_cached_network_until_a_source_changes(tmp_path, monkeypatch):
+    import syndrumnet.data.network_builder as network_builder
+
+    huri = tmp_path / "huri.tsv"
+    huri.write_text("Symbol A\tSymbol B\nTP53\tMDM2\nMDM2\tCDKN1A\n")
+
+    calls = []
+    parsed = []
+    real_parse = network_builder.parse_huri
+
+    def parse_huri(filepath, **kwargs):
+        parsed.append(filepath)
+        return real_parse(filepath, **kwargs)
+
+    monkeypatch.setattr(network_builder, "parse_huri", parse_huri)
+
+    def to_hgnc(ids):
+        calls.append(len(ids))
+        return list(ids)
+
+    def build():
+        mapper = IDMapper(cache_dir=tmp_path / "cache", use_disk_cache=False)
+        mapper.to_hgnc = to_hgnc
+        builder = NetworkBuilder(mapper, cache_dir=tmp_path / "networks")
+        builder.add_source("huri", huri)
+        return builder.build()
+
+    G = build()
+    cached = build()
+
+    # A hit neither parses the source nor maps its identifiers
+    assert len(parsed) == 1
+    assert len(calls) == 1
+    assert nx.utils.graphs_equal(cached, G)
+
+    huri.write_text("Symbol A\tSymbol B\nTP53\tMDM2\n")
+    assert build().number_of_edges() == 1
+    assert len(parsed) == 2
+    assert len(calls) == 2
+
+
+def test_network_stats_count_components(builder):
+    G = nx.path_graph(4)
+    G.add_edge(10, 11)
+    G.add_node(20)
+    builder.network = G
+
+    assert builder.get_network_stats()["n_components"] == 3
@@ -1,8 +1,13 @@
 """Tests for null model randomization."""
 
 import networkx as nx
+import numpy as np
 
+from syndrumnet.metrics.distances import shortest_path_distance
 from syndrumnet.metrics.null_models import (
+    _build_degree_bins,
+    _get_bin,
+    compute_normalized_proximity,
     compute_zscore,
     degree_preserving_randomization,
 )
@@ -20,6 +25,45 @@ def test_degree_preserving_randomization():
     assert all(len(rm) == len(module) for rm in random_modules)
 
 
+def test_random_genes_come_from_the_module_genes_degree_bins():
+    G = nx.barabasi_albert_graph(300, 2, seed=1)
+    degrees = dict(G.degree())
+    _, bin_edges = _build_degree_bins(degrees)
+    module = {0, 5, 17, 100, 250}
+
+    expected_bins = sorted(_get_bin(degrees[g], bin_edges) for g in module)
+
+    for random_module in degree_preserving_randomization(G, module, n_random=50, seed=3):
+        drawn_bins = sorted(_get_bin(degrees[g], bin_edges) for g in random_module)
+        # Two draws can land on the same gene, which the set collapses
+        assert set(drawn_bins) <= set(expected_bins)
+        assert len(drawn_bins) <= len(expected_bins)
+
+
+def test_randomization_is_reproducible_with_a_seed():
+    G = nx.barabasi_albert_graph(100, 2, seed=1)
+    module = {3, 30, 60}
+
+    first = degree_preserving_randomization(G, module, n_random=20, seed=7)
+    second = degree_preserving_randomization(G, set(sorted(module, reverse=True)), n_random=20, seed=7)
+
+    assert first == second
+
+
+def test_unseeded_randomization_follows_set_random_seed():
+    from syndrumnet.utils.seeds import set_random_seed
+
+    G = nx.barabasi_albert_graph(100, 2, seed=1)
+    module = {3, 30, 60}
+
+    set_random_seed(11)
+    first = degree_preserving_randomization(G, module, n_random=20)
+    set_random_seed(11)
+    second = degree_preserving_randomization(G, module, n_random=20)
+
+    assert first == second
+
+
 def test_compute_zscore():
     """Test z-score computation."""
     observed = 5.0
@@ -29,3 +73,35 @@ def test_compute_zscore():
     
     # Observed is lower than null mean
     assert z < 0
+
+
+def test_normalized_proximity_matches_per_module_distances():
+    # Two components, so some random modules are unreachable from the disease
+    G = nx.disjoint_union(
+        nx.barabasi_albert_graph(150, 2, seed=4), nx.path_graph(10)
+    )
+    disease, drug = {1, 8, 40, 151}, {2, 70, 155}
+
+    observed, z, p_value = compute_normalized_proximity(G, disease, drug, n_random=40, seed=9)
+
+    null = [
+        shortest_path_distance(G, disease, random_module)
+        for random_module in degree_preserving_randomization(G, drug, n_random=40, seed=9)
+    ]
+    assert observed == shortest_path_distance(G, disease, drug)
+    assert z == compute_zscore(observed, null)
+    assert p_value == np.mean([value <= observed for value in null])
+
+
+def test_null_distances_follow_the_disease_module_between_calls():
+    G = nx.barabasi_albert_graph(120, 2, seed=5)
+    drug = {3, 50, 90}
+
+    for disease in ({1, 2, 60}, {70, 110}, {1, 2, 60}):
+        _, _, p_value = compute_normalized_proximity(G, disease, drug, n_random=30, seed=2)
+        null = [
+            shortest_path_distance(G, disease, random_module)
+            for random_module in degree_preserving_randomization(G, drug, n_random=30, seed=2)
+        ]
+        observed = shortest_path_distance(G, disease, drug)
+        assert p_value == np.mean([value <= observed for value in null])
@@ -1,5 +1,5 @@
 """
-Tests for `parse_lincs`, the metadata join.
+Tests for `parse_lincs`, the metadata join, `parse_creeds` and `parse_corum`.
 
 The signature matrix is built so the right answer is arithmetic rather than
 whatever the code prints: two cell lines per compound with known fold changes,
@@ -10,7 +10,7 @@ numbers by hand.
 import pandas as pd
 import pytest
 
-from syndrumnet.io.parsers import parse_lincs
+from syndrumnet.io.parsers import parse_corum, parse_creeds, parse_lincs
 
 GENES = [f"G{i}" for i in range(10)]
 
@@ -261,7 +261,53 @@ def test_a_small_matrix_still_yields_a_usable_module(tmp_path):
     assert signatures['imatinib']['down'] == ['G0']
 
 
+def test_tied_and_missing_fold_changes_select_like_nlargest(tmp_path):
+    sig_path = tmp_path / "sigs.tsv"
+    meta_path = tmp_path / "meta.tsv"
+
+    column = [1.0, 3.0, None, 3.0, -2.0, 1.0, -2.0, 3.0, 0.0, -2.0]
+    write_signatures(sig_path, {'S1': column})
+    write_metadata(meta_path, [('S1', 'imatinib')])
+
+    signatures = parse_lincs(sig_path, meta_path, top_pct=0.25)
+
+    fold_changes = pd.Series(column, index=GENES).dropna()
+    assert signatures['imatinib']['up'] == fold_changes.nlargest(2).index.tolist()
+    assert signatures['imatinib']['down'] == fold_changes.nsmallest(2).index.tolist()
+
+
 @pytest.mark.parametrize("top_pct", [0.0, -0.1, 1.5])
 def test_an_out_of_range_top_pct_is_rejected(lincs, top_pct):
     with pytest.raises(ValueError, match="top_pct"):
         parse_lincs(*lincs, top_pct=top_pct)
+
+
+def test_corum_expands_each_human_complex_into_its_pairs(tmp_path):
+    path = tmp_path / "allComplexes.txt"
+    pd.DataFrame({
+        'ComplexID': [1, 2, 3, 4],
+        'Organism': ['Human', 'Mouse', 'Human', 'Human'],
+        'subunits(Gene name)': ['A;B;C', 'X;Y', 'D', ' E ; F;;'],
+    }).to_csv(path, sep='\t', index=False)
+
+    result = parse_corum(path)
+
+    assert list(zip(result['protein_a'], result['protein_b'], result['complex_id'])) == [
+        ('A', 'B', 1), ('A', 'C', 1), ('B', 'C', 1), ('E', 'F', 4),
+    ]
+    assert set(result['source']) == {'CORUM'}
+    assert set(result['interaction_type']) == {'complex'}
+
+
+def test_creeds_groups_genes_by_disease_and_direction(tmp_path):
+    path = tmp_path / "creeds.tsv"
+    pd.DataFrame({
+        'disease_name': ['asthma', 'aml', 'asthma', 'asthma', 'aml'],
+        'direction': ['up', 'down', 'down', 'up', 'down'],
+        'gene_symbol': ['IL4', 'FLT3', 'CDH1', 'IL13', 'NPM1'],
+    }).to_csv(path, sep='\t', index=False)
+
+    assert parse_creeds(path) == {
+        'asthma': {'up': ['IL4', 'IL13'], 'down': ['CDH1']},
+        'aml': {'up': [], 'down': ['FLT3', 'NPM1']},
+    }
@@ -145,6 +145,25 @@ def test_roc_and_pr_curves_write_files(tmp_path):
     assert (tmp_path / "pr.png").exists()
 
 
+def test_a_figure_newer_than_its_source_is_not_redrawn(tmp_path):
+    import os
+
+    source = tmp_path / "predictions.csv"
+    source.write_text("")
+    output = tmp_path / "roc.png"
+    output.write_bytes(b"stale")
+    os.utime(source, (1_000, 1_000))
+
+    plot_roc_curve([0, 1], [0, 1], 0.5, output, source_path=source)
+    assert output.read_bytes() == b"stale"
+
+    os.utime(source, None)
+    os.utime(output, (1_000, 1_000))
+
+    plot_roc_curve([0, 1], [0, 1], 0.5, output, source_path=source)
+    assert output.read_bytes() != b"stale"
+
+
 # --------------------------------------------------------------------------
 # Degree distribution
 # --------------------------------------------------------------------------
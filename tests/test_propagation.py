@@ -1,6 +1,8 @@
 """Tests for PRINCE propagation."""
 
 import networkx as nx
+import numpy as np
+import pytest
 
 from syndrumnet.propagation.prince import PRINCE
 
@@ -31,4 +33,80 @@ def test_prince_seed_weights():
     scores = prince.propagate(seed_nodes, seed_weights)
     
     # Node 0 should have higher score than node 4
-    assert scores[0] > scores[4]
\ No newline at end of file
+    assert scores[0] > scores[4]
+
+
+def test_batch_propagation_matches_one_module_at_a_time():
+    """Modules converge at different iterations; each must stop at its own."""
+    G = nx.karate_club_graph()
+
+    prince = PRINCE(G, alpha=0.7, tolerance=1e-8, max_iterations=200)
+
+    modules = {'hub': {0, 33}, 'leaf': {11}, 'spread': {5, 16, 24, 26}, 'absent': {'X'}}
+    batch = prince.propagate_batch(modules)
+
+    assert list(batch) == list(modules)
+    for name, seeds in modules.items():
+        assert batch[name] == prince.propagate(seeds)
+
+
+@pytest.mark.parametrize("normalize", ['column', 'row', 'symmetric'])
+def test_krylov_solver_reaches_the_power_iteration_fixed_point(normalize):
+    G = nx.karate_club_graph()
+    seeds = {0, 5, 33}
+
+    power = PRINCE(G, alpha=0.9, tolerance=1e-12, normalize=normalize).propagate(seeds)
+    krylov = PRINCE(
+        G, alpha=0.9, tolerance=1e-12, normalize=normalize, solver='krylov'
+    ).propagate(seeds)
+
+    assert krylov == pytest.approx(power, abs=1e-9)
+
+
+def test_unknown_solver_is_rejected():
+    with pytest.raises(ValueError, match="solver"):
+        PRINCE(nx.path_graph(3), solver='jacobi')
+
+
+def test_symmetric_operator_matches_explicit_normalization():
+    G = nx.karate_club_graph()
+    prince = PRINCE(G, normalize='symmetric')
+
+    A = nx.adjacency_matrix(G, nodelist=prince.nodes).toarray()
+    d = A.sum(axis=1) ** -0.5
+    W = d[:, None] * A * d[None, :]
+
+    X = np.random.default_rng(0).random((G.number_of_nodes(), 3))
+    assert prince.W @ X == pytest.approx(W @ X)
+    assert prince.W @ X[:, 0] == pytest.approx(W @ X[:, 0])
+
+
+def test_scores_follow_network_order_after_reordering():
+    """The matrix is RCM-reordered internally; results are not."""
+    G = nx.relabel_nodes(nx.path_graph(8), {i: (i * 5) % 8 for i in range(8)})
+    prince = PRINCE(G, alpha=0.5)
+
+    scores = prince.propagate({0})
+
+    assert list(scores) == list(G.nodes())
+    assert scores[0] == max(scores.values())
+    assert scores[5] > scores[2] > scores[3]
+
+
+def test_float32_propagation_ranks_like_float64():
+    G = nx.karate_club_graph()
+    seeds = {0, 5, 33}
+
+    double = PRINCE(G, alpha=0.7).propagate(seeds)
+    single = PRINCE(G, alpha=0.7, dtype='float32').propagate(seeds)
+
+    assert all(isinstance(score, np.float32) for score in single.values())
+    assert single == pytest.approx(double, abs=1e-5)
+
+
+@pytest.mark.parametrize("normalize, axis", [('column', 0), ('row', 1)])
+def test_in_place_normalization_sums_to_one(normalize, axis):
+    G = nx.karate_club_graph()
+    prince = PRINCE(G, normalize=normalize)
+
+    assert np.asarray(prince.W.sum(axis=axis)).ravel() == pytest.approx(1.0)
@@ -1,13 +1,23 @@
 """Tests for scoring functions."""
 
+import networkx as nx
 import pytest
+from scipy.stats import spearmanr
 
+from syndrumnet.metrics.transcription import (
+    compute_correlation,
+    signature_to_series,
+    transcriptional_similarity,
+    transcriptional_similarity_batch,
+)
 from syndrumnet.scoring.cqab import compute_cqab
 from syndrumnet.scoring.tqab import (
     COMPLEMENTARY_EXPOSURE_SCORE,
     TopologyClass,
     classify_topology,
+    classify_topology_batch,
     compute_tqab,
+    compute_tqab_batch,
 )
 
 # The six classes of Cheng et al. (2019), Figure 2, as (z_QA, z_QB, s_AB)
@@ -35,6 +45,14 @@ def test_classification_is_symmetric_in_the_drug_pair(z_qa, z_qb, s_ab, expected
     assert classify_topology(z_qb, z_qa, s_ab) == expected
 
 
+def test_batch_classification_matches_the_table():
+    """The vectorized classifier agrees with the scalar one, boundary included."""
+    rows = CLASS_TABLE + [(-1.0, -1.0, 0.0, TopologyClass.COMPLEMENTARY_EXPOSURE)]
+    z_qa, z_qb, s_ab, expected = zip(*rows)
+
+    assert classify_topology_batch(z_qa, z_qb, s_ab).tolist() == list(expected)
+
+
 def test_only_complementary_exposure_scores():
     """
     T_QAB is binary: 2 for Complementary Exposure, 0 for everything else.
@@ -85,3 +103,80 @@ def test_cqab_inverse_correlation():
     # Drug A should have positive correlation (reverses disease)
     # Drug B should have negative correlation (same as disease)
     assert cqa > cqb
+
+
+def test_correlation_accepts_dicts_and_series_alike():
+    disease_sig = {'G1': 2.0, 'G2': 1.5, 'G3': -1.0, 'G4': 0.5, 'G5': -2.0}
+    drug_sig = {'G5': 1.0, 'G2': -1.0, 'G9': 1.0, 'G1': -1.0, 'G4': 1.0}
+
+    from_dicts = compute_correlation(disease_sig, drug_sig)
+    from_series = compute_correlation(signature_to_series(disease_sig), drug_sig)
+
+    common = ['G1', 'G2', 'G4', 'G5']
+    expected, _ = spearmanr(
+        [disease_sig[g] for g in common], [drug_sig[g] for g in common]
+    )
+    assert from_dicts == pytest.approx(expected)
+    assert from_series == pytest.approx(expected)
+
+
+def test_batch_similarity_matches_the_per_drug_score():
+    disease_sig = {'G1': 2.0, 'G2': 1.5, 'G3': -1.0, 'G4': 1.5, 'G5': -2.0, 'G6': 0.0}
+    drugs = {
+        'reverser': {'up': {'G3', 'G5'}, 'down': {'G1', 'G2', 'X'}},
+        'mimic': {'up': {'G1', 'G4'}, 'down': {'G5', 'G6'}},
+        'overlap': {'up': {'G1', 'G2', 'G6'}, 'down': {'G2', 'G3'}},
+        'one_sided': {'up': {'G1', 'G2', 'G3'}, 'down': set()},
+        'too_few': {'up': {'G1'}, 'down': {'Y'}},
+    }
+
+    batch = transcriptional_similarity_batch(disease_sig, drugs)
+
+    assert list(batch) == list(drugs)
+    for drug, sig in drugs.items():
+        assert batch[drug] == pytest.approx(
+            transcriptional_similarity(disease_sig, sig['up'], sig['down'])
+        )
+
+
+def test_tqab_batch_computes_each_unordered_pair_once(monkeypatch):
+    """s_AB is symmetric; a reversed pair reuses the forward one."""
+    import syndrumnet.scoring.tqab as tqab
+
+    G = nx.path_graph(6)
+    modules = {'a': {0, 1}, 'b': {4, 5}}
+    zscores = {'a': -2.0, 'b': -2.0}
+
+    seen = []
+    real = tqab.pairwise_separations
+
+    def spy(G, modules, pairs):
+        seen.extend(pairs)
+        return real(G, modules, pairs)
+
+    monkeypatch.setattr(tqab, 'pairwise_separations', spy)
+
+    results = compute_tqab_batch(
+        G, set(), modules, [('a', 'b'), ('b', 'a')], proximity_zscores=zscores
+    )
+
+    assert seen == [('a', 'b')]
+    assert results[('a', 'b')] == results[('b', 'a')]
+
+
+def test_tqab_batch_skips_the_null_model_for_unreachable_drugs(monkeypatch):
+    """A drug outside every component of the disease is never near it."""
+    import syndrumnet.scoring.tqab as tqab
+
+    G = nx.union(nx.path_graph(4), nx.path_graph([10, 11, 12]))
+    modules = {'a': {0}, 'b': {11}}
+
+    called = []
+    monkeypatch.setattr(
+        tqab, 'proximity_zscore', lambda G, q, drug, *args: called.append(drug) or -1.0
+    )
+
+    results = compute_tqab_batch(G, {1, 2}, modules, [('a', 'b')])
+
+    assert called == [{0}]
+    assert results[('a', 'b')] == (0.0, TopologyClass.SINGLE_EXPOSURE)
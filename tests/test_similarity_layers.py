@@ -191,6 +191,16 @@ def test_unknown_method_always_raises(modules):
         compute_disease_similarity(modules, method='not_a_metric')
 
 
+def test_registered_metric_without_a_vectorised_branch_raises(monkeypatch):
+    """A new set metric must not silently fall back to another's formula."""
+    from syndrumnet.propagation import similarity_layers
+
+    monkeypatch.setitem(similarity_layers._SET_METRICS, 'dice', jaccard_similarity)
+
+    with pytest.raises(ValueError, match="no vectorised"):
+        compute_disease_similarity({"a": {"G1"}, "b": {"G2"}}, method='dice')
+
+
 def test_drug_similarity_uses_tanimoto(reference_matrix):
     fingerprints = {name: BITS[i] for i, name in enumerate("abc")}
 